@@ -2,9 +2,9 @@
 
 namespace Drupal\vector_sync\Form;
 
+use Drupal\Core\Entity\Query\QueryInterface;
 use Drupal\Core\Form\FormBase;
 use Drupal\Core\Form\FormStateInterface;
-use Drupal\node\Entity\Node;
 
 class SendContextForm extends FormBase {
 
@@ -14,7 +14,7 @@ public function getFormId() {
 
   public function buildForm(array $form, FormStateInterface $form_state) {
     $form['description'] = [
-      '#markup' => '<p>Send published Context nodes in batches to the configured endpoint.</p>',
+      '#markup' => '<p>Send new or changed published Context nodes in batches to the configured endpoint.</p>',
     ];
 
     $form['batch_size'] = [
@@ -35,35 +35,68 @@ public function buildForm(array $form, FormStateInterface $form_state) {
 
   public function submitForm(array &$form, FormStateInterface $form_state) {
     $batch_size = (int) $form_state->getValue('batch_size');
+    $config = $this->config('vector_sync.settings');
+    $base_url = rtrim($config->get('endpoint_url'), '/');
+    $headers = [
+      'Content-Type' => 'application/json',
+      'X-Api-Key' => $config->get('api_key'),
+    ];
 
-    $nids = \Drupal::entityQuery('node')
-      ->condition('type', 'context')
-      ->condition('status', 1)
-      ->sort('changed', 'DESC')
-      ->range(0, $batch_size)
-      ->accessCheck(TRUE)
-      ->execute();
-
-    if (empty($nids)) {
+    if (!$this->publishedContextQuery()->count()->execute()) {
       $this->messenger()->addWarning($this->t('No published Context nodes found.'));
       return;
     }
 
-    $nodes = Node::loadMultiple($nids);
-    $items = [];
-
-    foreach ($nodes as $node) {
-      $items[] = [
-        'uuid' => $node->uuid(),
-        'title' => $node->label(),
-        'text' => $node->get('field_description')->value ?? '',
-        'tags' => array_map(fn($t) => $t->label(), $node->get('field_tags')->referencedEntities()),
-        'agents' => array_map(fn($t) => $t->label(), $node->get('field_agents')->referencedEntities()),
-        'changed' => (int) $node->getChangedTime(),
-      ];
+    try {
+      $manifest = $this->fetchManifest($base_url, $headers);
+    }
+    catch (\Throwable $e) {
+      $this->messenger()->addError($this->t('Manifest fetch failed: @msg', ['@msg' => $e->getMessage()]));
+      return;
     }
 
-    $config = $this->config('vector_sync.settings');
+    // Tombstones for stored items that are no longer published.
+    $items = [];
+    $published = $this->publishedUuids(array_keys($manifest));
+    foreach (array_diff_key($manifest, $published) as $uuid => $entry) {
+      $items[] = ['uuid' => $uuid, 'deleted' => TRUE];
+    }
+    $tombstones = count($items);
+
+    // Page through nodes so large sites never hold every Context node in memory.
+    $storage = \Drupal::entityTypeManager()->getStorage('node');
+    $offset = 0;
+    do {
+      $nids = $this->publishedContextQuery()
+        ->sort('changed', 'DESC')
+        ->sort('nid', 'DESC')
+        ->range($offset, $batch_size)
+        ->execute();
+      $offset += $batch_size;
+
+      foreach ($storage->loadMultiple($nids) as $node) {
+        $item = [
+          'uuid' => $node->uuid(),
+          'title' => $node->label(),
+          'text' => $node->get('field_description')->value ?? '',
+          'tags' => array_map(fn($t) => $t->label(), $node->get('field_tags')->referencedEntities()),
+          'agents' => array_map(fn($t) => $t->label(), $node->get('field_agents')->referencedEntities()),
+          'changed' => (int) $node->getChangedTime(),
+        ];
+        if ($this->isChanged($item, $manifest)) {
+          $items[] = $item;
+        }
+        if (count($items) - $tombstones >= $batch_size) {
+          break;
+        }
+      }
+      $storage->resetCache($nids);
+    } while (count($nids) === $batch_size && count($items) - $tombstones < $batch_size);
+
+    if (empty($items)) {
+      $this->messenger()->addStatus($this->t('All Context nodes are up to date.'));
+      return;
+    }
 
     $payload = [
       'assistant_id' => 'vector_writer',
@@ -78,22 +111,88 @@ public function submitForm(array &$form, FormStateInterface $form_state) {
 
     try {
       \Drupal::httpClient()->post(
-        rtrim($config->get('endpoint_url'), '/') . '/runs/wait',
+        $base_url . '/runs/wait',
         [
-          'headers' => [
-            'Content-Type' => 'application/json',
-            'X-Api-Key' => $config->get('api_key'),
-          ],
+          'headers' => $headers,
           'json' => $payload,
         ]
       );
 
       $this->messenger()->addStatus(
-        $this->t('Successfully sent @count context nodes.', ['@count' => count($items)])
+        $this->t('Successfully sent @count context nodes (@deleted deletions).', [
+          '@count' => count($items) - $tombstones,
+          '@deleted' => $tombstones,
+        ])
       );
     }
     catch (\Throwable $e) {
       $this->messenger()->addError($this->t('Send failed: @msg', ['@msg' => $e->getMessage()]));
     }
   }
+
+  /**
+   * Query for published Context nodes.
+   */
+  protected function publishedContextQuery(): QueryInterface {
+    return \Drupal::entityQuery('node')
+      ->condition('type', 'context')
+      ->condition('status', 1)
+      ->accessCheck(TRUE);
+  }
+
+  /**
+   * Returns the given UUIDs that belong to published Context nodes (uuid => TRUE).
+   */
+  protected function publishedUuids(array $uuids): array {
+    $published = [];
+    foreach (array_chunk($uuids, 500) as $chunk) {
+      $rows = \Drupal::entityQueryAggregate('node')
+        ->condition('type', 'context')
+        ->condition('status', 1)
+        ->condition('uuid', $chunk, 'IN')
+        ->groupBy('uuid')
+        ->accessCheck(TRUE)
+        ->execute();
+      foreach ($rows as $row) {
+        $published[$row['uuid']] = TRUE;
+      }
+    }
+    return $published;
+  }
+
+  /**
+   * Fetches the stored (uuid => [changed, content_hash]) manifest.
+   */
+  protected function fetchManifest(string $base_url, array $headers): array {
+    $response = \Drupal::httpClient()->post(
+      $base_url . '/runs/wait',
+      [
+        'headers' => $headers,
+        'json' => [
+          'assistant_id' => 'vector_manifest',
+          'input' => new \stdClass(),
+          'on_completion' => 'delete',
+        ],
+      ]
+    );
+
+    $values = json_decode((string) $response->getBody(), TRUE) ?: [];
+    $manifest = [];
+    foreach ($values['manifest'] ?? [] as $entry) {
+      $manifest[$entry['uuid']] = $entry;
+    }
+    return $manifest;
+  }
+
+  /**
+   * Whether an item is missing from the manifest or differs from it.
+   */
+  protected function isChanged(array $item, array $manifest): bool {
+    $entry = $manifest[$item['uuid']] ?? NULL;
+    if ($entry === NULL) {
+      return TRUE;
+    }
+    return (int) $entry['changed'] < $item['changed']
+      || $entry['content_hash'] !== hash('sha256', $item['text']);
+  }
 }
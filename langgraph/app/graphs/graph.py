@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Any
 from langchain_core.runnables import Runnable
 from langgraph.checkpoint.memory import InMemorySaver
 from langgraph.graph import START, StateGraph
+from langgraph.store.base import BaseStore
 from langgraph.types import Checkpointer
 
 from app.graphs.subgraphs.phases.registry import PHASES
@@ -27,6 +28,8 @@ def build_main_app(  # type: ignore[no-untyped-def]
     guardrails_node: StateNode[SageState, SageRuntimeContext],
     ambiguity_preflight_graph: Runnable[SageState, Any],
     checkpointer: Checkpointer = None,
+    store: BaseStore | None = None,
+    async_nodes: bool = False,
 ):
     """Graph factory for the main SageCompass graph.
 
@@ -40,6 +43,10 @@ def build_main_app(  # type: ignore[no-untyped-def]
         ambiguity_preflight_graph: DI-injected ambiguity preflight subgraph.
         checkpointer: DI-injected checkpointer. Defaults to InMemorySaver for local development.
             Pass False to disable checkpointing, or a BaseCheckpointSaver for production use.
+        store: Optional Store override (e.g. a local `ChromaStore`). Defaults to the
+            Store provided by the LangGraph runtime.
+        async_nodes: Build the phase subgraphs with their async nodes. The app then
+            requires an async run (`ainvoke`/`astream`, as on LangGraph Server).
 
     Side effects/state writes:
         None (graph wiring only).
@@ -59,7 +66,7 @@ def build_main_app(  # type: ignore[no-untyped-def]
     # Add phase subgraphs from the phase registry
     for phase in PHASES.values():
         phase_node = f"{phase.name}_supervisor"
-        graph.add_node(phase_node, phase.build_graph())
+        graph.add_node(phase_node, phase.build_graph(async_nodes=True) if async_nodes else phase.build_graph())
 
     graph.add_edge(START, "supervisor")
 
@@ -72,4 +79,4 @@ def build_main_app(  # type: ignore[no-untyped-def]
 
     # Default to InMemorySaver for local development if no checkpointer provided
     resolved_checkpointer = checkpointer if checkpointer is not None else InMemorySaver()
-    return graph.compile(checkpointer=resolved_checkpointer)
+    return graph.compile(checkpointer=resolved_checkpointer, store=store)
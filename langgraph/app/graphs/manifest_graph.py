@@ -0,0 +1,47 @@
+"""Vector manifest graph composition."""
+
+from __future__ import annotations
+
+from typing import Literal
+
+from langgraph.graph import END, START, StateGraph
+from langgraph.store.base import BaseStore
+from langgraph.types import Command
+
+from app.nodes.vector_manifest import make_node_vector_manifest
+from app.platform.adapters.node import NodeWithRuntime
+from app.runtime import SageRuntimeContext
+from app.state.write_state import VectorManifestState
+
+# Type alias for manifest graph node signature
+ManifestNodeFn = NodeWithRuntime[VectorManifestState, Command[Literal["__end__"]]]
+
+
+def build_manifest_graph(  # type: ignore[no-untyped-def]
+    *,
+    manifest_node: ManifestNodeFn | None = None,
+    store: BaseStore | None = None,
+):
+    """Graph factory for the vector delta-sync manifest.
+
+    Note: Return type omitted due to LangGraph's use of generic TypeVars in CompiledStateGraph.
+
+    Args:
+        manifest_node: Optional DI-injected manifest node.
+        store: Optional Store override. Defaults to the Store provided by the LangGraph runtime.
+
+    Side effects/state writes:
+        None (graph wiring only).
+
+    Returns:
+        A compiled graph that lists stored items and ends.
+    """
+    graph = StateGraph(VectorManifestState, context_schema=SageRuntimeContext)
+
+    resolved_manifest_node: ManifestNodeFn = manifest_node or make_node_vector_manifest()
+
+    graph.add_node("vector_manifest", resolved_manifest_node)
+    graph.add_edge(START, "vector_manifest")
+    graph.add_edge("vector_manifest", END)
+
+    return graph.compile(store=store)
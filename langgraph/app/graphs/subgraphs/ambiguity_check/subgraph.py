@@ -2,17 +2,27 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any
 
 from langgraph.graph import StateGraph
 
-from app.nodes.ambiguity_clarification import make_node_ambiguity_clarification
+from app.graphs.subgraphs.phases.registry import PHASES
+from app.nodes.ambiguity_clarification import (
+    make_node_ambiguity_clarification,
+    make_node_ambiguity_clarification_async,
+)
 from app.nodes.ambiguity_clarification_external import (
     make_node_ambiguity_clarification_external,
 )
-from app.nodes.ambiguity_scan import make_node_ambiguity_scan
+from app.nodes.ambiguity_scan import make_node_ambiguity_scan, make_node_ambiguity_scan_async
 from app.nodes.ambiguity_supervisor import make_node_ambiguity_supervisor
-from app.nodes.retrieve_context import make_node_retrieve_context
+from app.nodes.retrieve_context import (
+    make_context_prefetch,
+    make_node_retrieve_context,
+    make_node_retrieve_context_async,
+)
+from app.platform.core.contract.phases import RetrievalPolicy
 from app.runtime import SageRuntimeContext
 from app.state import SageState
 
@@ -24,6 +34,9 @@ def build_ambiguity_preflight_subgraph(  # type: ignore[no-untyped-def]
     retrieve_tool: Any | None = None,
     phase: str | None = None,
     max_context_retrieval_rounds: int = 1,
+    retrieval_policies: Mapping[str, RetrievalPolicy] | None = None,
+    prefetch_context: bool = True,
+    async_nodes: bool = False,
 ):
     """Phase Subgraph: ambiguity_check.
 
@@ -32,6 +45,21 @@ def build_ambiguity_preflight_subgraph(  # type: ignore[no-untyped-def]
     Purpose:
         Run ambiguity scan, optional retrieval + rescan, and clarification loop.
 
+    Args:
+        ambiguity_scan_agent: Optional DI-injected ambiguity scan agent.
+        ambiguity_clarification_agent: Optional DI-injected clarification agent.
+        retrieve_tool: Optional DI-injected context lookup tool.
+        phase: Optional fixed target phase (defaults to `state.ambiguity.target_step`).
+        max_context_retrieval_rounds: Max retrieval attempts before skipping.
+        retrieval_policies: Re-ranking policy per target phase. Defaults to the
+            `retrieval` policy of each registered phase contract.
+        prefetch_context: Start the target phase lookup before the first scan. The
+            scan uses it when it has already finished, skipping the retrieve +
+            rescan round trip; otherwise the retrieve node claims it.
+        async_nodes: Use the async scan, retrieve and clarification nodes (agent
+            `ainvoke`, `store.abatch`/`asearch`). The subgraph then requires an async
+            run (`ainvoke`/`astream`, as on LangGraph Server).
+
     Side effects/state writes:
         None (graph wiring only).
 
@@ -40,17 +68,27 @@ def build_ambiguity_preflight_subgraph(  # type: ignore[no-untyped-def]
     """
     graph = StateGraph(SageState, context_schema=SageRuntimeContext)
 
-    scan_node = make_node_ambiguity_scan(
+    policies = (
+        retrieval_policies
+        if retrieval_policies is not None
+        else {name: contract.retrieval for name, contract in PHASES.items()}
+    )
+    make_scan = make_node_ambiguity_scan_async if async_nodes else make_node_ambiguity_scan
+    make_retrieve = make_node_retrieve_context_async if async_nodes else make_node_retrieve_context
+    make_clarify = make_node_ambiguity_clarification_async if async_nodes else make_node_ambiguity_clarification
+    scan_node = make_scan(
         node_agent=ambiguity_scan_agent,
         phase=phase,
         goto="ambiguity_supervisor",
+        claim_prefetch=prefetch_context,
     )
-    retrieve_node = make_node_retrieve_context(
+    retrieve_node = make_retrieve(
         tool=retrieve_tool,
         phase=phase,
         goto="ambiguity_supervisor",
+        retrieval_policies=policies,
     )
-    clarify_node = make_node_ambiguity_clarification(
+    clarify_node = make_clarify(
         node_agent=ambiguity_clarification_agent,
         phase=phase,
         goto="ambiguity_supervisor",
@@ -62,6 +100,7 @@ def build_ambiguity_preflight_subgraph(  # type: ignore[no-untyped-def]
         phase=phase,
         goto="__end__",  # End subgraph - parent graph edge routes back to supervisor
         max_context_retrieval_rounds=max_context_retrieval_rounds,
+        prefetch=make_context_prefetch(retrieve_tool, retrieval_policies=policies) if prefetch_context else None,
     )
 
     # Add nodes directly - they now match LangGraph's _NodeWithRuntime protocol
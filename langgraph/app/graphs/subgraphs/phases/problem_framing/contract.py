@@ -6,7 +6,7 @@ from app.agents.problem_framing.schema import ProblemFrame
 from app.graphs.subgraphs.phases.problem_framing.subgraph import (
     build_problem_framing_subgraph,
 )
-from app.platform.core.contract.phases import PhaseContract
+from app.platform.core.contract.phases import PhaseContract, RetrievalPolicy
 
 problem_framing_contract = PhaseContract(
     name="problem_framing",
@@ -16,4 +16,6 @@ problem_framing_contract = PhaseContract(
     requires_evidence=True,
     retrieval_enabled=True,
     clarification_enabled=True,
+    # Fetch extra candidates so near-duplicates can be collapsed without shrinking the context.
+    retrieval=RetrievalPolicy(top_k=8, fetch_k=20, min_score=0.2, duplicate_threshold=0.9, mmr_lambda=0.7),
 )
@@ -9,7 +9,7 @@ from langgraph.runtime import Runtime
 from langgraph.types import Command
 
 from app.nodes.phase_supervisor import make_node_phase_supervisor
-from app.nodes.problem_framing import make_node_problem_framing
+from app.nodes.problem_framing import make_node_problem_framing, make_node_problem_framing_async
 from app.runtime import SageRuntimeContext
 from app.state import SageState
 
@@ -17,6 +17,8 @@ from app.state import SageState
 def build_problem_framing_subgraph(  # type: ignore[no-untyped-def]
     *,
     problem_framing_agent: Any | None = None,
+    async_nodes: bool = False,
+    stream_partial: bool = True,
 ):
     """Phase Subgraph: problem_framing.
 
@@ -25,6 +27,13 @@ def build_problem_framing_subgraph(  # type: ignore[no-untyped-def]
     Purpose:
         Wire the problem framing node and phase supervisor.
 
+    Args:
+        problem_framing_agent: Optional DI-injected problem framing agent.
+        async_nodes: Use the async problem framing node (agent `ainvoke`,
+            `store.abatch`); the subgraph then requires an async run.
+        stream_partial: Stream partial ProblemFrame fields to the `custom` stream
+            mode while the agent generates (see `make_node_problem_framing`).
+
     Side effects/state writes:
         None (graph wiring only).
 
@@ -43,10 +52,12 @@ def build_problem_framing_subgraph(  # type: ignore[no-untyped-def]
 
         resolved_problem_framing_agent = build_problem_framing_agent()
 
-    problem_framing_node = make_node_problem_framing(
+    make_problem_framing = make_node_problem_framing_async if async_nodes else make_node_problem_framing
+    problem_framing_node = make_problem_framing(
         agent=resolved_problem_framing_agent,
         phase=phase,
         goto="phase_supervisor",
+        stream_partial=stream_partial,
     )
     phase_supervisor_node = make_node_phase_supervisor(phase=phase)
 
@@ -2,23 +2,33 @@
 
 from __future__ import annotations
 
+from collections.abc import Awaitable
 from typing import Literal
 
 from langgraph.graph import END, START, StateGraph
+from langgraph.store.base import BaseStore
 from langgraph.types import Command
 
-from app.nodes.write_vector_content import make_node_write_vector
+from app.nodes.write_vector_content import make_node_write_vector, make_node_write_vector_async
 from app.platform.adapters.node import NodeWithRuntime
+from app.platform.runtime.vector_write_pool import WritePoolSettings
+from app.platform.runtime.vector_writes import DEFAULT_WRITE_CHUNK_SIZE
 from app.runtime import SageRuntimeContext
 from app.state.write_state import VectorWriteState
 
 # Type alias for write graph node signature
-WriteNodeFn = NodeWithRuntime[VectorWriteState, Command[Literal["__end__"]]]
+WriteNodeFn = (
+    NodeWithRuntime[VectorWriteState, Command[Literal["__end__"]]]
+    | NodeWithRuntime[VectorWriteState, Awaitable[Command[Literal["__end__"]]]]
+)
 
 
 def build_write_graph(  # type: ignore[no-untyped-def]
     *,
     write_node: WriteNodeFn | None = None,
+    chunk_size: int = DEFAULT_WRITE_CHUNK_SIZE,
+    pool: WritePoolSettings | None = None,
+    store: BaseStore | None = None,
 ):
     """Graph factory for vector write flow.
 
@@ -26,6 +36,9 @@ def build_write_graph(  # type: ignore[no-untyped-def]
 
     Args:
         write_node: Optional DI-injected write node factory.
+        chunk_size: Max Store put operations per batch for the default write nodes.
+        pool: When set, use the async concurrent write node with these settings.
+        store: Optional Store override. Defaults to the Store provided by the LangGraph runtime.
 
     Side effects/state writes:
         None (graph wiring only).
@@ -35,7 +48,13 @@ def build_write_graph(  # type: ignore[no-untyped-def]
     """
     graph = StateGraph(VectorWriteState, context_schema=SageRuntimeContext)
 
-    resolved_write_node: WriteNodeFn = write_node or make_node_write_vector()
+    resolved_write_node: WriteNodeFn
+    if write_node is not None:
+        resolved_write_node = write_node
+    elif pool is not None:
+        resolved_write_node = make_node_write_vector_async(settings=pool, chunk_size=chunk_size)
+    else:
+        resolved_write_node = make_node_write_vector(chunk_size=chunk_size)
 
     # Add node directly - it matches LangGraph's _NodeWithRuntime protocol
     graph.add_node("vector_writer", resolved_write_node)
@@ -43,4 +62,4 @@ def build_write_graph(  # type: ignore[no-untyped-def]
     graph.add_edge("vector_writer", END)
     graph.add_edge(START, "vector_writer")
 
-    return graph.compile()
+    return graph.compile(store=store)
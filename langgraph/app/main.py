@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+import os
+from collections.abc import Iterable
+from pathlib import Path
+
+from langgraph.checkpoint.memory import InMemorySaver
 from langgraph.graph.state import CompiledStateGraph
+from langgraph.store.base import BaseStore
 
 from app.graphs.graph import build_main_app
+from app.graphs.manifest_graph import build_manifest_graph
 from app.graphs.subgraphs.ambiguity_check.subgraph import (
     build_ambiguity_preflight_subgraph,
 )
@@ -13,8 +20,32 @@ from app.nodes.gating_guardrails import make_node_guardrails_check
 from app.nodes.supervisor import make_node_supervisor
 from app.platform.adapters.logging import configure_logging
 from app.platform.config.env import load_project_env
+from app.platform.config.file_loader import FileLoader
+from app.platform.config.paths import CONFIG_DIR
+from app.platform.config.watch import files_signature
+from app.platform.core.dto.vector_writes import VectorWriteReport
+from app.platform.runtime.lexical_index import get_hybrid_config
+from app.platform.runtime.retrieval_cache import get_lookup_cache
+from app.platform.runtime.scan_cache import get_scan_cache
+from app.platform.runtime.vector_ingest import (
+    DEFAULT_INGEST_WINDOW_SIZE,
+    ProgressCallback,
+    ingest_vector_items,
+    iter_ndjson_items,
+)
+from app.platform.runtime.vector_write_pool import get_write_pool_settings
+from app.platform.utils.build_cache import BuildCache
+from app.platform.utils.chroma_store import get_configured_store
+from app.platform.utils.chunking import get_chunking_config
+from app.platform.utils.embeddings import get_store_embeddings
 from app.runtime import SageRuntimeContext
-from app.state import SageState, VectorWriteState
+from app.state import SageState, VectorManifestState, VectorWriteState
+from app.state.write_state import VectorWriteItem
+
+# Opt-in: `get_app`/`get_vector_write_graph` reuse one compiled graph per process.
+GRAPH_CACHE_ENV = "SAGECOMPASS_GRAPH_CACHE"
+# Opt-in: `build_app` wires the async node variants (needs `ainvoke`/`astream`).
+ASYNC_NODES_ENV = "SAGECOMPASS_ASYNC_NODES"
 
 
 def _bootstrap() -> None:
@@ -23,11 +54,55 @@ def _bootstrap() -> None:
     load_project_env()
 
 
-def build_app() -> CompiledStateGraph[SageState, SageRuntimeContext, SageState, SageState]:
+def _env_flag(name: str) -> bool:
+    load_project_env()
+    return os.getenv(name, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def graph_cache_enabled() -> bool:
+    """Return whether `SAGECOMPASS_GRAPH_CACHE` opts into compile-once graphs."""
+    return _env_flag(GRAPH_CACHE_ENV)
+
+
+def async_nodes_enabled() -> bool:
+    """Return whether `SAGECOMPASS_ASYNC_NODES` opts into the async node variants."""
+    return _env_flag(ASYNC_NODES_ENV)
+
+
+def _reload_app_inputs() -> None:
+    """Forget cached prompt/config reads so the rebuilt app sees edited files."""
+    FileLoader.clear_cache()
+    get_scan_cache.cache_clear()
+    get_hybrid_config.cache_clear()
+    get_lookup_cache.cache_clear()
+    get_chunking_config.cache_clear()
+    get_configured_store.cache_clear()
+    get_store_embeddings.cache_clear()
+
+
+def _reload_vector_write_inputs() -> None:
+    """Forget cached writer settings so the rebuilt graph sees an edited embeddings.yaml."""
+    FileLoader.clear_cache()
+    get_write_pool_settings.cache_clear()
+    get_chunking_config.cache_clear()
+    get_configured_store.cache_clear()
+    get_store_embeddings.cache_clear()
+
+
+def build_app(
+    *, store: BaseStore | None = None, async_nodes: bool | None = None
+) -> CompiledStateGraph[SageState, SageRuntimeContext, SageState, SageState]:
     """Factory for SageCompass main reasoning graph.
 
     This should be used in all internal code, tests, and LangServe integrations.
 
+    Args:
+        store: Optional Store override. Defaults to the `store` backend in
+            `config/embeddings.yaml` (None for the LangGraph runtime Store).
+        async_nodes: Wire the async agent/retrieval nodes, so LLM calls and Store
+            reads do not block the server event loop. The app must then be run with
+            `ainvoke`/`astream`. Defaults to `SAGECOMPASS_ASYNC_NODES`.
+
     Side effects/state writes:
         Initializes logging and loads environment variables.
 
@@ -35,30 +110,45 @@ def build_app() -> CompiledStateGraph[SageState, SageRuntimeContext, SageState,
         A compiled SageCompass LangGraph instance.
     """
     _bootstrap()
+    use_async = async_nodes_enabled() if async_nodes is None else async_nodes
 
     return build_main_app(
         supervisor_node=make_node_supervisor(),
         guardrails_node=make_node_guardrails_check(),
-        ambiguity_preflight_graph=build_ambiguity_preflight_subgraph(),
+        ambiguity_preflight_graph=build_ambiguity_preflight_subgraph(async_nodes=use_async),
+        store=store if store is not None else get_configured_store(),
+        async_nodes=use_async,
     )
 
 
+_app_cache = BuildCache(build_app, signature=files_signature, on_invalidate=_reload_app_inputs)
+
+
 def get_app() -> CompiledStateGraph[SageState, SageRuntimeContext, SageState, SageState]:
     """External runner entrypoint (e.g., LangGraph CLI, langgraph.yaml).
 
-    Must always return a fresh compiled LangGraph instance.
+    Returns a fresh compiled LangGraph instance. With `SAGECOMPASS_GRAPH_CACHE`
+    set, the graph and its agents are compiled once per process (and again when
+    an agent prompt or config, provider config, guardrails or embeddings file
+    changes); each call then returns a shallow copy of it with its own
+    `InMemorySaver`, so handles never share checkpoints.
 
     Returns:
         A compiled SageCompass LangGraph instance.
     """
-    return build_app()
+    if not graph_cache_enabled():
+        return build_app()
+    return _app_cache.get().copy(update={"checkpointer": InMemorySaver()})
 
 
-def build_vector_write_graph() -> CompiledStateGraph[
-    VectorWriteState, SageRuntimeContext, VectorWriteState, VectorWriteState
-]:
+def build_vector_write_graph(
+    *, store: BaseStore | None = None
+) -> CompiledStateGraph[VectorWriteState, SageRuntimeContext, VectorWriteState, VectorWriteState]:
     """Build vector writer LangGraph.
 
+    Args:
+        store: Optional Store override. Defaults to the configured `store` backend.
+
     Side effects/state writes:
         Initializes logging and loads environment variables.
 
@@ -66,7 +156,17 @@ def build_vector_write_graph() -> CompiledStateGraph[
         A compiled vector write graph instance.
     """
     _bootstrap()
-    return build_write_graph()
+    return build_write_graph(
+        pool=get_write_pool_settings(),
+        store=store if store is not None else get_configured_store(),
+    )
+
+
+_vector_write_cache = BuildCache(
+    build_vector_write_graph,
+    signature=lambda: files_signature([CONFIG_DIR / "embeddings.yaml"]),
+    on_invalidate=_reload_vector_write_inputs,
+)
 
 
 def get_vector_write_graph() -> CompiledStateGraph[
@@ -74,9 +174,76 @@ def get_vector_write_graph() -> CompiledStateGraph[
 ]:
     """External runner entrypoint for vector writing graph.
 
-    Must always return a fresh compiled LangGraph instance.
+    Returns a fresh compiled LangGraph instance. With `SAGECOMPASS_GRAPH_CACHE`
+    set, the graph is compiled once per process (and again when
+    `config/embeddings.yaml` changes); each call then returns a shallow copy of it.
 
     Returns:
         A compiled vector write graph instance.
     """
-    return build_vector_write_graph()
+    if not graph_cache_enabled():
+        return build_vector_write_graph()
+    return _vector_write_cache.get().copy()
+
+
+def build_vector_manifest_graph(
+    *, store: BaseStore | None = None
+) -> CompiledStateGraph[VectorManifestState, SageRuntimeContext, VectorManifestState, VectorManifestState]:
+    """Build the vector delta-sync manifest LangGraph.
+
+    Args:
+        store: Optional Store override. Defaults to the configured `store` backend.
+
+    Side effects/state writes:
+        Initializes logging and loads environment variables.
+
+    Returns:
+        A compiled vector manifest graph instance.
+    """
+    _bootstrap()
+    return build_manifest_graph(store=store if store is not None else get_configured_store())
+
+
+def get_vector_manifest_graph() -> CompiledStateGraph[
+    VectorManifestState, SageRuntimeContext, VectorManifestState, VectorManifestState
+]:
+    """External runner entrypoint for the vector manifest graph.
+
+    Must always return a fresh compiled LangGraph instance.
+
+    Returns:
+        A compiled vector manifest graph instance.
+    """
+    return build_vector_manifest_graph()
+
+
+def ingest_vector_source(
+    source: Path | str | Iterable[VectorWriteItem],
+    *,
+    store: BaseStore,
+    window_size: int = DEFAULT_INGEST_WINDOW_SIZE,
+    on_progress: ProgressCallback | None = None,
+) -> VectorWriteReport:
+    """Streaming ingest entrypoint for imports too large for a vector_writer run.
+
+    Args:
+        source: NDJSON file path or an iterator of vector write items.
+        store: Store to write into (e.g. the deployment Store or a local adapter).
+        window_size: Items held in memory and written per batch.
+        on_progress: Optional callback receiving one `emit_event` update per window.
+
+    Side effects/state writes:
+        Initializes logging, loads environment variables and writes to the Store.
+
+    Returns:
+        Summed write counts for the whole source.
+    """
+    _bootstrap()
+    items = iter_ndjson_items(source) if isinstance(source, Path | str) else source
+    return ingest_vector_items(
+        items,
+        store=store,
+        window_size=window_size,
+        chunking=get_chunking_config(),
+        on_progress=on_progress,
+    )
@@ -4,12 +4,12 @@ from __future__ import annotations
 
 import hashlib
 import json
-from collections.abc import Callable, Sequence
+from collections.abc import Awaitable, Callable, Sequence
 from typing import NotRequired
 
 from langchain.agents import AgentState
-from langchain.agents.middleware import ModelResponse, wrap_model_call, wrap_tool_call
-from langchain.agents.middleware.types import ModelRequest, ToolCallRequest
+from langchain.agents.middleware import AgentMiddleware, ModelResponse
+from langchain.agents.middleware.types import ModelCallResult, ModelRequest, ToolCallRequest
 from langchain_core.documents import Document
 from langchain_core.messages import AIMessage, ToolMessage
 from langgraph.types import Command
@@ -55,18 +55,15 @@ def _has_context_tool_message(messages: Sequence[object]) -> bool:
     return any(isinstance(message, ToolMessage) and message.name == TOOL_NAME for message in reversed(messages))
 
 
-@wrap_model_call(state_schema=ContextDocsState, name="ContextDocsModelMiddleware")
-def _context_docs_model_call(
-    request: ModelRequest,
-    handler: Callable[[ModelRequest], ModelResponse | AIMessage],
-) -> ModelResponse | AIMessage:
+def _context_docs_response(request: ModelRequest) -> ModelResponse | None:
+    """Return the synthetic context docs tool call, or None to call the model."""
     # ContextDocsState guarantees context_docs is list[Document] | None
     docs_or_none: list[Document] | None = request.state.get("context_docs")  # type: ignore[assignment]
     docs: list[Document] = docs_or_none if docs_or_none is not None else []
     if not docs:
-        return handler(request)
+        return None
     if _has_context_tool_message(request.messages):
-        return handler(request)
+        return None
 
     tool_call_id = _context_docs_tool_call_id(docs)
     tool_call = {
@@ -78,13 +75,10 @@ def _context_docs_model_call(
     return ModelResponse(result=[AIMessage(content="", tool_calls=[tool_call])])
 
 
-@wrap_tool_call(tools=[context_docs_tool], name="ContextDocsToolMiddleware")
-def _context_docs_tool_call(
-    request: ToolCallRequest,
-    handler: Callable[[ToolCallRequest], ToolMessage | Command],
-) -> ToolMessage | Command:
+def _context_docs_tool_message(request: ToolCallRequest) -> ToolMessage | None:
+    """Return the context docs tool result, or None for any other tool call."""
     if not request.tool_call or request.tool_call.get("name") != TOOL_NAME:
-        return handler(request)
+        return None
     # ContextDocsState guarantees context_docs is list[Document] | None
     docs_or_none: list[Document] | None = request.state.get("context_docs")
     docs: list[Document] = docs_or_none if docs_or_none is not None else []
@@ -98,6 +92,57 @@ def _context_docs_tool_call(
     )
 
 
-def make_context_docs_middleware():
+class ContextDocsModelMiddleware(AgentMiddleware):
+    """Answer the first model call with a context docs tool call when docs are present."""
+
+    state_schema = ContextDocsState
+
+    def wrap_model_call(
+        self,
+        request: ModelRequest,
+        handler: Callable[[ModelRequest], ModelResponse],
+    ) -> ModelCallResult:
+        """Short-circuit the model call with the context docs tool call."""
+        response = _context_docs_response(request)
+        return response if response is not None else handler(request)
+
+    async def awrap_model_call(
+        self,
+        request: ModelRequest,
+        handler: Callable[[ModelRequest], Awaitable[ModelResponse]],
+    ) -> ModelCallResult:
+        """Short-circuit the async model call with the context docs tool call."""
+        response = _context_docs_response(request)
+        return response if response is not None else await handler(request)
+
+
+class ContextDocsToolMiddleware(AgentMiddleware):
+    """Serve the context docs tool from the hydrated `context_docs` state."""
+
+    def __init__(self) -> None:
+        """Register the context docs tool with the agent."""
+        super().__init__()
+        self.tools = [context_docs_tool]
+
+    def wrap_tool_call(
+        self,
+        request: ToolCallRequest,
+        handler: Callable[[ToolCallRequest], ToolMessage | Command],
+    ) -> ToolMessage | Command:
+        """Return the serialized context docs for the context docs tool."""
+        message = _context_docs_tool_message(request)
+        return message if message is not None else handler(request)
+
+    async def awrap_tool_call(
+        self,
+        request: ToolCallRequest,
+        handler: Callable[[ToolCallRequest], Awaitable[ToolMessage | Command]],
+    ) -> ToolMessage | Command:
+        """Return the serialized context docs for the context docs tool (async)."""
+        message = _context_docs_tool_message(request)
+        return message if message is not None else await handler(request)
+
+
+def make_context_docs_middleware() -> tuple[ContextDocsModelMiddleware, ContextDocsToolMiddleware]:
     """Build middleware that injects deterministic context docs tool calls."""
-    return (_context_docs_model_call, _context_docs_tool_call)
+    return (ContextDocsModelMiddleware(), ContextDocsToolMiddleware())
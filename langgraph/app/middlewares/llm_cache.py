@@ -0,0 +1,120 @@
+"""Middleware replaying recorded model calls from the persistent LLM cache."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from langchain.agents.middleware import AgentMiddleware, ModelRequest, ModelResponse
+from langchain.agents.middleware.types import ModelCallResult
+from langchain_core.messages import messages_from_dict, messages_to_dict
+from pydantic import BaseModel
+
+from app.platform.utils.llm_cache import ChatModelCache, LLMResponseCache, get_llm_cache, llm_cache_key
+
+
+def _model_cached(request: ModelRequest) -> bool:
+    """Return whether the model already answers from the LLM cache (see `get_model_for_agent`)."""
+    return isinstance(getattr(request.model, "cache", None), ChatModelCache)
+
+
+def _response_schema(request: ModelRequest) -> dict[str, Any] | str | None:
+    schema = getattr(request.response_format, "schema", None)
+    if isinstance(schema, type) and issubclass(schema, BaseModel):
+        return schema.model_json_schema()
+    return None if schema is None else repr(schema)
+
+
+def _request_key(request: ModelRequest) -> str:
+    """Key the call on model, params, rendered system prompt, messages and response schema."""
+    system_message = request.system_message
+    return llm_cache_key(
+        model=request.model.dict(),
+        params={
+            "model_settings": request.model_settings,
+            "tool_choice": request.tool_choice,
+            "tools": sorted(getattr(tool, "name", None) or json.dumps(tool, default=str) for tool in request.tools),
+        },
+        system_prompt=str(system_message.content) if system_message is not None else request.system_prompt,
+        messages=request.messages,
+        response_schema=_response_schema(request),
+    )
+
+
+def _serialize(response: ModelResponse) -> str:
+    structured = response.structured_response
+    if isinstance(structured, BaseModel):
+        structured = structured.model_dump(mode="json")
+    return json.dumps({"result": messages_to_dict(response.result), "structured_response": structured})
+
+
+def _deserialize(raw: str, request: ModelRequest) -> ModelResponse:
+    payload = json.loads(raw)
+    structured = payload["structured_response"]
+    schema = getattr(request.response_format, "schema", None)
+    if structured is not None and isinstance(schema, type) and issubclass(schema, BaseModel):
+        structured = schema.model_validate(structured)
+    return ModelResponse(result=messages_from_dict(payload["result"]), structured_response=structured)
+
+
+class LLMCacheMiddleware(AgentMiddleware):
+    """Record model calls and replay them on repeat (raises on a miss in `replay` mode).
+
+    Register it last (e.g. via an agent config's `_extra_middleware`), so the key
+    covers the system prompt as rendered by the dynamic prompt middleware. Calls to
+    a model that already caches itself (`get_model_for_agent`) pass straight
+    through, so each call is recorded once.
+    """
+
+    def __init__(self, llm_cache: LLMResponseCache) -> None:
+        """Create the middleware.
+
+        Args:
+            llm_cache: Response store; its mode (`record`/`replay`) applies.
+        """
+        super().__init__()
+        self._llm_cache = llm_cache
+
+    def wrap_model_call(
+        self,
+        request: ModelRequest,
+        handler: Callable[[ModelRequest], ModelResponse],
+    ) -> ModelCallResult:
+        """Replay a recorded response or record the model's response."""
+        if _model_cached(request):
+            return handler(request)
+        key = _request_key(request)
+        raw = self._llm_cache.lookup(key)
+        if raw is not None:
+            return _deserialize(raw, request)
+        response = handler(request)
+        self._llm_cache.record(key, _serialize(response))
+        return response
+
+    async def awrap_model_call(
+        self,
+        request: ModelRequest,
+        handler: Callable[[ModelRequest], Awaitable[ModelResponse]],
+    ) -> ModelCallResult:
+        """Replay a recorded response or record the async model's response."""
+        if _model_cached(request):
+            return await handler(request)
+        key = _request_key(request)
+        raw = self._llm_cache.lookup(key)
+        if raw is not None:
+            return _deserialize(raw, request)
+        response = await handler(request)
+        self._llm_cache.record(key, _serialize(response))
+        return response
+
+
+def make_llm_cache_middleware(llm_cache: LLMResponseCache | None = None) -> list[LLMCacheMiddleware]:
+    """Build the LLM cache middleware for an agent's `_extra_middleware`.
+
+    Args:
+        llm_cache: Response store. Defaults to `get_llm_cache()`; an empty list is
+            returned when `SAGECOMPASS_LLM_CACHE` leaves it disabled.
+    """
+    resolved = llm_cache or get_llm_cache()
+    return [LLMCacheMiddleware(resolved)] if resolved is not None else []
@@ -16,6 +16,8 @@ Node Categories:
     - Supervisors: Global routing (supervisor), phase routing (phase_supervisor)
     - Preflight: Guardrails check, ambiguity detection/resolution
     - Phase Nodes: Problem framing, context retrieval, etc.
+    - Async variants (`*_async`): same nodes with `ainvoke`/async Store I/O,
+      wired by the graph builders when `async_nodes=True`.
 
 Example:
     >>> from app.nodes import make_node_problem_framing
@@ -26,26 +28,30 @@ Example:
 
 from __future__ import annotations
 
-from app.nodes.ambiguity_clarification import make_node_ambiguity_clarification
+from app.nodes.ambiguity_clarification import make_node_ambiguity_clarification, make_node_ambiguity_clarification_async
 from app.nodes.ambiguity_clarification_external import (
     make_node_ambiguity_clarification_external,
 )
-from app.nodes.ambiguity_scan import make_node_ambiguity_scan
+from app.nodes.ambiguity_scan import make_node_ambiguity_scan, make_node_ambiguity_scan_async
 from app.nodes.ambiguity_supervisor import make_node_ambiguity_supervisor
 from app.nodes.gating_guardrails import make_node_guardrails_check
 from app.nodes.phase_supervisor import make_node_phase_supervisor
-from app.nodes.problem_framing import make_node_problem_framing
-from app.nodes.retrieve_context import make_node_retrieve_context
+from app.nodes.problem_framing import make_node_problem_framing, make_node_problem_framing_async
+from app.nodes.retrieve_context import make_node_retrieve_context, make_node_retrieve_context_async
 from app.nodes.supervisor import make_node_supervisor
 
 __all__ = [
     "make_node_ambiguity_clarification",
+    "make_node_ambiguity_clarification_async",
     "make_node_ambiguity_clarification_external",
     "make_node_ambiguity_scan",
+    "make_node_ambiguity_scan_async",
     "make_node_ambiguity_supervisor",
     "make_node_guardrails_check",
     "make_node_phase_supervisor",
     "make_node_problem_framing",
+    "make_node_problem_framing_async",
     "make_node_retrieve_context",
+    "make_node_retrieve_context_async",
     "make_node_supervisor",
 ]
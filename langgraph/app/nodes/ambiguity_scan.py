@@ -2,28 +2,37 @@
 
 from __future__ import annotations
 
+from collections.abc import Awaitable
+from dataclasses import replace
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Literal
-
-from langgraph.types import Command
+from typing import TYPE_CHECKING, Any
 
 from app.agents.ambiguity_scan.schema import OutputSchema
-from app.platform.adapters.events import emit_event
-from app.platform.adapters.evidence import collect_phase_evidence
+from app.platform.adapters.evidence import acollect_phase_evidence, collect_phase_evidence
 from app.platform.adapters.logging import get_logger
 from app.platform.adapters.node import NodeWithRuntime
-from app.platform.adapters.phases import update_phases_dict
-from app.platform.core.contract.state import validate_state_update
 from app.platform.core.contract.structured_output import (
     extract_structured_response,
     validate_structured_response,
 )
-from app.platform.runtime.state_helpers import get_latest_user_input, reset_clarification_context
-from app.state import PhaseEntry
+from app.platform.runtime.ambiguity_scan_steps import (
+    AmbiguityScanRoute,
+    ScanRequest,
+    ScanSettings,
+    awith_prefetched_evidence,
+    missing_structured_command,
+    missing_target_command,
+    scan_command,
+    scan_request,
+    with_prefetched_evidence,
+)
+from app.platform.runtime.scan_cache import ScanResultCache, get_scan_cache, scan_cache_bypassed
+from app.platform.runtime.state_helpers import get_latest_user_input
 
 if TYPE_CHECKING:
     from langchain_core.runnables import Runnable
     from langgraph.runtime import Runtime
+    from langgraph.types import Command
 
     from app.runtime import SageRuntimeContext
     from app.state import SageState
@@ -31,11 +40,38 @@ if TYPE_CHECKING:
 logger = get_logger("nodes.ambiguity_scan")
 
 
-AmbiguityScanRoute = Literal[
-    "ambiguity_supervisor",
-    "phase_supervisor",
-    "supervisor",
-]
+def _cached_scan(request: ScanRequest, settings: ScanSettings, bypass: bool) -> OutputSchema | None:
+    """Return the cached scan result; a bypass skips the lookup (the entry is still refreshed)."""
+    if settings.result_cache is None or request.cache_key is None or bypass:
+        return None
+    cached = settings.result_cache.get(request.cache_key, OutputSchema)
+    if cached is not None:
+        logger.info("ambiguity_scan.cache_hit", phase=request.target_phase)
+    return cached
+
+
+def _scan_result(
+    state: SageState, request: ScanRequest, structured: Any, settings: ScanSettings, *, fresh: bool
+) -> Command[AmbiguityScanRoute]:
+    """Route on the structured scan response; `fresh` results are written to the result cache."""
+    if structured is None:
+        return missing_structured_command(state, request, settings.goto)
+
+    # Enforce schema
+    validated = validate_structured_response(structured, OutputSchema)
+    if fresh and settings.result_cache is not None and request.cache_key is not None:
+        settings.result_cache.set(request.cache_key, validated)
+    return scan_command(state, request, validated.ambiguities, settings)
+
+
+def _resolve_agent(node_agent: Runnable | None, settings: ScanSettings) -> tuple[Runnable, ScanSettings]:
+    """Build the default agent (and its result cache) unless an agent was injected."""
+    if node_agent is not None:
+        return node_agent, settings
+    from app.agents.ambiguity_scan.agent import AGENT_NAME, build_agent
+
+    result_cache = settings.result_cache or get_scan_cache(AGENT_NAME)
+    return build_agent(), replace(settings, result_cache=result_cache)
 
 
 def make_node_ambiguity_scan(
@@ -47,6 +83,8 @@ def make_node_ambiguity_scan(
     confidence_threshold: Decimal | float = Decimal("0.8"),
     max_selected: int = 3,
     goto: AmbiguityScanRoute = "supervisor",
+    claim_prefetch: bool = False,
+    result_cache: ScanResultCache | None = None,
 ) -> NodeWithRuntime[SageState, Command[AmbiguityScanRoute]]:
     """Node: ambiguity_scan.
 
@@ -61,149 +99,118 @@ def make_node_ambiguity_scan(
         confidence_threshold: Minimum ambiguity confidence to qualify for clarification.
         max_selected: Max number of ambiguities forwarded to clarification.
         goto: Node name to route to after completion.
+        claim_prefetch: Scan with the context lookup prefetched by the ambiguity
+            supervisor when it has already finished (the scan never waits for
+            it); the retrieval round is then counted as done, so no rescan
+            follows. An unfinished lookup is claimed later by the retrieve node.
+        result_cache: Optional persistent cache of validated scan results, keyed on
+            the user input, message history, phase, evidence fingerprint and
+            prompt/model version.
+            Defaults to `get_scan_cache` when the agent is built here; injected
+            agents are only cached when a cache is passed explicitly. The
+            `bypass_scan_cache` runtime context flag forces a fresh agent call.
 
     Side effects/state writes:
         Updates `state.ambiguity` with detected items and eligibility status.
+        Returns claimed prefetched evidence as `phases[phase].evidence` in the update.
         When phase is not provided, uses `state.ambiguity.target_step`.
 
     Returns:
         A Command routing back to `supervisor`.
     """
-    agent = node_agent
-    if agent is None:
-        from app.agents.ambiguity_scan.agent import build_agent
-
-        agent = build_agent()
+    agent, settings = _resolve_agent(
+        node_agent,
+        ScanSettings(
+            phase=phase,
+            max_context_items=max_context_items,
+            importance_limit=Decimal(str(importance_threshold)),
+            confidence_limit=Decimal(str(confidence_threshold)),
+            max_selected=max_selected,
+            goto=goto,
+            claim_prefetch=claim_prefetch,
+            result_cache=result_cache,
+        ),
+    )
 
     def node_ambiguity_scan(
         state: SageState,
         *,
         runtime: Runtime[SageRuntimeContext],
     ) -> Command[AmbiguityScanRoute]:
-        update: dict[str, Any]
         user_input = get_latest_user_input(state.messages) or ""
         target_phase = phase or state.ambiguity.target_step
         if not target_phase:
-            logger.warning("ambiguity_scan.missing_target_step")
-            update = emit_event(
-                owner="ambiguity_scan", kind="error", message="Unable to determine ambiguity scan target."
-            )
-            validate_state_update(update, owner="ambiguity_scan")
-            return Command(update=update, goto=goto)
-        importance_limit = Decimal(str(importance_threshold))
-        confidence_limit = Decimal(str(confidence_threshold))
-
-        # Step 1: hydrate evidence
-        evidence_bundle = collect_phase_evidence(
-            state,
-            phase=target_phase,
-            max_items=max_context_items,
-        )
-        # Get phase_entry from state (not from bundle - keeping DTOs pure)
-        phase_entry = state.phases.get(target_phase) or PhaseEntry()
-        context_docs = evidence_bundle.context_docs
-        include_errors = False
-        if evidence_bundle.missing_store:
-            include_errors = True
-            state.errors.append(f"{target_phase}: runtime store unavailable for evidence hydration")
-        messages_for_agent = state.messages
-
-        # Step 2: call agent
-        agent_input: dict[str, Any] = {
-            "task_input": user_input,
-            "messages": messages_for_agent,
-            "context_docs": context_docs,
-        }
-
-        result = agent.invoke(agent_input)
-        structured = extract_structured_response(result)
-
-        if structured is None:
-            logger.warning("agent.missing_structured_response", phase=target_phase)
-            # Use adapter to update phase entry
-            updated_entry = PhaseEntry(
-                data=phase_entry.data,
-                error={
-                    "code": "missing_structured_response",
-                    "message": "Agent response missing structured_response.",
-                },
-                status="stale",
-                evidence=phase_entry.evidence,
-            )
-            phases = update_phases_dict(state.phases, target_phase, updated_entry)
-            state.errors.append(f"{target_phase}: missing structured_response")
-            update = {"phases": phases, "errors": state.errors}
-            validate_state_update(update, owner="ambiguity_scan")
-            return Command(
-                update=update,
-                goto=goto,
-            )
-
-        # Enforce schema
-        structured = validate_structured_response(structured, OutputSchema)
-
-        ambiguities = structured.ambiguities
-        high_priority = [
-            item for item in ambiguities if item.importance >= importance_limit and item.confidence >= confidence_limit
-        ]
-        high_priority.sort(
-            key=lambda priority_item: (priority_item.importance, priority_item.confidence),
-            reverse=True,
-        )
-        selected_ambiguities = high_priority[:max_selected]
-
-        current_retrieval_round = state.ambiguity.context_retrieval_round
-        base_context = reset_clarification_context(
-            state,
-            target_step=target_phase,
-            context_retrieval_round=current_retrieval_round,
-            last_scan_retrieval_round=current_retrieval_round,
-        )
-
-        if not selected_ambiguities:
-            resolved_context = base_context.model_copy(
-                update={
-                    "target_step": target_phase,
-                    "checked": True,
-                    "eligible": True,
-                    "detected": [],
-                    "resolved": [],
-                    "context_retrieval_round": current_retrieval_round,
-                    "last_scan_retrieval_round": current_retrieval_round,
-                    "exhausted": False,
-                }
-            )
-            event_update = emit_event(
-                owner="ambiguity_scan",
-                kind="progress",
-                message="No high-priority ambiguities detected.",
-                phase=target_phase,
-            )
-            update = {"ambiguity": resolved_context, "phases": state.phases, **event_update}
-            if include_errors:
-                update["errors"] = state.errors
-            validate_state_update(update, owner="ambiguity_scan")
-            return Command(update=update, goto=goto)
-
-        updated_context = base_context.model_copy(
-            update={
-                "target_step": target_phase,
-                "checked": True,
-                "eligible": False,
-                "detected": selected_ambiguities,
-                "context_retrieval_round": current_retrieval_round,
-                "last_scan_retrieval_round": current_retrieval_round,
-                "exhausted": False,
-            }
-        )
-
-        summary = "No ambiguities detected." if not ambiguities else f"Ambiguities detected: {len(ambiguities)}."
-
-        event_update = emit_event(owner="ambiguity_scan", kind="progress", message=summary, phase=target_phase)
-        update = {"ambiguity": updated_context, "phases": state.phases, **event_update}
-        if include_errors:
-            update["errors"] = state.errors
-        validate_state_update(update, owner="ambiguity_scan")
-        return Command(update=update, goto=goto)
+            return missing_target_command(goto)
+
+        # Step 1: hydrate evidence (prefetched while the graph routed here, if ready)
+        state = with_prefetched_evidence(state, target_phase, user_input, claim_prefetch)
+        evidence_bundle = collect_phase_evidence(state, phase=target_phase, max_items=max_context_items)
+        request = scan_request(state, target_phase, user_input, evidence_bundle, settings)
+
+        # Step 2: call agent (unless the result cache has this scan)
+        cached = _cached_scan(request, settings, scan_cache_bypassed(getattr(runtime, "context", None)))
+        if cached is not None:
+            return _scan_result(state, request, cached, settings, fresh=False)
+        structured = extract_structured_response(agent.invoke(request.agent_input))
+        return _scan_result(state, request, structured, settings, fresh=True)
 
     return node_ambiguity_scan
+
+
+def make_node_ambiguity_scan_async(
+    node_agent: Runnable | None = None,
+    *,
+    phase: str | None = None,
+    max_context_items: int = 3,
+    importance_threshold: Decimal | float = Decimal("0.9"),
+    confidence_threshold: Decimal | float = Decimal("0.8"),
+    max_selected: int = 3,
+    goto: AmbiguityScanRoute = "supervisor",
+    claim_prefetch: bool = False,
+    result_cache: ScanResultCache | None = None,
+) -> NodeWithRuntime[SageState, Awaitable[Command[AmbiguityScanRoute]]]:
+    """Node: ambiguity_scan (async).
+
+    Purpose:
+        Same as `make_node_ambiguity_scan` (arguments mirror it), but claims the
+        prefetched lookup, hydrates evidence via `store.abatch` and calls the agent
+        via `ainvoke`. Requires an async graph run.
+
+    Returns:
+        An async node routing to `goto`.
+    """
+    agent, settings = _resolve_agent(
+        node_agent,
+        ScanSettings(
+            phase=phase,
+            max_context_items=max_context_items,
+            importance_limit=Decimal(str(importance_threshold)),
+            confidence_limit=Decimal(str(confidence_threshold)),
+            max_selected=max_selected,
+            goto=goto,
+            claim_prefetch=claim_prefetch,
+            result_cache=result_cache,
+        ),
+    )
+
+    async def anode_ambiguity_scan(
+        state: SageState,
+        *,
+        runtime: Runtime[SageRuntimeContext],
+    ) -> Command[AmbiguityScanRoute]:
+        user_input = get_latest_user_input(state.messages) or ""
+        target_phase = phase or state.ambiguity.target_step
+        if not target_phase:
+            return missing_target_command(goto)
+
+        state = await awith_prefetched_evidence(state, target_phase, user_input, claim_prefetch)
+        evidence_bundle = await acollect_phase_evidence(state, phase=target_phase, max_items=max_context_items)
+        request = scan_request(state, target_phase, user_input, evidence_bundle, settings)
+
+        cached = _cached_scan(request, settings, scan_cache_bypassed(getattr(runtime, "context", None)))
+        if cached is not None:
+            return _scan_result(state, request, cached, settings, fresh=False)
+        structured = extract_structured_response(await agent.ainvoke(request.agent_input))
+        return _scan_result(state, request, structured, settings, fresh=True)
+
+    return anode_ambiguity_scan
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any, Literal
 
 from langgraph.types import Command
@@ -12,6 +13,7 @@ from app.platform.adapters.node import NodeWithRuntime
 from app.platform.core.contract.state import validate_state_update
 from app.platform.runtime.state_helpers import (
     get_current_clarifying_question,
+    get_latest_user_input,
     get_pending_ambiguity_keys,
 )
 from app.state import PhaseEntry
@@ -30,6 +32,7 @@ AmbiguitySupervisorRoute = Literal[
     "ambiguity_clarification",
     "ambiguity_clarification_external",
     "ambiguity_scan",
+    "ambiguity_supervisor",
     "retrieve_context",
     "supervisor",
 ]
@@ -45,6 +48,7 @@ def make_node_ambiguity_supervisor(
     retrieve_node: Literal["retrieve_context"] = "retrieve_context",
     clarification_node: Literal["ambiguity_clarification"] = "ambiguity_clarification",
     max_context_retrieval_rounds: int = 1,
+    prefetch: Callable[[str, str], None] | None = None,
 ) -> NodeWithRuntime[SageState, Command[AmbiguitySupervisorRoute]]:
     """Node: ambiguity_supervisor.
 
@@ -58,6 +62,8 @@ def make_node_ambiguity_supervisor(
         retrieve_node: Node name for retrieval.
         clarification_node: Node name for internal clarification.
         max_context_retrieval_rounds: Max retrieval attempts before skipping.
+        prefetch: Optional hook called with (phase, user input) before the first scan of
+            a retrieval-enabled phase, so the lookup overlaps the scan's agent call.
 
     Side effects/state writes:
         Adds informational messages for routing decisions.
@@ -102,7 +108,20 @@ def make_node_ambiguity_supervisor(
             )
 
         ambiguity = state.ambiguity
+        phase_entry = state.phases.get(target_phase) or PhaseEntry()
+        evidence = list(phase_entry.evidence or [])
+
+        retrieval_allowed = phase_contract.retrieval_enabled and phase_contract.requires_evidence
+        retrieval_round = ambiguity.context_retrieval_round
+
         if not ambiguity.checked:
+            if (
+                prefetch is not None
+                and retrieval_allowed
+                and not evidence
+                and retrieval_round < max_context_retrieval_rounds
+            ):
+                prefetch(target_phase, get_latest_user_input(state.messages) or "")
             update = emit_event(
                 owner="ambiguity_supervisor", kind="routing", message="Checking for ambiguities.", phase=target_phase
             )
@@ -112,12 +131,6 @@ def make_node_ambiguity_supervisor(
                 goto=scan_node,
             )
 
-        phase_entry = state.phases.get(target_phase) or PhaseEntry()
-        evidence = list(phase_entry.evidence or [])
-
-        retrieval_allowed = phase_contract.retrieval_enabled and phase_contract.requires_evidence
-        retrieval_round = ambiguity.context_retrieval_round
-
         if retrieval_allowed and not evidence and retrieval_round < max_context_retrieval_rounds:
             updated_ambiguity = ambiguity.model_copy(update={"context_retrieval_round": retrieval_round + 1})
             event_update = emit_event(
@@ -133,6 +146,7 @@ def make_node_ambiguity_supervisor(
                 goto=retrieve_node,
             )
 
+        # A scan that adopted prefetched evidence already covers the current retrieval round.
         if retrieval_allowed and evidence and ambiguity.last_scan_retrieval_round < ambiguity.context_retrieval_round:
             update = emit_event(
                 owner="ambiguity_supervisor",
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any, Literal
 
 from langchain_core.messages import AIMessage
 from langgraph.types import Command
 
 from app.agents.problem_framing.schema import ProblemFrame
-from app.platform.adapters.evidence import collect_phase_evidence, evidence_to_items
+from app.platform.adapters.evidence import acollect_phase_evidence, collect_phase_evidence, evidence_to_items
 from app.platform.adapters.logging import get_logger
 from app.platform.adapters.node import NodeWithRuntime
 from app.platform.core.contract.state import validate_state_update
@@ -16,6 +17,7 @@ from app.platform.core.contract.structured_output import (
     extract_structured_response,
     validate_structured_response,
 )
+from app.platform.runtime.partial_output import astream_agent, partial_output_payload, stream_agent
 from app.platform.runtime.state_helpers import get_latest_user_input
 from app.state import PhaseEntry
 
@@ -23,6 +25,7 @@ if TYPE_CHECKING:
     from langchain_core.runnables import Runnable
     from langgraph.runtime import Runtime
 
+    from app.platform.core.dto.evidence import EvidenceBundle
     from app.runtime import SageRuntimeContext
     from app.state import SageState
 
@@ -53,12 +56,91 @@ def _format_problem_frame_response(pf: ProblemFrame) -> str:
     return "\n".join(lines)
 
 
+def _agent_input(state: SageState, phase: str, evidence_bundle: EvidenceBundle) -> tuple[dict[str, Any], bool]:
+    """Return the agent input and whether the state errors must be included in the update."""
+    include_errors = False
+    if evidence_bundle.missing_store:
+        include_errors = True
+        state.errors.append(f"{phase}: runtime store unavailable for evidence hydration")
+    agent_input: dict[str, Any] = {
+        "task_input": get_latest_user_input(state.messages) or "",
+        "messages": state.messages,
+        "context_docs": evidence_bundle.context_docs,
+    }
+    return agent_input, include_errors
+
+
+def _partial_writer(runtime: Runtime[SageRuntimeContext], phase: str) -> Callable[[dict[str, Any]], None]:
+    """Return a callback writing partial ProblemFrame fields to the `custom` stream."""
+    writer = getattr(runtime, "stream_writer", None)
+
+    def write(fields: dict[str, Any]) -> None:
+        if writer is not None:
+            writer(partial_output_payload(owner="problem_framing", phase=phase, fields=fields))
+
+    return write
+
+
+def _framing_command(
+    state: SageState,
+    result: Any,
+    *,
+    phase: str,
+    evidence_bundle: EvidenceBundle,
+    include_errors: bool,
+    goto: ProblemFramingRoute,
+) -> Command[ProblemFramingRoute]:
+    """Store the agent's ProblemFrame (or the failure) in the phase entry."""
+    update: dict[str, Any]
+    # Get phase_entry from state (not from bundle - keeping DTOs pure)
+    phase_entry = state.phases.get(phase) or PhaseEntry()
+    pf = extract_structured_response(result)
+
+    if pf is None:
+        logger.warning("problem_framing.structural_response_missing", phase=phase)
+        phase_entry.status = "stale"
+        phase_entry.error = {
+            "code": "missing_structured_response",
+            "message": "Agent response missing structured_response.",
+        }
+        state.phases[phase] = phase_entry
+        state.errors.append(f"{phase}: missing structured_response")
+        update = {"phases": state.phases, "errors": state.errors}
+        validate_state_update(update, owner="problem_framing")
+        return Command(update=update, goto=goto)
+
+    pf = validate_structured_response(pf, ProblemFrame)
+
+    logger.info("problem_framing.success", phase=phase)
+
+    # Use adapter to convert evidence from DTO to EvidenceItem models
+    evidence_items = evidence_to_items(evidence_bundle)
+    state.phases[phase] = PhaseEntry(
+        data=pf.model_dump(),
+        status="complete",
+        evidence=evidence_items,
+    )
+
+    # Create user-facing response message
+    response_message = _format_problem_frame_response(pf)
+
+    update = {
+        "phases": state.phases,
+        "messages": [AIMessage(content=response_message)],
+    }
+    if include_errors:
+        update["errors"] = state.errors
+    validate_state_update(update, owner="problem_framing")
+    return Command(update=update, goto=goto)
+
+
 def make_node_problem_framing(
     agent: Runnable,
     *,
     phase: str = "problem_framing",
     max_context_items: int = 8,
     goto: ProblemFramingRoute = "phase_supervisor",
+    stream_partial: bool = False,
 ) -> NodeWithRuntime[SageState, Command[ProblemFramingRoute]]:
     """Node: problem_framing.
 
@@ -70,6 +152,10 @@ def make_node_problem_framing(
         phase: Phase key to update in `state.phases`.
         max_context_items: Max evidence items to hydrate into context.
         goto: Node name to route to after completion.
+        stream_partial: Run the agent via `stream` and write the ProblemFrame fields
+            parsed so far to the LangGraph `custom` stream (`partial_output`
+            payloads) as the model generates them. Model tokens also reach the
+            `messages` stream mode either way.
 
     Side effects/state writes:
         Updates `state.phases[phase]` with structured `ProblemFrame` output
@@ -84,69 +170,71 @@ def make_node_problem_framing(
         *,
         runtime: Runtime[SageRuntimeContext],
     ) -> Command[ProblemFramingRoute]:
-        update: dict[str, Any]
-        user_input = get_latest_user_input(state.messages) or ""
-
         # Step 1: hydrate evidence
-        evidence_bundle = collect_phase_evidence(
+        evidence_bundle = collect_phase_evidence(state, phase=phase, max_items=max_context_items)
+        agent_input, include_errors = _agent_input(state, phase, evidence_bundle)
+
+        # Step 2: invoke agent (streaming partial fields when enabled)
+        result = (
+            stream_agent(
+                agent, agent_input, schema_name=ProblemFrame.__name__, on_partial=_partial_writer(runtime, phase)
+            )
+            if stream_partial
+            else agent.invoke(agent_input)
+        )
+        return _framing_command(
             state,
+            result,
             phase=phase,
-            max_items=max_context_items,
+            evidence_bundle=evidence_bundle,
+            include_errors=include_errors,
+            goto=goto,
         )
-        # Get phase_entry from state (not from bundle - keeping DTOs pure)
-        phase_entry = state.phases.get(phase) or PhaseEntry()
-        context_docs = evidence_bundle.context_docs
-        include_errors = False
-        if evidence_bundle.missing_store:
-            include_errors = True
-            state.errors.append(f"{phase}: runtime store unavailable for evidence hydration")
-        messages_for_agent = state.messages
-
-        # Step 2: invoke agent
-        agent_input: dict[str, Any] = {
-            "task_input": user_input,
-            "messages": messages_for_agent,
-            "context_docs": context_docs,
-        }
 
-        result = agent.invoke(agent_input)
-        pf = extract_structured_response(result)
-
-        if pf is None:
-            logger.warning("problem_framing.structural_response_missing", phase=phase)
-            phase_entry.status = "stale"
-            phase_entry.error = {
-                "code": "missing_structured_response",
-                "message": "Agent response missing structured_response.",
-            }
-            state.phases[phase] = phase_entry
-            state.errors.append(f"{phase}: missing structured_response")
-            update = {"phases": state.phases, "errors": state.errors}
-            validate_state_update(update, owner="problem_framing")
-            return Command(update=update, goto=goto)
-
-        pf = validate_structured_response(pf, ProblemFrame)
-
-        logger.info("problem_framing.success", phase=phase)
-
-        # Use adapter to convert evidence from DTO to EvidenceItem models
-        evidence_items = evidence_to_items(evidence_bundle)
-        state.phases[phase] = PhaseEntry(
-            data=pf.model_dump(),
-            status="complete",
-            evidence=evidence_items,
-        )
+    return node_problem_framing
 
-        # Create user-facing response message
-        response_message = _format_problem_frame_response(pf)
 
-        update: dict[str, Any] = {
-            "phases": state.phases,
-            "messages": [AIMessage(content=response_message)],
-        }
-        if include_errors:
-            update["errors"] = state.errors
-        validate_state_update(update, owner="problem_framing")
-        return Command(update=update, goto=goto)
+def make_node_problem_framing_async(
+    agent: Runnable,
+    *,
+    phase: str = "problem_framing",
+    max_context_items: int = 8,
+    goto: ProblemFramingRoute = "phase_supervisor",
+    stream_partial: bool = False,
+) -> NodeWithRuntime[SageState, Awaitable[Command[ProblemFramingRoute]]]:
+    """Node: problem_framing (async).
 
-    return node_problem_framing
+    Purpose:
+        Same as `make_node_problem_framing` (arguments mirror it), but hydrates
+        evidence via `store.abatch` and calls `agent.ainvoke` (`astream` with
+        `stream_partial`). Requires an async graph run (`ainvoke`/`astream`, as
+        on LangGraph Server).
+
+    Returns:
+        An async node routing back to `supervisor`.
+    """
+
+    async def anode_problem_framing(
+        state: SageState,
+        *,
+        runtime: Runtime[SageRuntimeContext],
+    ) -> Command[ProblemFramingRoute]:
+        evidence_bundle = await acollect_phase_evidence(state, phase=phase, max_items=max_context_items)
+        agent_input, include_errors = _agent_input(state, phase, evidence_bundle)
+        result = (
+            await astream_agent(
+                agent, agent_input, schema_name=ProblemFrame.__name__, on_partial=_partial_writer(runtime, phase)
+            )
+            if stream_partial
+            else await agent.ainvoke(agent_input)
+        )
+        return _framing_command(
+            state,
+            result,
+            phase=phase,
+            evidence_bundle=evidence_bundle,
+            include_errors=include_errors,
+            goto=goto,
+        )
+
+    return anode_problem_framing
@@ -2,20 +2,26 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Literal
+from collections.abc import Awaitable, Callable, Mapping
+from typing import TYPE_CHECKING, Literal
 
 from langgraph.types import Command
 
 from app.platform.adapters.events import emit_event
+from app.platform.adapters.evidence import documents_to_evidence
 from app.platform.adapters.logging import get_logger
 from app.platform.adapters.node import NodeWithRuntime
 from app.platform.adapters.phases import update_phases_dict
+from app.platform.core.contract.phases import ContextFilter, RetrievalPolicy
 from app.platform.core.contract.state import validate_state_update
+from app.platform.runtime.phase_lookup import aphase_lookup, phase_lookup
+from app.platform.runtime.retrieval_prefetch import DEFAULT_PREFETCH_WAIT_SECONDS, get_prefetcher, prefetch_key
 from app.platform.runtime.state_helpers import get_latest_user_input
-from app.state import EvidenceItem, PhaseEntry
+from app.state import PhaseEntry
 from app.tools.context_lookup import context_lookup
 
 if TYPE_CHECKING:
+    from langchain_core.documents import Document
     from langchain_core.runnables import Runnable
     from langgraph.runtime import Runtime
 
@@ -27,6 +33,85 @@ logger = get_logger("nodes.retrieve_context")
 
 RetrieveContextRoute = Literal["ambiguity_supervisor", "supervisor"]
 
+# Starts a background lookup for (target phase, query); see `make_context_prefetch`.
+ContextPrefetch = Callable[[str, str], None]
+
+
+def _missing_target_command(goto: RetrieveContextRoute) -> Command[RetrieveContextRoute]:
+    logger.warning("retrieve_context.missing_target_step")
+    update = emit_event(owner="retrieve_context", kind="error", message="Unable to determine retrieval target.")
+    validate_state_update(update, owner="retrieve_context")
+    return Command(update=update, goto=goto)
+
+
+def _evidence_command(
+    state: SageState, target_phase: str, ranked: list[Document], goto: RetrieveContextRoute
+) -> Command[RetrieveContextRoute]:
+    """Store the ranked documents as the phase evidence."""
+    # Evidence carries the retrieved values, so hydration does not re-read the Store.
+    evidence = documents_to_evidence(ranked)
+
+    logger.info(
+        "retrieve_context.complete",
+        phase=target_phase,
+        results=len(evidence),
+    )
+
+    # Use adapter to update phase entry with evidence
+    existing_entry = state.phases.get(target_phase) or PhaseEntry()
+    updated_entry = PhaseEntry(
+        data=existing_entry.data,
+        error=existing_entry.error,
+        status=existing_entry.status,
+        evidence=evidence,
+    )
+    phases = update_phases_dict(state.phases, target_phase, updated_entry)
+
+    event_update = emit_event(
+        owner="retrieve_context",
+        kind="progress",
+        message=f"Retrieved {len(evidence)} context items.",
+        phase=target_phase,
+    )
+    update = {"phases": phases, **event_update}
+    validate_state_update(update, owner="retrieve_context")
+    return Command(
+        update=update,
+        goto=goto,
+    )
+
+
+def make_context_prefetch(
+    tool: Runnable | None = None,
+    *,
+    collection: str | None = None,
+    retrieval_policies: Mapping[str, RetrievalPolicy] | None = None,
+    context_filter: ContextFilter | None = None,
+) -> ContextPrefetch:
+    """Build a hook that starts the `retrieve_context` lookup of a phase in the background.
+
+    Args mirror `make_node_retrieve_context`, so the prefetched documents match what
+    the node would retrieve. Results are claimed through `get_prefetcher()`.
+    """
+    resolved_tool = tool or context_lookup
+    policies = retrieval_policies or {}
+
+    def prefetch(target_phase: str, query: str) -> None:
+        started = get_prefetcher().start(
+            prefetch_key(target_phase, query),
+            lambda: phase_lookup(
+                resolved_tool,
+                query,
+                target_phase,
+                collection=collection,
+                policies=policies,
+                context_filter=context_filter,
+            ),
+        )
+        logger.info("retrieve_context.prefetch", phase=target_phase, started=started)
+
+    return prefetch
+
 
 def make_node_retrieve_context(
     tool: Runnable | None = None,
@@ -34,6 +119,9 @@ def make_node_retrieve_context(
     phase: str | None = None,
     collection: str | None = None,
     goto: RetrieveContextRoute = "supervisor",
+    retrieval_policies: Mapping[str, RetrievalPolicy] | None = None,
+    context_filter: ContextFilter | None = None,
+    prefetch_wait_seconds: float = DEFAULT_PREFETCH_WAIT_SECONDS,
 ) -> NodeWithRuntime[SageState, Command[RetrieveContextRoute]]:
     """Node: retrieve_context.
 
@@ -43,8 +131,15 @@ def make_node_retrieve_context(
     Args:
         tool: DI-injected lookup tool runnable.
         phase: Optional phase key to update in `state.phases`.
-        collection: Optional store namespace segment used for retrieval.
+        collection: Optional store namespace segment used for retrieval. Overrides the
+            phase policy's `collections`.
         goto: Node name to route to after completion.
+        retrieval_policies: Re-ranking policy per phase (from `PhaseContract.retrieval`).
+            Phases without one keep the lookup results as returned.
+        context_filter: Tag/recency filter passed to the lookup tool (pushed into
+            `store.search`). Defaults to the target phase policy's `context_filter`.
+        prefetch_wait_seconds: How long to wait for a prefetched lookup of the same
+            phase and query (see `make_context_prefetch`) before searching inline.
 
     Side effects/state writes:
         Updates `state.phases[phase].evidence` with retrieved EvidenceItem entries.
@@ -54,76 +149,79 @@ def make_node_retrieve_context(
         A Command routing back to `supervisor`.
     """
     tool = tool or context_lookup
+    policies = retrieval_policies or {}
 
     def node_retrieve_context(
         state: SageState,
         *,
         runtime: Runtime[SageRuntimeContext],
     ) -> Command[RetrieveContextRoute]:
-        update: dict[str, Any]
         query = get_latest_user_input(state.messages) or ""
         target_phase = phase or state.ambiguity.target_step
         if not target_phase:
-            logger.warning("retrieve_context.missing_target_step")
-            update = emit_event(owner="retrieve_context", kind="error", message="Unable to determine retrieval target.")
-            validate_state_update(update, owner="retrieve_context")
-            return Command(
-                update=update,
-                goto=goto,
-            )
-        collection_name = collection or target_phase
-
+            return _missing_target_command(goto)
         logger.info("retrieve_context.start", phase=target_phase, query=query)
 
-        results = (
-            tool.invoke(
-                {
-                    "query": query,
-                    "collection": collection_name,
-                }
+        # A lookup prefetched by the ambiguity supervisor is claimed instead of searching again.
+        ranked = get_prefetcher().take(prefetch_key(target_phase, query), timeout=prefetch_wait_seconds)
+        if ranked is None:
+            ranked = phase_lookup(
+                tool,
+                query,
+                target_phase,
+                collection=collection,
+                policies=policies,
+                context_filter=context_filter,
             )
-            or []
-        )
+        return _evidence_command(state, target_phase, ranked, goto)
 
-        evidence: list[EvidenceItem] = []
-        for d in results:
-            md = d.metadata or {}
-            ns = md.get("store_namespace")
-            key = md.get("store_key")
-            score = md.get("score")
-
-            if ns and key:
-                score_value = float(score) if isinstance(score, (int, float)) else 0.0
-                e = EvidenceItem(namespace=ns, key=key, score=score_value)
-                evidence.append(e)
-
-        logger.info(
-            "retrieve_context.complete",
-            phase=target_phase,
-            results=len(evidence),
-        )
+    return node_retrieve_context
 
-        # Use adapter to update phase entry with evidence
-        existing_entry = state.phases.get(target_phase) or PhaseEntry()
-        updated_entry = PhaseEntry(
-            data=existing_entry.data,
-            error=existing_entry.error,
-            status=existing_entry.status,
-            evidence=evidence,
-        )
-        phases = update_phases_dict(state.phases, target_phase, updated_entry)
 
-        event_update = emit_event(
-            owner="retrieve_context",
-            kind="progress",
-            message=f"Retrieved {len(evidence)} context items.",
-            phase=target_phase,
-        )
-        update = {"phases": phases, **event_update}
-        validate_state_update(update, owner="retrieve_context")
-        return Command(
-            update=update,
-            goto=goto,
-        )
+def make_node_retrieve_context_async(
+    tool: Runnable | None = None,
+    *,
+    phase: str | None = None,
+    collection: str | None = None,
+    goto: RetrieveContextRoute = "supervisor",
+    retrieval_policies: Mapping[str, RetrievalPolicy] | None = None,
+    context_filter: ContextFilter | None = None,
+    prefetch_wait_seconds: float = DEFAULT_PREFETCH_WAIT_SECONDS,
+) -> NodeWithRuntime[SageState, Awaitable[Command[RetrieveContextRoute]]]:
+    """Node: retrieve_context (async).
 
-    return node_retrieve_context
+    Purpose:
+        Same as `make_node_retrieve_context` (arguments mirror it), but searches via
+        `ainvoke`/`abatch` and awaits prefetched lookups without blocking the event
+        loop. Requires an async graph run (`ainvoke`/`astream`, as on LangGraph Server).
+
+    Returns:
+        An async node routing back to `supervisor`.
+    """
+    tool = tool or context_lookup
+    policies = retrieval_policies or {}
+
+    async def anode_retrieve_context(
+        state: SageState,
+        *,
+        runtime: Runtime[SageRuntimeContext],
+    ) -> Command[RetrieveContextRoute]:
+        query = get_latest_user_input(state.messages) or ""
+        target_phase = phase or state.ambiguity.target_step
+        if not target_phase:
+            return _missing_target_command(goto)
+        logger.info("retrieve_context.start", phase=target_phase, query=query)
+
+        ranked = await get_prefetcher().atake(prefetch_key(target_phase, query), timeout=prefetch_wait_seconds)
+        if ranked is None:
+            ranked = await aphase_lookup(
+                tool,
+                query,
+                target_phase,
+                collection=collection,
+                policies=policies,
+                context_filter=context_filter,
+            )
+        return _evidence_command(state, target_phase, ranked, goto)
+
+    return anode_retrieve_context
@@ -0,0 +1,53 @@
+"""Node for listing stored vector content as a delta-sync manifest."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Literal
+
+from langgraph.types import Command
+
+from app.platform.adapters.logging import get_logger
+from app.platform.adapters.node import NodeWithRuntime
+from app.platform.runtime.vector_manifest import DEFAULT_MANIFEST_PAGE_SIZE, build_vector_manifest
+
+if TYPE_CHECKING:
+    from langgraph.runtime import Runtime
+
+    from app.runtime import SageRuntimeContext
+    from app.state import VectorManifestState
+
+
+def make_node_vector_manifest(
+    *,
+    page_size: int = DEFAULT_MANIFEST_PAGE_SIZE,
+) -> NodeWithRuntime[VectorManifestState, Command[Literal["__end__"]]]:
+    """Node: vector_manifest.
+
+    Purpose:
+        Return `(uuid, changed, content_hash)` for every item stored under a namespace
+        prefix so sync clients can diff locally and send only changed items.
+
+    Args:
+        page_size: Items fetched per Store search page.
+
+    Side effects/state writes:
+        Reads the LangGraph Store via `build_vector_manifest`.
+        Updates `state.manifest`.
+
+    Returns:
+        A Command routing to END with the manifest.
+    """
+    logger = get_logger("nodes.vector_manifest")
+
+    def node_vector_manifest(
+        state: VectorManifestState,
+        *,
+        runtime: Runtime[SageRuntimeContext],
+    ) -> Command[Literal["__end__"]]:
+        namespace_prefix = state.get("namespace_prefix") or None
+        entries = build_vector_manifest(namespace_prefix, page_size=page_size)
+        logger.info("vector_manifest.done", namespace_prefix=namespace_prefix, count=len(entries))
+        return Command(update={"manifest": [asdict(entry) for entry in entries]}, goto="__end__")
+
+    return node_vector_manifest
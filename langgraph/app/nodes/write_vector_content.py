@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+from collections.abc import Awaitable
+from dataclasses import asdict
 from typing import TYPE_CHECKING, Literal
 
 from langgraph.types import Command
 
 from app.platform.adapters.logging import get_logger
 from app.platform.adapters.node import NodeWithRuntime
-from app.tools.vector_writer import write_to_vectorstore
+from app.platform.runtime.vector_write_pool import WritePoolSettings, awrite_vector_items
+from app.platform.runtime.vector_writes import DEFAULT_WRITE_CHUNK_SIZE, write_vector_batch
+from app.platform.utils.chunking import ChunkingConfig, get_chunking_config
 
 if TYPE_CHECKING:
     from langgraph.runtime import Runtime
@@ -17,19 +21,32 @@ if TYPE_CHECKING:
     from app.state import VectorWriteState
 
 
-def make_node_write_vector() -> NodeWithRuntime[VectorWriteState, Command[Literal["__end__"]]]:
+def make_node_write_vector(
+    *,
+    chunk_size: int = DEFAULT_WRITE_CHUNK_SIZE,
+    chunking: ChunkingConfig | None = None,
+) -> NodeWithRuntime[VectorWriteState, Command[Literal["__end__"]]]:
     """Node: vector_writer.
 
     Purpose:
-        Write vector content items to the LangGraph Store using the vector writer tool.
+        Write vector content items to the LangGraph Store in batches. Long texts are split
+        into `uuid#n` chunk records, unchanged records are found with one `GetOp` sweep and
+        the remaining puts are sent in chunks. Tombstoned items (`deleted`) and copies in
+        namespaces an item no longer lists are purged with batched deletes.
+
+    Args:
+        chunk_size: Max put operations sent to the Store per batch call.
+        chunking: Text chunking settings. Defaults to `config/embeddings.yaml`.
 
     Side effects/state writes:
-        Writes to the LangGraph Store via `write_to_vectorstore`.
+        Writes to the LangGraph Store via `write_vector_batch`.
+        Updates `state.report` with write counts and per-chunk timings.
 
     Returns:
         A Command routing to END after processing all items.
     """
     logger = get_logger("nodes.vector_writer")
+    resolved_chunking = chunking or get_chunking_config()
 
     def node_write_vector(
         state: VectorWriteState,
@@ -37,35 +54,88 @@ def make_node_write_vector() -> NodeWithRuntime[VectorWriteState, Command[Litera
         runtime: Runtime[SageRuntimeContext],
     ) -> Command[Literal["__end__"]]:
         items = state.get("items") or []
-        logger.info("vector_writer.batch.start", count=len(items))
+        logger.info("vector_writer.batch.start", count=len(items), chunk_size=chunk_size)
 
-        for item in items:
-            # content = plain text
-            content = item.get("text", "") or ""
+        report = write_vector_batch(items, chunk_size=chunk_size, chunking=resolved_chunking)
 
-            # write into agent namespace(s)
-            agents = item.get("agents") or []
-            for agent in agents:
-                collection = agent  # e.g. "problem_framing"
+        for chunk in report.chunks:
+            logger.info("vector_writer.chunk", index=chunk.index, ops=chunk.ops, seconds=chunk.seconds)
 
-                metadata = {
-                    "uuid": item.get("uuid"),
-                    "title": item.get("title", ""),
-                    "tags": item.get("tags") or [],
-                    "agents": agents,
-                    "changed": item.get("changed", 0),
-                }
+        logger.info(
+            "vector_writer.batch.done",
+            count=len(items),
+            requested=report.requested,
+            written=report.written,
+            skipped=report.skipped,
+            deleted=report.deleted,
+            lookup_seconds=report.lookup_seconds,
+        )
+        return Command(update={"report": asdict(report)}, goto="__end__")
 
-                logger.info(
-                    "vector_writer.write",
-                    uuid=metadata["uuid"],
-                    collection=collection,
-                    content_length=len(content),
-                )
+    return node_write_vector
 
-                write_to_vectorstore(content, collection, metadata)
 
-        logger.info("vector_writer.batch.done", count=len(items))
-        return Command(goto="__end__")
+def make_node_write_vector_async(
+    *,
+    settings: WritePoolSettings | None = None,
+    chunk_size: int = DEFAULT_WRITE_CHUNK_SIZE,
+    chunking: ChunkingConfig | None = None,
+) -> NodeWithRuntime[VectorWriteState, Awaitable[Command[Literal["__end__"]]]]:
+    """Node: vector_writer (async, concurrent).
 
-    return node_write_vector
+    Purpose:
+        Write vector content items with the batched plan of `vector_writer`, sending
+        up to `settings.concurrency` chunks at once via `store.abatch`. Failed chunks
+        are retried with exponential backoff; items in chunks that still fail are
+        reported instead of aborting the batch. Requires an async graph run
+        (`ainvoke`/`astream`, as on LangGraph Server).
+
+    Args:
+        settings: Concurrency and retry settings. Defaults to `WritePoolSettings()`.
+        chunk_size: Max put operations sent to the Store per batch call.
+        chunking: Text chunking settings. Defaults to `config/embeddings.yaml`.
+
+    Side effects/state writes:
+        Writes to the LangGraph Store via `awrite_vector_items`.
+        Updates `state.report` with write counts and failed items.
+
+    Returns:
+        A Command routing to END after processing all items.
+    """
+    logger = get_logger("nodes.vector_writer")
+    resolved_settings = settings or WritePoolSettings()
+    resolved_chunking = chunking or get_chunking_config()
+
+    async def anode_write_vector(
+        state: VectorWriteState,
+        *,
+        runtime: Runtime[SageRuntimeContext],
+    ) -> Command[Literal["__end__"]]:
+        items = state.get("items") or []
+        logger.info("vector_writer.batch.start", count=len(items), concurrency=resolved_settings.concurrency)
+
+        report = await awrite_vector_items(
+            items,
+            concurrency=resolved_settings.concurrency,
+            max_attempts=resolved_settings.max_attempts,
+            backoff_seconds=resolved_settings.backoff_seconds,
+            chunk_size=chunk_size,
+            chunking=resolved_chunking,
+        )
+
+        for failure in report.failed:
+            logger.warning(
+                "vector_writer.item_failed", uuid=failure.uuid, attempts=failure.attempts, error=failure.error
+            )
+
+        logger.info(
+            "vector_writer.batch.done",
+            count=len(items),
+            written=report.written,
+            skipped=report.skipped,
+            deleted=report.deleted,
+            failed=len(report.failed),
+        )
+        return Command(update={"report": asdict(report)}, goto="__end__")
+
+    return anode_write_vector
@@ -14,6 +14,7 @@ They are the primary mechanism for maintaining core purity.
 - **evidence.py**: EvidenceBundle DTO ↔ EvidenceItem/PhaseEntry state models
   - `evidence_to_items()`: DTO → State
   - `items_to_evidence_dicts()`: State → DTO
+  - `documents_to_evidence()`: `context_lookup` Documents → State (carries stored values)
   - `update_phase_evidence()`: Merge DTO into State
   - `collect_phase_evidence()`: Runtime wrapper with logging
 
@@ -10,8 +10,14 @@ with logging and other wiring concerns.
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+
+from langchain_core.documents import Document
+
 from app.platform.core.dto.evidence import EvidenceBundle
 from app.platform.observability.logger import get_logger
+from app.platform.runtime.evidence import EVIDENCE_VALUE_FIELDS
+from app.platform.runtime.evidence import acollect_phase_evidence as _acollect_phase_evidence
 from app.platform.runtime.evidence import collect_phase_evidence as _collect_phase_evidence
 from app.state import EvidenceItem, PhaseEntry, SageState
 
@@ -40,7 +46,43 @@ def items_to_evidence_dicts(items: list[EvidenceItem]) -> list[dict]:
     Returns:
         List of evidence dicts for use in core DTO.
     """
-    return [{"namespace": item.namespace, "key": item.key, "score": item.score} for item in items]
+    return [item.model_dump(exclude_none=True) for item in items]
+
+
+def documents_to_evidence(docs: Iterable[Document]) -> list[EvidenceItem]:
+    """Convert `context_lookup` Documents into EvidenceItem models carrying their value.
+
+    The stored value is rebuilt from `page_content` and the stored fields in the
+    Document metadata, so hydration does not read the Store again.
+
+    Args:
+        docs: Documents with `store_namespace`/`store_key` provenance metadata.
+
+    Returns:
+        EvidenceItem models; documents without provenance are skipped.
+    """
+    evidence: list[EvidenceItem] = []
+    for doc in docs:
+        metadata = doc.metadata or {}
+        namespace = metadata.get("store_namespace")
+        key = metadata.get("store_key")
+        if not namespace or not key:
+            continue
+        # Multi-collection lookups rank by weighted, normalized `relevance`.
+        score = metadata.get("relevance", metadata.get("score"))
+        value = {
+            "text": doc.page_content,
+            **{field: metadata[field] for field in EVIDENCE_VALUE_FIELDS if field in metadata},
+        }
+        evidence.append(
+            EvidenceItem(
+                namespace=list(namespace),
+                key=key,
+                score=float(score) if isinstance(score, (int, float)) else 0.0,
+                value=value,
+            )
+        )
+    return evidence
 
 
 def update_phase_evidence(
@@ -65,6 +107,17 @@ def update_phase_evidence(
     )
 
 
+def _log_missing_store(bundle: EvidenceBundle, phase: str) -> EvidenceBundle:
+    if bundle.missing_store and bundle.evidence:
+        logger = get_logger("adapter.evidence")
+        logger.warning(
+            "adapter.evidence.missing_store",
+            phase=phase,
+            evidence_count=len(bundle.evidence),
+        )
+    return bundle
+
+
 def collect_phase_evidence(
     state: SageState,
     *,
@@ -84,12 +137,14 @@ def collect_phase_evidence(
     Returns:
         EvidenceBundle DTO with collected evidence.
     """
-    bundle = _collect_phase_evidence(state, phase=phase, max_items=max_items)
-    if bundle.missing_store and bundle.evidence:
-        logger = get_logger("adapter.evidence")
-        logger.warning(
-            "adapter.evidence.missing_store",
-            phase=phase,
-            evidence_count=len(bundle.evidence),
-        )
-    return bundle
+    return _log_missing_store(_collect_phase_evidence(state, phase=phase, max_items=max_items), phase)
+
+
+async def acollect_phase_evidence(
+    state: SageState,
+    *,
+    phase: str,
+    max_items: int = 8,
+) -> EvidenceBundle:
+    """Async variant of `collect_phase_evidence` (Store reads via `abatch`)."""
+    return _log_missing_store(await _acollect_phase_evidence(state, phase=phase, max_items=max_items), phase)
@@ -48,7 +48,7 @@ def phase_entry_to_result(
         Core DTO with phase data.
     """
     # Convert EvidenceItem models to dicts
-    evidence_dicts = [{"namespace": item.namespace, "key": item.key, "score": item.score} for item in entry.evidence]
+    evidence_dicts = [item.model_dump(exclude_none=True) for item in entry.evidence]
 
     return PhaseResult(
         phase_name=phase_name,
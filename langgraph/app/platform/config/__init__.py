@@ -22,6 +22,7 @@ from app.platform.config.paths import (
     UNSTRUCTURED_ROOT,
     VECTOR_DIR,
 )
+from app.platform.config.watch import build_input_files, files_signature
 
 __all__ = [
     "AGENTS_DIR",
@@ -41,5 +42,7 @@ __all__ = [
     "UNSTRUCTURED_ROOT",
     "VECTOR_DIR",
     "FileLoader",
+    "build_input_files",
+    "files_signature",
     "load_project_env",
 ]
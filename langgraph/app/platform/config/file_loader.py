@@ -213,3 +213,29 @@ class FileLoader:
         """
         file_path = CONFIG_DIR / "guardrails.yaml"
         return cls._read_yaml(file_path, category="config")
+
+    @classmethod
+    @cache
+    def load_embeddings_config(cls) -> dict[str, Any]:
+        """Loads embeddings.yaml from the top-level config/ dir.
+
+        Raises:
+            FileNotFoundError: Embeddings config does not exist
+            yaml.YAMLError: Invalid YAML syntax
+        """
+        file_path = CONFIG_DIR / "embeddings.yaml"
+        return cls._read_yaml(file_path, category="config")
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget every cached file read so edited prompts and configs are re-read."""
+        for loader in (
+            cls.load_yaml,
+            cls.load_prompt,
+            cls.load_schema,
+            cls.load_agent_config,
+            cls.load_provider_config,
+            cls.load_guardrails_config,
+            cls.load_embeddings_config,
+        ):
+            loader.cache_clear()
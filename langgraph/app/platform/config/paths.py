@@ -26,6 +26,7 @@ PROVIDER_CONFIG_DIR = CONFIG_DIR / "provider"
 # Data - temp
 DATA_DIR = BACKEND_ROOT / "data"
 VECTOR_DIR = DATA_DIR / "vector_store"
+CACHE_DIR = DATA_DIR / "cache"
 UNSTRUCTURED_ROOT = DATA_DIR / "unstructured"
 
 # Output - temp
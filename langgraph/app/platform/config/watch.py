@@ -0,0 +1,40 @@
+"""Change detection for the prompt and config files graphs are built from."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from pathlib import Path
+
+from app.platform.config.paths import AGENTS_DIR, CONFIG_DIR, PROVIDER_CONFIG_DIR
+
+FileSignature = tuple[tuple[str, int, int], ...]
+
+_AGENT_FILE_SUFFIXES = frozenset({".prompt", ".json", ".yaml"})
+
+
+def build_input_files() -> list[Path]:
+    """Return the prompt and config files read while agents and graphs are built.
+
+    Covers agent prompts, examples and `config.yaml` files, provider configs,
+    `guardrails.yaml` and `embeddings.yaml` (Store, retrieval and chunking settings).
+    """
+    agent_files = (path for path in AGENTS_DIR.rglob("*") if path.suffix in _AGENT_FILE_SUFFIXES)
+    config_files = [CONFIG_DIR / "guardrails.yaml", CONFIG_DIR / "embeddings.yaml"]
+    return sorted([*agent_files, *PROVIDER_CONFIG_DIR.glob("*.yaml"), *config_files])
+
+
+def files_signature(paths: Iterable[Path] | None = None) -> FileSignature:
+    """Return (path, mtime, size) for each file; missing files are recorded as (path, 0, -1).
+
+    Args:
+        paths: Files to stat. Defaults to `build_input_files()`.
+    """
+    signature: list[tuple[str, int, int]] = []
+    for path in build_input_files() if paths is None else paths:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            signature.append((str(path), 0, -1))
+        else:
+            signature.append((str(path), stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
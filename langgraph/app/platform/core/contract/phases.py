@@ -8,6 +8,47 @@ from langchain_core.runnables import Runnable
 from pydantic import BaseModel, Field
 
 
+class ContextFilter(BaseModel):
+    """Structured filter applied inside the Store search of a context lookup."""
+
+    tags: list[str] = Field(default_factory=list, description="Tags every result must carry.")
+    exclude_tags: list[str] = Field(default_factory=list, description="Tags no result may carry.")
+    changed_since: int | None = Field(default=None, description="Only items changed at or after this Unix timestamp.")
+
+
+class RetrievalPolicy(BaseModel):
+    """Re-ranking applied to context retrieved for a phase.
+
+    The defaults keep the lookup order and size unchanged (no cutoff, no
+    de-duplication, no MMR).
+    """
+
+    top_k: int = Field(default=8, ge=1, description="Documents kept after re-ranking.")
+    fetch_k: int = Field(default=8, ge=1, description="Candidates fetched from the lookup before re-ranking.")
+    min_score: float | None = Field(
+        default=None, description="Drop documents whose similarity score is below this floor."
+    )
+    duplicate_threshold: float | None = Field(
+        default=None,
+        gt=0.0,
+        le=1.0,
+        description="Collapse documents whose text similarity to a better-ranked one reaches this value.",
+    )
+    mmr_lambda: float | None = Field(
+        default=None,
+        ge=0.0,
+        le=1.0,
+        description="Maximal marginal relevance trade-off (1.0 = relevance only); None disables MMR.",
+    )
+    context_filter: ContextFilter = Field(
+        default_factory=ContextFilter, description="Tag and recency filter pushed into the Store search."
+    )
+    collections: dict[str, float] = Field(
+        default_factory=dict,
+        description="Collections searched concurrently, with score weights; empty searches the phase collection.",
+    )
+
+
 class PhaseContract(BaseModel):
     """Defines a reusable execution contract for a single phase.
 
@@ -16,9 +57,15 @@ class PhaseContract(BaseModel):
     """
 
     name: str = Field(..., description="Unique identifier of the phase (used as graph node key).")
-    build_graph: Callable[[], Runnable] = Field(..., description="Function to build the LangGraph subgraph.")
+    build_graph: Callable[..., Runnable] = Field(
+        ...,
+        description="Function to build the LangGraph subgraph (optionally called with `async_nodes=True`).",
+    )
     output_schema: type[BaseModel] = Field(..., description="Structured output schema produced by the phase.")
     description: str = Field(..., description="Human-readable summary of what the phase does.")
     requires_evidence: bool = Field(default=False, description="Whether the phase expects supporting RAG context.")
     retrieval_enabled: bool = Field(default=False, description="Whether retrieval is enabled for this phase.")
     clarification_enabled: bool = Field(default=True, description="Whether ambiguity clarification loop is enabled.")
+    retrieval: RetrievalPolicy = Field(
+        default_factory=RetrievalPolicy, description="Re-ranking applied to context retrieved for the phase."
+    )
@@ -3,12 +3,17 @@
 from app.platform.core.dto.errors import ErrorEntry, ErrorSeverity
 from app.platform.core.dto.events import EventKind, TraceEvent
 from app.platform.core.dto.phases import PhaseResult, PhaseStatus
+from app.platform.core.dto.vector_writes import FailedWriteItem, ManifestEntry, VectorWriteReport, WriteChunkTiming
 
 __all__ = [
     "ErrorEntry",
     "ErrorSeverity",
     "EventKind",
+    "FailedWriteItem",
+    "ManifestEntry",
     "PhaseResult",
     "PhaseStatus",
     "TraceEvent",
+    "VectorWriteReport",
+    "WriteChunkTiming",
 ]
@@ -0,0 +1,75 @@
+"""Core DTOs for batched vector writes and delta-sync manifests."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class WriteChunkTiming:
+    """Timing for one chunk of Store put operations.
+
+    Attributes:
+        index: Zero-based chunk position within the batch.
+        ops: Number of put operations sent in the chunk.
+        seconds: Wall-clock duration of the chunk round trip(s).
+    """
+
+    index: int
+    ops: int
+    seconds: float
+
+
+@dataclass(frozen=True)
+class FailedWriteItem:
+    """Item that could not be written after all attempts.
+
+    Attributes:
+        uuid: Item UUID (empty when the payload had none).
+        error: Exception type and message of the last attempt.
+        attempts: Attempts made before giving up.
+    """
+
+    uuid: str
+    error: str
+    attempts: int
+
+
+@dataclass(frozen=True)
+class VectorWriteReport:
+    """Outcome of a batched vector write.
+
+    Counts are per (item, agent namespace) pair, since each pair is one Store record.
+
+    Attributes:
+        requested: Records the batch asked to write.
+        written: Records sent to the Store.
+        skipped: Records left untouched because the stored copy is not older.
+        deleted: Delete operations sent for superseded records (e.g. trailing chunks).
+        lookup_seconds: Duration of the multi-key existence sweep.
+        chunks: Per-chunk put timings, in send order.
+        failed: Items reported as failed instead of aborting the batch.
+    """
+
+    requested: int = 0
+    written: int = 0
+    skipped: int = 0
+    deleted: int = 0
+    lookup_seconds: float = 0.0
+    chunks: tuple[WriteChunkTiming, ...] = field(default_factory=tuple)
+    failed: tuple[FailedWriteItem, ...] = field(default_factory=tuple)
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """Compact fingerprint of one stored context item for client-side diffing.
+
+    Attributes:
+        uuid: Item UUID (the Store key).
+        changed: Oldest `changed` timestamp across the item's agent namespaces.
+        content_hash: SHA-256 hex digest of the stored text.
+    """
+
+    uuid: str
+    changed: int
+    content_hash: str
@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
-from app.platform.runtime.evidence import collect_phase_evidence, hydrate_evidence_docs
+from app.platform.runtime.evidence import (
+    acollect_phase_evidence,
+    ahydrate_evidence_docs,
+    collect_phase_evidence,
+    hydrate_evidence_docs,
+)
 from app.platform.runtime.phases import get_phase_names
 from app.platform.runtime.prompting import (
     build_llm_messages,
@@ -11,19 +16,30 @@ from app.platform.runtime.prompting import (
     get_user_messages,
 )
 from app.platform.runtime.state_helpers import (
+    evidence_fingerprint,
     format_ambiguity_key,
     get_clarified_keys,
     get_current_clarifying_question,
     get_latest_user_input,
     get_pending_ambiguity_keys,
     get_pending_ambiguity_questions,
+    messages_fingerprint,
     phase_to_node,
     reset_clarification_context,
 )
+from app.platform.runtime.vector_ingest import aingest_vector_items, ingest_vector_items, iter_ndjson_items
+from app.platform.runtime.vector_manifest import build_vector_manifest
+from app.platform.runtime.vector_writes import awrite_vector_batch, write_vector_batch
 
 __all__ = [
+    "acollect_phase_evidence",
+    "ahydrate_evidence_docs",
+    "aingest_vector_items",
+    "awrite_vector_batch",
     "build_llm_messages",
+    "build_vector_manifest",
     "collect_phase_evidence",
+    "evidence_fingerprint",
     "format_ambiguity_key",
     "get_ai_messages",
     "get_clarified_keys",
@@ -35,6 +51,10 @@ __all__ = [
     "get_phase_names",
     "get_user_messages",
     "hydrate_evidence_docs",
+    "ingest_vector_items",
+    "iter_ndjson_items",
+    "messages_fingerprint",
     "phase_to_node",
     "reset_clarification_context",
+    "write_vector_batch",
 ]
@@ -0,0 +1,223 @@
+"""Steps shared by the sync and async ambiguity scan nodes.
+
+The nodes differ only in how they claim prefetched evidence, hydrate it and call
+the agent; building the request and turning the validated scan into a Command
+live here.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Literal
+
+from langgraph.types import Command
+
+from app.platform.adapters.events import emit_event
+from app.platform.adapters.evidence import documents_to_evidence
+from app.platform.adapters.logging import get_logger
+from app.platform.adapters.phases import update_phases_dict
+from app.platform.core.contract.state import validate_state_update
+from app.platform.runtime.retrieval_prefetch import get_prefetcher, prefetch_key
+from app.platform.runtime.scan_cache import ScanResultCache
+from app.platform.runtime.state_helpers import (
+    evidence_fingerprint,
+    messages_fingerprint,
+    reset_clarification_context,
+)
+from app.state import PhaseEntry
+
+if TYPE_CHECKING:
+    from langchain_core.documents import Document
+
+    from app.platform.core.dto.evidence import EvidenceBundle
+    from app.schemas.ambiguities import AmbiguityItem
+    from app.state import SageState
+
+logger = get_logger("runtime.ambiguity_scan_steps")
+
+
+AmbiguityScanRoute = Literal[
+    "ambiguity_supervisor",
+    "phase_supervisor",
+    "supervisor",
+]
+
+
+@dataclass(frozen=True)
+class ScanSettings:
+    """Node factory arguments shared by the sync and async scan nodes."""
+
+    phase: str | None
+    max_context_items: int
+    importance_limit: Decimal
+    confidence_limit: Decimal
+    max_selected: int
+    goto: AmbiguityScanRoute
+    claim_prefetch: bool
+    result_cache: ScanResultCache | None
+
+
+@dataclass(frozen=True)
+class ScanRequest:
+    """One scan: its target, agent input and the evidence it was built from."""
+
+    target_phase: str
+    user_input: str
+    phase_entry: PhaseEntry
+    include_errors: bool
+    agent_input: dict[str, Any]
+    cache_key: str | None
+
+
+def _wants_prefetch(state: SageState, phase: str, claim_prefetch: bool) -> bool:
+    phase_entry = state.phases.get(phase) or PhaseEntry()
+    return claim_prefetch and not phase_entry.evidence
+
+
+def _adopt_prefetched(state: SageState, phase: str, docs: list[Document] | None) -> SageState:
+    """Return a state copy holding a prefetched lookup as the phase evidence, counted as a retrieval round.
+
+    The incoming state is left untouched; the copy's phases and ambiguity reach
+    the graph through the scan's Command update.
+    """
+    if docs is None:
+        return state
+    phase_entry = state.phases.get(phase) or PhaseEntry()
+    logger.info("ambiguity_scan.prefetched_evidence", phase=phase, results=len(docs))
+    return state.model_copy(
+        update={
+            "phases": {**state.phases, phase: phase_entry.model_copy(update={"evidence": documents_to_evidence(docs)})},
+            "ambiguity": state.ambiguity.model_copy(
+                update={"context_retrieval_round": state.ambiguity.context_retrieval_round + 1}
+            ),
+        }
+    )
+
+
+def with_prefetched_evidence(state: SageState, phase: str, query: str, claim_prefetch: bool) -> SageState:
+    """Return the state with the finished prefetched lookup of `phase` adopted as its evidence."""
+    # timeout=0: only a finished lookup is adopted. A slower one is left to the
+    # retrieve node, so the lookup overlaps this scan's agent call.
+    if not _wants_prefetch(state, phase, claim_prefetch):
+        return state
+    return _adopt_prefetched(state, phase, get_prefetcher().take(prefetch_key(phase, query), timeout=0.0))
+
+
+async def awith_prefetched_evidence(state: SageState, phase: str, query: str, claim_prefetch: bool) -> SageState:
+    """Async variant of `with_prefetched_evidence`."""
+    if not _wants_prefetch(state, phase, claim_prefetch):
+        return state
+    return _adopt_prefetched(state, phase, await get_prefetcher().atake(prefetch_key(phase, query), timeout=0.0))
+
+
+def missing_target_command(goto: AmbiguityScanRoute) -> Command[AmbiguityScanRoute]:
+    """Return the Command for a scan without a target phase."""
+    logger.warning("ambiguity_scan.missing_target_step")
+    update = emit_event(owner="ambiguity_scan", kind="error", message="Unable to determine ambiguity scan target.")
+    validate_state_update(update, owner="ambiguity_scan")
+    return Command(update=update, goto=goto)
+
+
+def scan_request(
+    state: SageState, target_phase: str, user_input: str, evidence_bundle: EvidenceBundle, settings: ScanSettings
+) -> ScanRequest:
+    """Build the agent input and result cache key of one scan."""
+    # Get phase_entry from state (not from bundle - keeping DTOs pure)
+    phase_entry = state.phases.get(target_phase) or PhaseEntry()
+    if evidence_bundle.missing_store:
+        state.errors.append(f"{target_phase}: runtime store unavailable for evidence hydration")
+    cache = settings.result_cache
+    return ScanRequest(
+        target_phase=target_phase,
+        user_input=user_input,
+        phase_entry=phase_entry,
+        include_errors=evidence_bundle.missing_store,
+        agent_input={
+            "task_input": user_input,
+            "messages": state.messages,
+            "context_docs": evidence_bundle.context_docs,
+        },
+        cache_key=(
+            cache.key(
+                target_phase,
+                user_input,
+                evidence_fingerprint(user_input, phase_entry.evidence),
+                history=messages_fingerprint(state.messages),
+            )
+            if cache is not None
+            else None
+        ),
+    )
+
+
+def missing_structured_command(
+    state: SageState, request: ScanRequest, goto: AmbiguityScanRoute
+) -> Command[AmbiguityScanRoute]:
+    """Return the Command for an agent response without a structured response."""
+    target_phase, phase_entry = request.target_phase, request.phase_entry
+    logger.warning("agent.missing_structured_response", phase=target_phase)
+    # Use adapter to update phase entry
+    updated_entry = PhaseEntry(
+        data=phase_entry.data,
+        error={
+            "code": "missing_structured_response",
+            "message": "Agent response missing structured_response.",
+        },
+        status="stale",
+        evidence=phase_entry.evidence,
+    )
+    phases = update_phases_dict(state.phases, target_phase, updated_entry)
+    state.errors.append(f"{target_phase}: missing structured_response")
+    update = {"phases": phases, "errors": state.errors}
+    validate_state_update(update, owner="ambiguity_scan")
+    return Command(update=update, goto=goto)
+
+
+def scan_command(
+    state: SageState, request: ScanRequest, ambiguities: list[AmbiguityItem], settings: ScanSettings
+) -> Command[AmbiguityScanRoute]:
+    """Select the high-priority ambiguities of a validated scan and route on them."""
+    target_phase = request.target_phase
+    high_priority = [
+        item
+        for item in ambiguities
+        if item.importance >= settings.importance_limit and item.confidence >= settings.confidence_limit
+    ]
+    high_priority.sort(
+        key=lambda priority_item: (priority_item.importance, priority_item.confidence),
+        reverse=True,
+    )
+    selected_ambiguities = high_priority[: settings.max_selected]
+
+    current_retrieval_round = state.ambiguity.context_retrieval_round
+    base_context = reset_clarification_context(
+        state,
+        target_step=target_phase,
+        context_retrieval_round=current_retrieval_round,
+        last_scan_retrieval_round=current_retrieval_round,
+    )
+    updated_context = base_context.model_copy(
+        update={
+            "target_step": target_phase,
+            "checked": True,
+            "eligible": not selected_ambiguities,
+            "detected": selected_ambiguities,
+            "context_retrieval_round": current_retrieval_round,
+            "last_scan_retrieval_round": current_retrieval_round,
+            "exhausted": False,
+            **({} if selected_ambiguities else {"resolved": []}),
+        }
+    )
+
+    if not selected_ambiguities:
+        summary = "No high-priority ambiguities detected."
+    else:
+        summary = "No ambiguities detected." if not ambiguities else f"Ambiguities detected: {len(ambiguities)}."
+
+    event_update = emit_event(owner="ambiguity_scan", kind="progress", message=summary, phase=target_phase)
+    update: dict[str, Any] = {"ambiguity": updated_context, "phases": state.phases, **event_update}
+    if request.include_errors:
+        update["errors"] = state.errors
+    validate_state_update(update, owner="ambiguity_scan")
+    return Command(update=update, goto=settings.goto)
@@ -1,27 +1,67 @@
-"""Evidence hydration helpers for runtime use."""
+"""Evidence hydration helpers for runtime use.
+
+Hydration reads the Store in at most two batched round trips: one `GetOp` batch for
+evidence that does not carry its value, then one for the neighbouring chunks used
+for stitching.
+"""
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
 
 from langchain_core.documents import Document
 from langgraph.config import get_store
-from langgraph.store.base import BaseStore
+from langgraph.store.base import BaseStore, GetOp, Item
 
 from app.platform.adapters.logging import get_logger
 from app.platform.core.dto.evidence import EvidenceBundle
+from app.platform.utils.chunking import chunk_key, get_chunking_config
 from app.state import EvidenceItem, PhaseEntry, SageState
 
 logger = get_logger("runtime.evidence")
 
+# Stored value fields that `context_lookup` surfaces as Document metadata, so evidence
+# can carry the value (with `page_content` as `text`) into hydration.
+EVIDENCE_VALUE_FIELDS = ("title", "tags", "agents", "changed", "uuid", "chunk_index", "chunk_count", "chunk_start")
+
+StoreKey = tuple[tuple[str, ...], str]
+EvidenceEntry = tuple[tuple[str, ...], str, float | None]
+StoredValues = dict[StoreKey, Mapping[str, Any] | None]
+
 
-def _extract_evidence_fields(item: EvidenceItem | dict) -> tuple[list[str] | None, str | None, float | None]:
+def stored_value_metadata(value: Mapping[str, Any]) -> dict[str, Any]:
+    """Return the Document metadata fields shared by retrieval and hydration."""
+    return {
+        "title": value.get("title", ""),
+        "tags": value.get("tags", []),
+        "agents": value.get("agents", []),
+        "changed": value.get("changed", 0),
+    }
+
+
+def _extract_evidence_fields(
+    item: EvidenceItem | dict,
+) -> tuple[list[str] | None, str | None, float | None, Mapping[str, Any] | None]:
     if isinstance(item, EvidenceItem):
-        return item.namespace, item.key, item.score
-    namespace = item.get("namespace")
-    key = item.get("key")
-    score = item.get("score")
-    return namespace, key, score
+        return item.namespace, item.key, item.score, item.value
+    return item.get("namespace"), item.get("key"), item.get("score"), item.get("value")
+
+
+def _evidence_entries(
+    evidence: Iterable[EvidenceItem | dict], max_items: int
+) -> tuple[list[EvidenceEntry], StoredValues]:
+    """Return valid evidence entries in input order and the values they already carry."""
+    entries: list[EvidenceEntry] = []
+    known: StoredValues = {}
+    for evidence_item in list(evidence or [])[:max_items]:
+        namespace, key, score, value = _extract_evidence_fields(evidence_item)
+        if not namespace or not key or not isinstance(namespace, (list, tuple)):
+            continue
+        entries.append((tuple(namespace), key, score))
+        if value:
+            known[(tuple(namespace), key)] = value
+    return entries, known
 
 
 def _get_runtime_store(phase: str) -> BaseStore | None:
@@ -36,83 +76,220 @@ def _get_runtime_store(phase: str) -> BaseStore | None:
     return store
 
 
-def hydrate_evidence_docs(
-    evidence: Iterable[EvidenceItem | dict],
-    *,
-    phase: str,
-    max_items: int = 8,
-    store: BaseStore | None = None,
-) -> list[Document]:
-    """Hydrate evidence items into LangChain Documents for downstream use."""
-    evidence_items = list(evidence or [])
-    if not evidence_items:
-        return []
+def _resolve_store(
+    store: BaseStore | None, phase: str, entries: Sequence[EvidenceEntry], known: StoredValues, neighbors: int
+) -> BaseStore | None:
+    """Fall back to the runtime Store when some value must still be read."""
+    stitching = neighbors > 0 and any(value and "chunk_index" in value for value in known.values())
+    if store is None and (len(known) < len(entries) or stitching):
+        return _get_runtime_store(phase)
+    return store
 
-    if store is None:
-        store = _get_runtime_store(phase)
-        if store is None:
-            return []
 
-    context_docs: list[Document] = []
-    for evidence_item in evidence_items[:max_items]:
-        namespace, key, score = _extract_evidence_fields(evidence_item)
-        if not namespace or not key:
-            continue
-        ns_tuple = tuple(namespace) if isinstance(namespace, (list, tuple)) else None
-        if ns_tuple is None:
+def _neighbor_keys(values: StoredValues, neighbors: int) -> list[StoreKey]:
+    """Return keys of chunks within `neighbors` positions of every loaded chunk value."""
+    keys: list[StoreKey] = []
+    for (namespace, _), value in list(values.items()):
+        if neighbors <= 0 or not value or "chunk_index" not in value:
             continue
+        uuid = str(value["uuid"])
+        index = int(value["chunk_index"])
+        count = int(value.get("chunk_count", index + 1) or index + 1)
+        positions = range(max(index - neighbors, 0), min(index + neighbors, count - 1) + 1)
+        keys.extend((namespace, chunk_key(uuid, position)) for position in positions if position != index)
+    return keys
+
 
-        stored = store.get(ns_tuple, key)
-        if not stored or not getattr(stored, "value", None):
+def _get_ops(keys: Iterable[StoreKey], values: StoredValues) -> list[GetOp]:
+    """Return one GetOp per distinct key not loaded yet."""
+    return [GetOp(namespace, key) for namespace, key in dict.fromkeys(keys) if (namespace, key) not in values]
+
+
+def _store_results(ops: Sequence[GetOp], results: Sequence[Any]) -> StoredValues:
+    return {
+        (op.namespace, op.key): result.value if isinstance(result, Item) else None
+        for op, result in zip(ops, results, strict=True)
+    }
+
+
+def _fetch(store: BaseStore | None, keys: Iterable[StoreKey], values: StoredValues) -> None:
+    """Load missing keys into `values` with a single `store.batch` call."""
+    ops = _get_ops(keys, values)
+    if ops and store is not None:
+        values.update(_store_results(ops, store.batch(ops)))
+
+
+async def _afetch(store: BaseStore | None, keys: Iterable[StoreKey], values: StoredValues) -> None:
+    """Async variant of `_fetch` using `store.abatch`."""
+    ops = _get_ops(keys, values)
+    if ops and store is not None:
+        values.update(_store_results(ops, await store.abatch(ops)))
+
+
+def _join_chunks(parts: list[Mapping[str, Any]]) -> str:
+    """Concatenate consecutive chunk values, dropping the text they overlap on."""
+    text = ""
+    end: int | None = None
+    for part in parts:
+        part_text = str(part.get("text", ""))
+        start = int(part.get("chunk_start", 0) or 0)
+        if end is not None and start <= end:
+            text += part_text[end - start :]
+        elif end is not None:
+            text += " " + part_text
+        else:
+            text = part_text
+        end = start + len(part_text)
+    return text
+
+
+def _stitch_chunks(
+    values: StoredValues,
+    namespace: tuple[str, ...],
+    value: Mapping[str, Any],
+    neighbors: int,
+) -> tuple[str, list[str]]:
+    """Return the text of a chunk merged with up to `neighbors` chunks on each side.
+
+    Stops at the first missing neighbour in each direction. Also returns the keys of
+    every chunk that went into the passage.
+    """
+    uuid = str(value["uuid"])
+    index = int(value["chunk_index"])
+    count = int(value.get("chunk_count", index + 1) or index + 1)
+    before: list[Mapping[str, Any]] = []
+    for position in range(index - 1, max(index - neighbors, 0) - 1, -1):
+        stored = values.get((namespace, chunk_key(uuid, position)))
+        if not stored:
+            break
+        before.insert(0, stored)
+    after: list[Mapping[str, Any]] = []
+    for position in range(index + 1, min(index + neighbors, count - 1) + 1):
+        stored = values.get((namespace, chunk_key(uuid, position)))
+        if not stored:
+            break
+        after.append(stored)
+    parts = [*before, value, *after]
+    return _join_chunks(parts), [chunk_key(uuid, int(part["chunk_index"])) for part in parts]
+
+
+def _assemble_docs(entries: Sequence[EvidenceEntry], values: StoredValues, neighbors: int) -> list[Document]:
+    """Build Documents in evidence order, skipping evidence covered by an earlier passage."""
+    covered: set[StoreKey] = set()
+    context_docs: list[Document] = []
+    for ns_tuple, key, score in entries:
+        value = values.get((ns_tuple, key))
+        if (ns_tuple, key) in covered or not value:
             continue
-        value = stored.value or {}
+        text = value.get("text", "")
+        chunk_keys = [key]
+        if neighbors > 0 and "chunk_index" in value:
+            text, chunk_keys = _stitch_chunks(values, ns_tuple, value, neighbors)
+        covered.update((ns_tuple, chunk) for chunk in chunk_keys)
         metadata = {
-            "title": value.get("title", ""),
-            "tags": value.get("tags", []),
-            "agents": value.get("agents", []),
-            "changed": value.get("changed", 0),
-            "store_namespace": list(getattr(stored, "namespace", namespace)),
-            "store_key": getattr(stored, "key", key),
+            **stored_value_metadata(value),
+            "store_namespace": list(ns_tuple),
+            "store_key": key,
+            "chunk_keys": chunk_keys,
             "score": score if score is None else float(score),
         }
-        context_docs.append(
-            Document(
-                page_content=value.get("text", ""),
-                metadata=metadata,
-            )
-        )
-
+        context_docs.append(Document(page_content=text, metadata=metadata))
     return context_docs
 
 
-def collect_phase_evidence(
-    state: SageState,
+def hydrate_evidence_docs(
+    evidence: Iterable[EvidenceItem | dict],
     *,
     phase: str,
     max_items: int = 8,
-) -> EvidenceBundle:
-    """Return evidence items and hydrated docs for a phase.
+    store: BaseStore | None = None,
+    stitch_neighbors: int | None = None,
+) -> list[Document]:
+    """Hydrate evidence items into LangChain Documents for downstream use.
 
-    Returns the core EvidenceBundle DTO with pure data. The caller should
-    access phase_entry from state directly if needed.
+    Evidence carrying its stored `value` (see `EvidenceItem.value`) is not read from
+    the Store again; the rest is read with one `store.batch` of `GetOp`s, and the
+    neighbouring chunks with a second one. Chunk records (keys `uuid#n`) are stitched
+    with up to `stitch_neighbors` neighbouring chunks on each side (default from
+    `config/embeddings.yaml`); evidence already covered by an earlier passage is
+    skipped. Documents keep the evidence order. Without a Store, only evidence that
+    carries its value is hydrated.
     """
+    entries, values = _evidence_entries(evidence, max_items)
+    if not entries:
+        return []
+    neighbors = get_chunking_config().stitch_neighbors if stitch_neighbors is None else stitch_neighbors
+    store = _resolve_store(store, phase, entries, values, neighbors)
+    _fetch(store, [(namespace, key) for namespace, key, _ in entries], values)
+    _fetch(store, _neighbor_keys(values, neighbors), values)
+    return _assemble_docs(entries, values, neighbors)
+
+
+async def ahydrate_evidence_docs(
+    evidence: Iterable[EvidenceItem | dict],
+    *,
+    phase: str,
+    max_items: int = 8,
+    store: BaseStore | None = None,
+    stitch_neighbors: int | None = None,
+) -> list[Document]:
+    """Async variant of `hydrate_evidence_docs` (reads via `store.abatch`)."""
+    entries, values = _evidence_entries(evidence, max_items)
+    if not entries:
+        return []
+    neighbors = get_chunking_config().stitch_neighbors if stitch_neighbors is None else stitch_neighbors
+    store = _resolve_store(store, phase, entries, values, neighbors)
+    await _afetch(store, [(namespace, key) for namespace, key, _ in entries], values)
+    await _afetch(store, _neighbor_keys(values, neighbors), values)
+    return _assemble_docs(entries, values, neighbors)
+
+
+def _phase_evidence(state: SageState, phase: str) -> tuple[Sequence[EvidenceItem | dict], BaseStore | None, bool]:
+    """Return the phase evidence, the Store to hydrate it from and whether that Store is missing."""
     phase_entry = state.phases.get(phase) or PhaseEntry()
     evidence = list(phase_entry.evidence or [])
-    store = _get_runtime_store(phase)
-    missing_store = store is None and bool(evidence)
-    context_docs = hydrate_evidence_docs(
-        evidence,
-        phase=phase,
-        max_items=max_items,
-        store=store,
-    )
+    needs_store = any(not (item.value if isinstance(item, EvidenceItem) else item.get("value")) for item in evidence)
+    store = _get_runtime_store(phase) if needs_store else None
+    return evidence, store, store is None and needs_store
+
+
+def _evidence_bundle(
+    evidence: Sequence[EvidenceItem | dict], context_docs: list[Document], missing_store: bool
+) -> EvidenceBundle:
     # Convert EvidenceItem objects to dicts for the pure DTO
     evidence_dicts = [
-        {"namespace": item.namespace, "key": item.key, "score": item.score} if isinstance(item, EvidenceItem) else item
-        for item in evidence
+        item.model_dump(exclude_none=True) if isinstance(item, EvidenceItem) else item for item in evidence
     ]
     return EvidenceBundle(
         evidence=evidence_dicts,
         context_docs=context_docs,
         missing_store=missing_store,
     )
+
+
+def collect_phase_evidence(
+    state: SageState,
+    *,
+    phase: str,
+    max_items: int = 8,
+) -> EvidenceBundle:
+    """Return evidence items and hydrated docs for a phase.
+
+    Returns the core EvidenceBundle DTO with pure data. The caller should
+    access phase_entry from state directly if needed.
+    """
+    evidence, store, missing_store = _phase_evidence(state, phase)
+    context_docs = hydrate_evidence_docs(evidence, phase=phase, max_items=max_items, store=store)
+    return _evidence_bundle(evidence, context_docs, missing_store)
+
+
+async def acollect_phase_evidence(
+    state: SageState,
+    *,
+    phase: str,
+    max_items: int = 8,
+) -> EvidenceBundle:
+    """Async variant of `collect_phase_evidence` (hydrates via `ahydrate_evidence_docs`)."""
+    evidence, store, missing_store = _phase_evidence(state, phase)
+    context_docs = await ahydrate_evidence_docs(evidence, phase=phase, max_items=max_items, store=store)
+    return _evidence_bundle(evidence, context_docs, missing_store)
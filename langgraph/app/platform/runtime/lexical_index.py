@@ -0,0 +1,219 @@
+"""In-process BM25 index over stored context `text` and `title` fields.
+
+Each Store instance gets its own index. The vector writer applies every put/delete
+it sends to the Store, and a namespace prefix is loaded from the Store the first
+time it is searched, so the index stays current for writes made by this process
+(writes from other processes are not observed). Title terms count twice.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import re
+import threading
+import unicodedata
+import weakref
+from collections import Counter
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from functools import cache
+from typing import Any
+
+from langgraph.store.base import BaseStore, Item, PutOp
+
+from app.platform.config.file_loader import FileLoader
+from app.platform.utils.store_filters import matches_filter
+
+StoreKey = tuple[tuple[str, ...], str]
+
+LOAD_PAGE_SIZE = 500
+
+_TOKEN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into casefolded word tokens."""
+    return _TOKEN.findall(unicodedata.normalize("NFC", text).casefold())
+
+
+@dataclass(frozen=True)
+class LexicalHit:
+    """One BM25 match."""
+
+    namespace: tuple[str, ...]
+    key: str
+    score: float
+    value: Mapping[str, Any]
+
+
+@dataclass(frozen=True)
+class _Document:
+    terms: Counter[str]
+    length: int
+    value: Mapping[str, Any]
+
+
+class LexicalIndex:
+    """Thread-safe BM25 inverted index keyed by Store namespace and key.
+
+    Example:
+        >>> index = LexicalIndex()
+        >>> index.upsert(("drupal", "context", "agent", "problem_framing"), "uuid-1", {"text": "KPI owners"})
+        >>> index.search(("drupal", "context"), "kpi", limit=5)
+    """
+
+    def __init__(self, *, k1: float = 1.2, b: float = 0.75) -> None:
+        """Create an empty index with BM25 parameters `k1` and `b`."""
+        self._k1 = k1
+        self._b = b
+        self._documents: dict[StoreKey, _Document] = {}
+        self._postings: dict[str, set[StoreKey]] = {}
+        self._total_length = 0
+        self._loaded: set[tuple[str, ...]] = set()
+        self._lock = threading.Lock()
+
+    def upsert(self, namespace: Sequence[str], key: str, value: Mapping[str, Any] | None) -> None:
+        """Index (or, for a None value, remove) one stored record."""
+        store_key = (tuple(namespace), key)
+        with self._lock:
+            self._remove(store_key)
+            if value is None:
+                return
+            terms = Counter(tokenize(str(value.get("text", ""))))
+            terms.update({term: 2 * count for term, count in Counter(tokenize(str(value.get("title", "")))).items()})
+            document = _Document(terms=terms, length=sum(terms.values()), value=dict(value))
+            self._documents[store_key] = document
+            self._total_length += document.length
+            for term in terms:
+                self._postings.setdefault(term, set()).add(store_key)
+
+    def apply(self, ops: Iterable[PutOp]) -> None:
+        """Apply Store put/delete operations."""
+        for op in ops:
+            self.upsert(op.namespace, op.key, op.value)
+
+    def ensure_loaded(self, store: BaseStore, prefix: Sequence[str]) -> None:
+        """Index every record under `prefix` the first time the prefix is searched."""
+        prefix = tuple(prefix)
+        if self._is_loaded(prefix):
+            return
+        offset = 0
+        while True:
+            page = store.search(prefix, limit=LOAD_PAGE_SIZE, offset=offset)
+            offset += self._load_page(page)
+            if len(page) < LOAD_PAGE_SIZE:
+                break
+        with self._lock:
+            self._loaded.add(prefix)
+
+    async def aensure_loaded(self, store: BaseStore, prefix: Sequence[str]) -> None:
+        """Async variant of `ensure_loaded` (pages through `store.asearch`)."""
+        prefix = tuple(prefix)
+        if self._is_loaded(prefix):
+            return
+        offset = 0
+        while True:
+            page = await store.asearch(prefix, limit=LOAD_PAGE_SIZE, offset=offset)
+            offset += self._load_page(page)
+            if len(page) < LOAD_PAGE_SIZE:
+                break
+        with self._lock:
+            self._loaded.add(prefix)
+
+    def _is_loaded(self, prefix: tuple[str, ...]) -> bool:
+        with self._lock:
+            return any(prefix[: len(loaded)] == loaded for loaded in self._loaded)
+
+    def _load_page(self, page: Sequence[Item]) -> int:
+        for item in page:
+            self.upsert(item.namespace, item.key, item.value)
+        return len(page)
+
+    def search(
+        self, prefix: Sequence[str], query: str, *, limit: int, filter_: dict[str, Any] | None = None
+    ) -> list[LexicalHit]:
+        """Return the `limit` best BM25 matches under a namespace prefix that satisfy a Store filter."""
+        prefix = tuple(prefix)
+        query_terms = set(tokenize(query))
+        with self._lock:
+            count = len(self._documents)
+            if not count or not query_terms:
+                return []
+            average_length = self._total_length / count
+            scores: dict[StoreKey, float] = {}
+            for term in query_terms:
+                postings = self._postings.get(term, set())
+                idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for store_key in postings:
+                    document = self._documents[store_key]
+                    if store_key[0][: len(prefix)] != prefix or (
+                        filter_ and not matches_filter(dict(document.value), filter_)
+                    ):
+                        continue
+                    frequency = document.terms[term]
+                    norm = self._k1 * (1 - self._b + self._b * document.length / average_length)
+                    scores[store_key] = scores.get(store_key, 0.0) + idf * frequency * (self._k1 + 1) / (
+                        frequency + norm
+                    )
+            ranked = heapq.nlargest(limit, scores.items(), key=lambda entry: entry[1])
+            return [
+                LexicalHit(namespace=namespace, key=key, score=score, value=self._documents[(namespace, key)].value)
+                for (namespace, key), score in ranked
+            ]
+
+    def _remove(self, store_key: StoreKey) -> None:
+        document = self._documents.pop(store_key, None)
+        if document is None:
+            return
+        self._total_length -= document.length
+        for term in document.terms:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.discard(store_key)
+                if not postings:
+                    del self._postings[term]
+
+
+@dataclass(frozen=True)
+class HybridConfig:
+    """Hybrid (BM25 + vector) retrieval settings for `context_lookup`.
+
+    Attributes:
+        rrf_k: Reciprocal rank fusion constant (higher flattens rank differences).
+        lexical_limit: BM25 candidates fused with the vector hits.
+    """
+
+    rrf_k: int = 60
+    lexical_limit: int = 16
+
+
+@cache
+def get_hybrid_config() -> HybridConfig | None:
+    """Return the `hybrid` section of `config/embeddings.yaml`, or None when disabled."""
+    try:
+        section = FileLoader.load_embeddings_config().get("hybrid") or {}
+    except FileNotFoundError:
+        section = {}
+    if not section.get("enabled", True):
+        return None
+    defaults = HybridConfig()
+    return HybridConfig(
+        rrf_k=int(section.get("rrf_k") or defaults.rrf_k),
+        lexical_limit=int(section.get("lexical_limit") or defaults.lexical_limit),
+    )
+
+
+_indexes: weakref.WeakKeyDictionary[BaseStore, LexicalIndex] = weakref.WeakKeyDictionary()
+_indexes_lock = threading.Lock()
+
+
+def get_lexical_index(store: BaseStore) -> LexicalIndex | None:
+    """Return the lexical index of a Store, or None when hybrid retrieval is disabled."""
+    if get_hybrid_config() is None:
+        return None
+    with _indexes_lock:
+        index = _indexes.get(store)
+        if index is None:
+            index = _indexes[store] = LexicalIndex()
+        return index
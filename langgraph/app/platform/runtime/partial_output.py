@@ -0,0 +1,117 @@
+"""Incremental parsing of structured agent output while the model streams.
+
+Agents built with `response_format` emit their structured response either as
+tool call argument chunks (tool strategy) or as JSON text (provider strategy).
+`PartialOutputParser` re-parses the accumulated JSON after every chunk so nodes
+can forward partially filled fields to the client (LangGraph `custom` stream
+mode) long before the validated response exists.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from langchain_core.messages import AIMessageChunk
+from langchain_core.runnables import Runnable
+from langchain_core.utils.json import parse_partial_json
+
+# `type` of the payloads written to the LangGraph `custom` stream.
+PARTIAL_OUTPUT_EVENT = "partial_output"
+
+PartialCallback = Callable[[dict[str, Any]], None]
+
+
+class PartialOutputParser:
+    """Accumulates streamed model chunks and returns the fields parsed so far.
+
+    Example:
+        >>> parser = PartialOutputParser("ProblemFrame")
+        >>> for chunk in chunks:
+        ...     if (fields := parser.feed(chunk)) is not None:
+        ...         render(fields)
+    """
+
+    def __init__(self, schema_name: str) -> None:
+        """Create a parser.
+
+        Args:
+            schema_name: Tool name the structured response is emitted under (the
+                response schema class name); other tool calls are ignored.
+        """
+        self._schema_name = schema_name
+        self._message_id: str | None = None
+        self._tool_index: int | str | None = None
+        self._buffer = ""
+        self._fields: dict[str, Any] = {}
+
+    @property
+    def fields(self) -> dict[str, Any]:
+        """Return the latest parsed fields."""
+        return dict(self._fields)
+
+    def feed(self, chunk: object) -> dict[str, Any] | None:
+        """Consume one streamed chunk; return the parsed fields when they changed."""
+        if not isinstance(chunk, AIMessageChunk):
+            return None
+        if chunk.id != self._message_id:
+            # A new model call (e.g. a retry after a validation error) starts over.
+            self._message_id, self._tool_index, self._buffer = chunk.id, None, ""
+        self._buffer += self._response_text(chunk)
+        parsed = parse_partial_json(self._buffer) if self._buffer.strip() else None
+        if not isinstance(parsed, dict) or parsed == self._fields:
+            return None
+        self._fields = parsed
+        return self.fields
+
+    def _response_text(self, chunk: AIMessageChunk) -> str:
+        if not chunk.tool_call_chunks:
+            return chunk.text if self._tool_index is None else ""
+        text = ""
+        for tool_chunk in chunk.tool_call_chunks:
+            if self._tool_index is None and tool_chunk.get("name") == self._schema_name:
+                self._tool_index, self._buffer = tool_chunk.get("index"), ""
+            if self._tool_index is not None and tool_chunk.get("index") == self._tool_index:
+                text += tool_chunk.get("args") or ""
+        return text
+
+
+def partial_output_payload(*, owner: str, phase: str | None, fields: Mapping[str, Any]) -> dict[str, Any]:
+    """Return the `custom` stream payload for a partial structured response."""
+    return {"type": PARTIAL_OUTPUT_EVENT, "owner": owner, "phase": phase, "data": dict(fields)}
+
+
+def stream_agent(agent: Runnable, agent_input: dict[str, Any], *, schema_name: str, on_partial: PartialCallback) -> Any:
+    """Run `agent` via `stream`, reporting partial structured output as it arrives.
+
+    Args:
+        agent: Agent graph built with `response_format` (supports `stream_mode`).
+        agent_input: Agent input, as for `invoke`.
+        schema_name: Name of the response schema (see `PartialOutputParser`).
+        on_partial: Called with the fields parsed so far whenever they change.
+
+    Returns:
+        The final agent state, as `invoke` would return it.
+    """
+    parser = PartialOutputParser(schema_name)
+    result: Any = None
+    for mode, data in agent.stream(agent_input, stream_mode=["messages", "values"]):
+        if mode == "values":
+            result = data
+        elif (fields := parser.feed(data[0])) is not None:
+            on_partial(fields)
+    return result
+
+
+async def astream_agent(
+    agent: Runnable, agent_input: dict[str, Any], *, schema_name: str, on_partial: PartialCallback
+) -> Any:
+    """Async variant of `stream_agent` (runs the agent via `astream`)."""
+    parser = PartialOutputParser(schema_name)
+    result: Any = None
+    async for mode, data in agent.astream(agent_input, stream_mode=["messages", "values"]):
+        if mode == "values":
+            result = data
+        elif (fields := parser.feed(data[0])) is not None:
+            on_partial(fields)
+    return result
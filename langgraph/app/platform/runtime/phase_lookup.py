@@ -0,0 +1,126 @@
+"""Phase-scoped context lookups run by `retrieve_context` and its prefetch hook.
+
+A phase lookup searches the collections of the phase `RetrievalPolicy` (several
+collections are searched concurrently and merged by weight), then re-ranks the
+hits per the policy. Async variants use the tool's `ainvoke`/`abatch`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from langchain_core.documents import Document
+from langchain_core.runnables import Runnable
+
+from app.platform.adapters.logging import get_logger
+from app.platform.core.contract.phases import ContextFilter, RetrievalPolicy
+from app.platform.runtime.reranking import merge_collection_results, rerank_documents
+
+logger = get_logger("runtime.phase_lookup")
+
+
+def _lookup_inputs(
+    query: str, weights: Mapping[str, float], policy: RetrievalPolicy, lookup_filter: ContextFilter
+) -> list[dict[str, Any]]:
+    filters = lookup_filter.model_dump(exclude_defaults=True)
+    return [{"query": query, "collection": name, "limit": policy.fetch_k, **filters} for name in weights]
+
+
+def _merge(weights: Mapping[str, float], results: Sequence[list[Document] | None]) -> list[Document]:
+    return merge_collection_results({name: docs or [] for name, docs in zip(weights, results, strict=True)}, weights)
+
+
+def _lookup(
+    tool: Runnable,
+    query: str,
+    weights: Mapping[str, float],
+    policy: RetrievalPolicy,
+    lookup_filter: ContextFilter,
+) -> list[Document]:
+    """Search every collection (concurrently when there are several) and merge the hits."""
+    inputs = _lookup_inputs(query, weights, policy, lookup_filter)
+    if len(inputs) == 1:
+        return list(tool.invoke(inputs[0]) or [])
+    # Runnable.batch runs the lookups on a thread pool: latency tracks the slowest search.
+    return _merge(weights, tool.batch(inputs))
+
+
+async def _alookup(
+    tool: Runnable,
+    query: str,
+    weights: Mapping[str, float],
+    policy: RetrievalPolicy,
+    lookup_filter: ContextFilter,
+) -> list[Document]:
+    """Async variant of `_lookup` (`ainvoke`/`abatch`)."""
+    inputs = _lookup_inputs(query, weights, policy, lookup_filter)
+    if len(inputs) == 1:
+        return list(await tool.ainvoke(inputs[0]) or [])
+    return _merge(weights, await tool.abatch(inputs))
+
+
+def _phase_plan(
+    target_phase: str,
+    collection: str | None,
+    policies: Mapping[str, RetrievalPolicy],
+    context_filter: ContextFilter | None,
+) -> tuple[RetrievalPolicy, dict[str, float], ContextFilter]:
+    """Return the policy, collection weights and filter a phase lookup uses."""
+    policy = policies.get(target_phase) or RetrievalPolicy()
+    weights = {collection: 1.0} if collection else (policy.collections or {target_phase: 1.0})
+    return policy, weights, context_filter or policy.context_filter
+
+
+def _rank(
+    results: list[Document], target_phase: str, policy: RetrievalPolicy, weights: Mapping[str, float]
+) -> list[Document]:
+    ranked = rerank_documents(results, policy)
+    logger.info(
+        "retrieve_context.lookup",
+        phase=target_phase,
+        collections=list(weights),
+        candidates=len(results),
+        results=len(ranked),
+    )
+    return ranked
+
+
+def phase_lookup(
+    tool: Runnable,
+    query: str,
+    target_phase: str,
+    *,
+    collection: str | None,
+    policies: Mapping[str, RetrievalPolicy],
+    context_filter: ContextFilter | None,
+) -> list[Document]:
+    """Run the lookup configured for a phase and re-rank it per the phase policy.
+
+    Args:
+        tool: Lookup tool (`context_lookup` or a stand-in with the same inputs).
+        query: Natural-language query.
+        target_phase: Phase whose policy and default collection apply.
+        collection: Collection override (ignores the policy's `collections`).
+        policies: Retrieval policy per phase; missing phases use `RetrievalPolicy()`.
+        context_filter: Filter override (defaults to the policy's `context_filter`).
+
+    Returns:
+        Re-ranked documents, best first.
+    """
+    policy, weights, lookup_filter = _phase_plan(target_phase, collection, policies, context_filter)
+    return _rank(_lookup(tool, query, weights, policy, lookup_filter), target_phase, policy, weights)
+
+
+async def aphase_lookup(
+    tool: Runnable,
+    query: str,
+    target_phase: str,
+    *,
+    collection: str | None,
+    policies: Mapping[str, RetrievalPolicy],
+    context_filter: ContextFilter | None,
+) -> list[Document]:
+    """Async variant of `phase_lookup`."""
+    policy, weights, lookup_filter = _phase_plan(target_phase, collection, policies, context_filter)
+    return _rank(await _alookup(tool, query, weights, policy, lookup_filter), target_phase, policy, weights)
@@ -0,0 +1,128 @@
+"""Re-ranking of retrieved context documents per phase `RetrievalPolicy`.
+
+Stages run in order: minimum score cutoff, near-duplicate collapse, then maximal
+marginal relevance (MMR) selection of `top_k` documents. Text similarity is the
+cosine of casefolded term counts, so no extra embedding calls are made.
+
+Results from several collections are first merged with `merge_collection_results`,
+which rescales each collection's scores to its best hit and applies its weight.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import Counter
+from collections.abc import Mapping, Sequence
+
+from langchain_core.documents import Document
+
+from app.platform.core.contract.phases import RetrievalPolicy
+from app.platform.runtime.lexical_index import tokenize
+
+
+def text_similarity(left: Counter[str], right: Counter[str]) -> float:
+    """Return the cosine similarity of two term-count vectors."""
+    dot = sum(count * right[term] for term, count in left.items() if term in right)
+    if not dot:
+        return 0.0
+    norm = math.sqrt(sum(c * c for c in left.values())) * math.sqrt(sum(c * c for c in right.values()))
+    return dot / norm
+
+
+def _relevance(doc: Document) -> float:
+    """Return the ranking score of a document (weighted, fused or similarity score)."""
+    metadata = doc.metadata or {}
+    for field in ("relevance", "rrf_score", "score"):
+        value = metadata.get(field)
+        if isinstance(value, (int, float)):
+            return float(value)
+    return 0.0
+
+
+def merge_collection_results(results: Mapping[str, Sequence[Document]], weights: Mapping[str, float]) -> list[Document]:
+    """Merge per-collection results into one best-first list.
+
+    Each document's score is divided by the best score of its collection and
+    multiplied by the collection weight; the result is stored as `relevance`
+    metadata along with the source `collection`. A record found in several
+    collections keeps its best entry.
+
+    Args:
+        results: Best-first documents per collection.
+        weights: Weight per collection (missing collections weigh 1.0).
+
+    Returns:
+        Documents ordered by weighted relevance.
+    """
+    merged: dict[tuple[str, str], Document] = {}
+    for collection, docs in results.items():
+        raw = [_relevance(doc) for doc in docs]
+        top = max(raw, default=0.0)
+        for rank, (doc, score) in enumerate(zip(docs, raw, strict=True)):
+            # Unscored results fall back to their rank.
+            normalized = score / top if top > 0 else 1.0 / (rank + 1)
+            relevance = weights.get(collection, 1.0) * normalized
+            metadata = doc.metadata or {}
+            identity = ("|".join(metadata.get("store_namespace") or [collection]), str(metadata.get("store_key", rank)))
+            if identity not in merged or relevance > merged[identity].metadata["relevance"]:
+                merged[identity] = Document(
+                    page_content=doc.page_content,
+                    metadata={**metadata, "collection": collection, "relevance": relevance},
+                )
+    return sorted(merged.values(), key=lambda doc: doc.metadata["relevance"], reverse=True)
+
+
+def _above_floor(doc: Document, min_score: float) -> bool:
+    # Lexical-only hits have no similarity score; they matched query terms exactly.
+    score = (doc.metadata or {}).get("score")
+    return not isinstance(score, (int, float)) or score >= min_score
+
+
+def _collapse(docs: Sequence[Document], terms: Sequence[Counter[str]], threshold: float) -> list[int]:
+    kept: list[int] = []
+    for index in range(len(docs)):
+        if all(text_similarity(terms[index], terms[other]) < threshold for other in kept):
+            kept.append(index)
+    return kept
+
+
+def _mmr(
+    candidates: list[int], relevance: Sequence[float], terms: Sequence[Counter[str]], policy: RetrievalPolicy
+) -> list[int]:
+    lambda_ = policy.mmr_lambda if policy.mmr_lambda is not None else 1.0
+    top = max((relevance[index] for index in candidates), default=0.0) or 1.0
+    selected: list[int] = []
+    while candidates and len(selected) < policy.top_k:
+        best = max(
+            candidates,
+            key=lambda index: (
+                lambda_ * relevance[index] / top
+                - (1 - lambda_) * max((text_similarity(terms[index], terms[other]) for other in selected), default=0.0)
+            ),
+        )
+        selected.append(best)
+        candidates.remove(best)
+    return selected
+
+
+def rerank_documents(docs: Sequence[Document], policy: RetrievalPolicy) -> list[Document]:
+    """Apply a phase retrieval policy to documents ordered best-first.
+
+    Args:
+        docs: Lookup results, most relevant first.
+        policy: Cutoff, de-duplication and MMR settings of the target phase.
+
+    Returns:
+        At most `policy.top_k` documents.
+    """
+    if policy.min_score is not None:
+        docs = [doc for doc in docs if _above_floor(doc, policy.min_score)]
+    if policy.duplicate_threshold is None and policy.mmr_lambda is None:
+        return list(docs[: policy.top_k])
+    terms = [Counter(tokenize(doc.page_content)) for doc in docs]
+    candidates = list(range(len(docs)))
+    if policy.duplicate_threshold is not None:
+        candidates = _collapse(docs, terms, policy.duplicate_threshold)
+    if policy.mmr_lambda is None:
+        return [docs[index] for index in candidates[: policy.top_k]]
+    return [docs[index] for index in _mmr(candidates, [_relevance(doc) for doc in docs], terms, policy)]
@@ -0,0 +1,156 @@
+"""Store retrieval for `context_lookup`: vector search fused with BM25 hits.
+
+Vector hits and lexical (`lexical_index`) hits are merged with reciprocal rank
+fusion: each record scores `sum(1 / (rrf_k + rank))` over the rankings it appears
+in, so exact-term matches (identifiers, acronyms) surface even when their
+embeddings rank low. Documents keep the vector similarity as `score` (None for
+lexical-only hits) and carry `lexical_score` and `rrf_score` alongside it.
+
+Tag and recency filters (`build_store_filter`) run inside `store.search`, before
+scoring, and are applied to lexical candidates too.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable, Mapping, Sequence
+from typing import Any
+
+from langchain_core.documents import Document
+from langgraph.store.base import BaseStore, SearchItem
+
+from app.platform.runtime.evidence import EVIDENCE_VALUE_FIELDS, stored_value_metadata
+from app.platform.runtime.lexical_index import (
+    HybridConfig,
+    LexicalIndex,
+    StoreKey,
+    get_hybrid_config,
+    get_lexical_index,
+)
+from app.platform.runtime.vector_write_plan import TAG_INDEX_FIELD
+
+
+def build_store_filter(
+    *,
+    tags: Iterable[str] = (),
+    exclude_tags: Iterable[str] = (),
+    changed_since: int | None = None,
+) -> dict[str, Any] | None:
+    """Translate tag include/exclude and changed-since constraints into a Store filter.
+
+    Args:
+        tags: Tags every result must carry.
+        exclude_tags: Tags no result may carry.
+        changed_since: Only items whose `changed` timestamp is at or after this value.
+
+    Returns:
+        A `store.search` filter, or None when nothing is constrained. Tag
+        constraints match the `tag_index` field written by the vector writer.
+    """
+    tag_index: dict[str, Any] = {tag: True for tag in tags}
+    tag_index.update({tag: {"$ne": True} for tag in exclude_tags})
+    filter_: dict[str, Any] = {TAG_INDEX_FIELD: tag_index} if tag_index else {}
+    if changed_since is not None:
+        filter_["changed"] = {"$gte": changed_since}
+    return filter_ or None
+
+
+def reciprocal_rank_fusion[K: Hashable](rankings: Sequence[Sequence[K]], *, k: int = 60) -> list[tuple[K, float]]:
+    """Fuse best-first rankings into one, ordered by reciprocal rank score.
+
+    Ties keep the order in which keys were first seen.
+    """
+    scores: dict[K, float] = {}
+    for ranking in rankings:
+        for rank, key in enumerate(ranking, start=1):
+            scores[key] = scores.get(key, 0.0) + 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda entry: entry[1], reverse=True)
+
+
+def _document(namespace: Sequence[str], key: str, value: Mapping[str, Any], **scores: float | None) -> Document:
+    metadata = stored_value_metadata(value)
+    # Chunk fields let retrieve_context hand the full value to evidence hydration.
+    metadata.update({field: value[field] for field in EVIDENCE_VALUE_FIELDS if field in value})
+    metadata.update({"store_namespace": list(namespace), "store_key": key, **scores})
+    return Document(page_content=value.get("text", ""), metadata=metadata)
+
+
+def search_context(
+    store: BaseStore,
+    ns_prefix: tuple[str, ...],
+    query: str,
+    *,
+    limit: int,
+    filter_: dict[str, Any] | None = None,
+) -> list[Document]:
+    """Search a namespace prefix and return the best `limit` records as Documents.
+
+    Args:
+        store: Store to search.
+        ns_prefix: Namespace prefix to search under.
+        query: Natural-language query.
+        limit: Max documents returned.
+        filter_: Optional Store filter (see `build_store_filter`).
+
+    Returns:
+        Documents ordered by relevance, with `store_namespace`, `store_key` and
+        `score` metadata (plus `lexical_score`/`rrf_score` when hybrid retrieval is on).
+    """
+    # NOTE: namespace prefix is positional (not namespace_prefix=...)
+    results = store.search(ns_prefix, query=query, filter=filter_, limit=limit, offset=0)
+    hybrid, index = get_hybrid_config(), get_lexical_index(store)
+    if hybrid is not None and index is not None:
+        index.ensure_loaded(store, ns_prefix)
+    return _fuse(results, ns_prefix, query, limit=limit, filter_=filter_, hybrid=hybrid, index=index)
+
+
+async def asearch_context(
+    store: BaseStore,
+    ns_prefix: tuple[str, ...],
+    query: str,
+    *,
+    limit: int,
+    filter_: dict[str, Any] | None = None,
+) -> list[Document]:
+    """Async variant of `search_context` (reads via `store.asearch`)."""
+    results = await store.asearch(ns_prefix, query=query, filter=filter_, limit=limit, offset=0)
+    hybrid, index = get_hybrid_config(), get_lexical_index(store)
+    if hybrid is not None and index is not None:
+        await index.aensure_loaded(store, ns_prefix)
+    return _fuse(results, ns_prefix, query, limit=limit, filter_=filter_, hybrid=hybrid, index=index)
+
+
+def _fuse(
+    results: Sequence[SearchItem],
+    ns_prefix: tuple[str, ...],
+    query: str,
+    *,
+    limit: int,
+    filter_: dict[str, Any] | None,
+    hybrid: HybridConfig | None,
+    index: LexicalIndex | None,
+) -> list[Document]:
+    """Fuse vector results with BM25 matches from a loaded lexical index (when hybrid is on)."""
+    if hybrid is None or index is None:
+        return [_document(item.namespace, item.key, item.value or {}, score=item.score) for item in results]
+    lexical = index.search(ns_prefix, query, limit=hybrid.lexical_limit, filter_=filter_)
+    values: dict[StoreKey, Mapping[str, Any]] = {}
+    vector_scores: dict[StoreKey, float | None] = {}
+    lexical_scores: dict[StoreKey, float] = {}
+    for item in results:
+        values[(tuple(item.namespace), item.key)] = item.value or {}
+        vector_scores[(tuple(item.namespace), item.key)] = item.score
+    for hit in lexical:
+        values.setdefault((hit.namespace, hit.key), hit.value)
+        lexical_scores[(hit.namespace, hit.key)] = hit.score
+    fused = reciprocal_rank_fusion([list(vector_scores), list(lexical_scores)], k=hybrid.rrf_k)
+    return [
+        _document(
+            namespace,
+            key,
+            values[(namespace, key)],
+            score=vector_scores.get((namespace, key)),
+            lexical_score=lexical_scores.get((namespace, key)),
+            rrf_score=rrf_score,
+        )
+        for (namespace, key), rrf_score in fused[:limit]
+    ]
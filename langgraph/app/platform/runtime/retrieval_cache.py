@@ -0,0 +1,172 @@
+"""Query-result cache for `context_lookup` with per-namespace write generations.
+
+Cached results are keyed on the Store instance, normalized query, collection,
+limit and filter, and are tagged with the Store's generation of the searched
+namespace prefix. The writer bumps the generation of every namespace it writes
+(and of its ancestors) in the Store it wrote to, so a write makes earlier
+results for that scope stale. Writes made by other processes
+are not observed; the TTL bounds how long such results are served.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from functools import cache
+from typing import Any
+
+from langchain_core.documents import Document
+from langgraph.store.base import BaseStore
+
+from app.platform.config.file_loader import FileLoader
+from app.platform.utils.disk_cache import CacheStats
+from app.platform.utils.embeddings import normalize_embedding_text
+
+DEFAULT_LOOKUP_CACHE_MAX_ENTRIES = 256
+DEFAULT_LOOKUP_CACHE_TTL_SECONDS = 600.0
+
+LookupKey = tuple[int, str, str, int, str]
+
+# Per-Store state is weakly keyed, like the lexical indexes: two Stores in one
+# process (e.g. the configured ChromaStore and an injected InMemoryStore) never
+# share cached results or generations.
+_store_tokens: weakref.WeakKeyDictionary[BaseStore, int] = weakref.WeakKeyDictionary()
+_next_token = itertools.count(1)
+_generations: weakref.WeakKeyDictionary[BaseStore, dict[tuple[str, ...], int]] = weakref.WeakKeyDictionary()
+_state_lock = threading.Lock()
+
+
+def store_token(store: BaseStore) -> int:
+    """Return a process-unique id of a Store instance (never reused, unlike `id()`)."""
+    with _state_lock:
+        token = _store_tokens.get(store)
+        if token is None:
+            token = _store_tokens[store] = next(_next_token)
+        return token
+
+
+def bump_namespace_generations(store: BaseStore, namespaces: Iterable[Sequence[str]]) -> None:
+    """Invalidate cached lookups of `store` covering the given namespaces (and their prefixes)."""
+    prefixes = {tuple(namespace[:depth]) for namespace in namespaces for depth in range(len(namespace) + 1)}
+    with _state_lock:
+        generations = _generations.setdefault(store, {})
+        for prefix in prefixes:
+            generations[prefix] = generations.get(prefix, 0) + 1
+
+
+def namespace_generation(store: BaseStore, prefix: Sequence[str]) -> int:
+    """Return the write generation of a namespace prefix in `store` (0 until first written)."""
+    with _state_lock:
+        return _generations.get(store, {}).get(tuple(prefix), 0)
+
+
+def lookup_key(
+    store: BaseStore, query: str, collection: str, limit: int, filter_: Mapping[str, Any] | None = None
+) -> LookupKey:
+    """Return the cache key of a lookup (Store; casefolded, whitespace-normalized query; canonical filter)."""
+    normalized = normalize_embedding_text(query).casefold()
+    return store_token(store), normalized, collection, limit, json.dumps(filter_ or {}, sort_keys=True)
+
+
+@dataclass(frozen=True)
+class _Entry:
+    generation: int
+    expires_at: float
+    docs: tuple[Document, ...]
+
+
+class QueryResultCache:
+    """In-process LRU/TTL cache of `context_lookup` results.
+
+    Entries expire after `ttl_seconds` or when the namespace generation they were
+    computed at is no longer current. Returned documents are deep copies, so
+    callers may mutate them freely.
+
+    Example:
+        >>> cache = QueryResultCache(max_entries=256, ttl_seconds=600)
+        >>> cache.set(lookup_key(store, "KPI owners", "problem_framing", 8), docs, generation=3)
+        >>> cache.get(lookup_key(store, "KPI owners", "problem_framing", 8), generation=3)
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_LOOKUP_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_LOOKUP_CACHE_TTL_SECONDS,
+    ) -> None:
+        """Create an empty cache.
+
+        Args:
+            max_entries: Entries kept before least recently used ones are evicted.
+            ttl_seconds: Max age of a cached result.
+        """
+        self._max_entries = max(1, max_entries)
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[LookupKey, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: LookupKey, *, generation: int) -> list[Document] | None:
+        """Return cached documents for `key` at `generation`, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.generation != generation or entry.expires_at <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        return [doc.model_copy(deep=True) for doc in entry.docs]
+
+    def set(self, key: LookupKey, docs: Sequence[Document], *, generation: int) -> None:
+        """Cache documents computed at `generation`."""
+        entry = _Entry(
+            generation=generation,
+            expires_at=time.monotonic() + self._ttl_seconds,
+            docs=tuple(doc.model_copy(deep=True) for doc in docs),
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        """Return hit/miss/eviction counters and the current entry count."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits, misses=self._misses, evictions=self._evictions, entries=len(self._entries)
+            )
+
+
+@cache
+def get_lookup_cache() -> QueryResultCache | None:
+    """Return the process-wide lookup cache from the `lookup_cache` section of `config/embeddings.yaml`.
+
+    Returns None when `lookup_cache.enabled` is false.
+    """
+    try:
+        section = FileLoader.load_embeddings_config().get("lookup_cache") or {}
+    except FileNotFoundError:
+        section = {}
+    if not section.get("enabled", True):
+        return None
+    return QueryResultCache(
+        max_entries=int(section.get("max_entries") or DEFAULT_LOOKUP_CACHE_MAX_ENTRIES),
+        ttl_seconds=float(section.get("ttl_seconds") or DEFAULT_LOOKUP_CACHE_TTL_SECONDS),
+    )
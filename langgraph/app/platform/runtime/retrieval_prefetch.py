@@ -0,0 +1,168 @@
+"""Speculative context retrieval started ahead of the ambiguity scan.
+
+The ambiguity supervisor starts the target phase lookup on a worker thread when
+it first routes to the scan; the scan node (or, failing that, the retrieve node)
+claims the result by phase and query. Keys are scoped to the Store and thread
+of the current graph run, so an unclaimed lookup never reaches another run.
+Lookups run in a copy of the caller's context, so `get_store()` and the runnable
+config resolve as they would inline.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from functools import cache
+
+from langchain_core.documents import Document
+from langgraph.config import get_config, get_store
+
+from app.platform.adapters.logging import get_logger
+from app.platform.runtime.retrieval_cache import store_token
+from app.platform.utils.embeddings import normalize_embedding_text
+
+DEFAULT_PREFETCH_WORKERS = 4
+DEFAULT_PREFETCH_TTL_SECONDS = 120.0
+# Waiting this long for a lookup is still far cheaper than an extra scan LLM call.
+DEFAULT_PREFETCH_WAIT_SECONDS = 2.0
+
+# (Store token, thread or run id, phase, normalized query)
+PrefetchKey = tuple[int, str, str, str]
+
+logger = get_logger("runtime.retrieval_prefetch")
+
+
+def _run_scope() -> tuple[int, str]:
+    """Return the Store token and thread (or run) id of the current graph run.
+
+    Outside a graph run (or without a Store/thread) the missing parts are 0 and "".
+    """
+    try:
+        configurable = get_config().get("configurable") or {}
+    except RuntimeError:
+        return 0, ""
+    try:
+        store = get_store()
+    except (KeyError, AttributeError):
+        store = None
+    thread = configurable.get("thread_id") or configurable.get("run_id") or ""
+    return (store_token(store) if store is not None else 0), str(thread)
+
+
+def prefetch_key(phase: str, query: str) -> PrefetchKey:
+    """Return the key a prefetched lookup of the current graph run is stored under."""
+    return *_run_scope(), phase, normalize_embedding_text(query).casefold()
+
+
+class RetrievalPrefetcher:
+    """Runs lookups in the background and hands each result to one claimant.
+
+    Example:
+        >>> prefetcher = RetrievalPrefetcher()
+        >>> prefetcher.start(prefetch_key("problem_framing", query), lambda: lookup(query))
+        >>> docs = prefetcher.take(prefetch_key("problem_framing", query), timeout=2.0)
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = DEFAULT_PREFETCH_WORKERS,
+        ttl_seconds: float = DEFAULT_PREFETCH_TTL_SECONDS,
+    ) -> None:
+        """Create a prefetcher.
+
+        Args:
+            max_workers: Lookups run concurrently.
+            ttl_seconds: Age after which unclaimed results are dropped.
+        """
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="context-prefetch")
+        self._ttl_seconds = ttl_seconds
+        self._pending: dict[PrefetchKey, tuple[float, Future[list[Document]]]] = {}
+        self._lock = threading.Lock()
+
+    def start(self, key: PrefetchKey, lookup: Callable[[], list[Document]]) -> bool:
+        """Start `lookup` unless one is already pending for `key`; return whether it started."""
+        now = time.monotonic()
+        with self._lock:
+            for stale in [k for k, (started, _) in self._pending.items() if now - started > self._ttl_seconds]:
+                del self._pending[stale]
+            if key in self._pending:
+                return False
+            context = contextvars.copy_context()
+            self._pending[key] = (now, self._executor.submit(context.run, lookup))
+        return True
+
+    def pending(self, key: PrefetchKey) -> bool:
+        """Return whether a lookup was started for `key` and not yet claimed."""
+        with self._lock:
+            return key in self._pending
+
+    def take(self, key: PrefetchKey, *, timeout: float) -> list[Document] | None:
+        """Claim the result for `key`, waiting up to `timeout` seconds.
+
+        Returns:
+            The documents, or None when nothing was started, the lookup failed,
+            or it did not finish in time (the entry is then left for a later claim).
+        """
+        entry = self._entry(key)
+        if entry is None:
+            return None
+        docs: list[Document] | None
+        try:
+            docs = entry[1].result(timeout=max(0.0, timeout))
+        except FutureTimeoutError:
+            return None
+        except Exception as exc:  # the caller falls back to an inline lookup
+            self._failed(key, exc)
+            docs = None
+        return self._claim(key, entry, docs)
+
+    async def atake(self, key: PrefetchKey, *, timeout: float) -> list[Document] | None:
+        """Async variant of `take` that waits without blocking the event loop."""
+        entry = self._entry(key)
+        if entry is None:
+            return None
+        future = entry[1]
+        docs: list[Document] | None
+        try:
+            if future.done() or timeout <= 0:
+                # wait_for(..., 0) times out even on a finished future; read it directly.
+                if not future.done():
+                    return None
+                docs = future.result()
+            else:
+                wrapped: asyncio.Future[list[Document]] = asyncio.wrap_future(future)
+                # shield: a timeout must not cancel the lookup, a later claim may still use it.
+                docs = await asyncio.wait_for(asyncio.shield(wrapped), timeout)
+        except TimeoutError:
+            return None
+        except Exception as exc:  # the caller falls back to an inline lookup
+            self._failed(key, exc)
+            docs = None
+        return self._claim(key, entry, docs)
+
+    def _entry(self, key: PrefetchKey) -> tuple[float, Future[list[Document]]] | None:
+        with self._lock:
+            return self._pending.get(key)
+
+    def _failed(self, key: PrefetchKey, exc: Exception) -> None:
+        logger.warning("retrieval_prefetch.failed", phase=key[2], error=str(exc))
+
+    def _claim(
+        self, key: PrefetchKey, entry: tuple[float, Future[list[Document]]], docs: list[Document] | None
+    ) -> list[Document] | None:
+        with self._lock:
+            if self._pending.get(key) is entry:
+                del self._pending[key]
+        return docs
+
+
+@cache
+def get_prefetcher() -> RetrievalPrefetcher:
+    """Return the process-wide prefetcher."""
+    return RetrievalPrefetcher()
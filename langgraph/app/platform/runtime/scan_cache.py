@@ -0,0 +1,131 @@
+"""Persistent cache of validated structured agent results (ambiguity scan).
+
+Entries are keyed on the normalized user input, a digest of the message
+history the agent receives, target phase, evidence fingerprint and a version
+digest of the agent's prompts, config (provider and model params) and schema
+module, so editing any of them invalidates old results. Values are the JSON
+dump of the validated output model.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from functools import cache
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel, ValidationError
+
+from app.platform.adapters.logging import get_logger
+from app.platform.config.file_loader import FileLoader
+from app.platform.config.paths import AGENTS_DIR, CACHE_DIR, PROVIDER_CONFIG_DIR
+from app.platform.utils.disk_cache import CacheStats, DiskCache
+from app.platform.utils.embeddings import normalize_embedding_text
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+DEFAULT_SCAN_CACHE_MAX_ENTRIES = 5_000
+# Runtime context flag (`SageRuntimeContext`) that forces a fresh agent call.
+BYPASS_SCAN_CACHE_FLAG = "bypass_scan_cache"
+
+logger = get_logger("runtime.scan_cache")
+
+
+def agent_cache_version(agent_name: str) -> str:
+    """Return a digest of the files that shape an agent's output.
+
+    Covers the agent prompts, `config.yaml`, `schema.py`, the global system prompt
+    and the provider defaults in `config/provider/`.
+    """
+    agent_dir = AGENTS_DIR / agent_name
+    paths = [
+        AGENTS_DIR / "global_system.prompt",
+        agent_dir / "config.yaml",
+        agent_dir / "schema.py",
+        *sorted(path for path in (agent_dir / "prompts").glob("*") if path.is_file()),
+        *sorted(PROVIDER_CONFIG_DIR.glob("*.yaml")),
+    ]
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(path.name.encode("utf-8") + b"\x00")
+        if path.is_file():
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def scan_cache_key(*, version: str, phase: str, user_input: str, fingerprint: str, history: str) -> str:
+    """Return the cache key of one scan (input is casefolded with collapsed whitespace)."""
+    payload = json.dumps([version, phase, normalize_embedding_text(user_input).casefold(), fingerprint, history])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ScanResultCache:
+    """Validated agent results stored in a `DiskCache`.
+
+    Example:
+        >>> scan_cache = ScanResultCache(DiskCache(":memory:"), version=agent_cache_version("ambiguity_scan"))
+        >>> key = scan_cache.key("problem_framing", "Reduce churn", fingerprint, history=messages_fingerprint(messages))
+        >>> scan_cache.set(key, output)
+        >>> scan_cache.get(key, OutputSchema)
+    """
+
+    def __init__(self, disk_cache: DiskCache, *, version: str) -> None:
+        """Wrap a disk cache.
+
+        Args:
+            disk_cache: Persistent store for the JSON-encoded results (bounded, LRU).
+            version: Prompt/model version digest mixed into every key.
+        """
+        self._cache = disk_cache
+        self._version = version
+
+    def key(self, phase: str, user_input: str, fingerprint: str, *, history: str) -> str:
+        """Return the key of a scan of `user_input` for `phase` over the fingerprinted evidence and history."""
+        return scan_cache_key(
+            version=self._version, phase=phase, user_input=user_input, fingerprint=fingerprint, history=history
+        )
+
+    def get[M: BaseModel](self, key: str, schema: type[M]) -> M | None:
+        """Return the cached result for `key`, or None on a miss or an unreadable entry."""
+        raw = self._cache.get(key)
+        if raw is None:
+            return None
+        try:
+            return schema.model_validate_json(raw)
+        except ValidationError:
+            logger.warning("scan_cache.invalid_entry", key=key)
+            return None
+
+    def set(self, key: str, result: BaseModel) -> None:
+        """Store a validated result."""
+        self._cache.set(key, result.model_dump_json().encode("utf-8"))
+
+    def stats(self) -> CacheStats:
+        """Return the hit/miss/eviction counters of the underlying cache."""
+        return self._cache.stats()
+
+
+def scan_cache_bypassed(context: Mapping[str, object] | None) -> bool:
+    """Return whether the runtime context asks for a fresh agent call."""
+    return bool((context or {}).get(BYPASS_SCAN_CACHE_FLAG))
+
+
+@cache
+def get_scan_cache(agent_name: str) -> ScanResultCache | None:
+    """Return the process-wide result cache of an agent, or None when disabled.
+
+    Configured by the `result_cache` section (`enabled`, `max_entries`) of the
+    agent's `config.yaml`; results are stored in `data/cache/<agent>_results.sqlite3`.
+    """
+    try:
+        config = FileLoader.load_agent_config(agent_name).get("result_cache") or {}
+    except FileNotFoundError:
+        config = {}
+    if not config.get("enabled", True):
+        return None
+    disk_cache = DiskCache(
+        CACHE_DIR / f"{agent_name}_results.sqlite3",
+        max_entries=int(config.get("max_entries") or DEFAULT_SCAN_CACHE_MAX_ENTRIES),
+    )
+    return ScanResultCache(disk_cache, version=agent_cache_version(agent_name))
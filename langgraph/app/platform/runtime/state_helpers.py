@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 from collections.abc import Sequence
 from typing import Literal
 
@@ -9,7 +11,7 @@ from langchain_core.messages import HumanMessage
 from langchain_core.messages.utils import AnyMessage
 
 from app.schemas.ambiguities import AmbiguityItem
-from app.state import AmbiguityContext, SageState
+from app.state import AmbiguityContext, EvidenceItem, SageState
 
 
 def get_latest_user_input(messages: Sequence[AnyMessage]) -> str | None:
@@ -106,6 +108,23 @@ def get_current_clarifying_question(context: AmbiguityContext) -> str | None:
     return pending_questions[0] if pending_questions else None
 
 
+def evidence_fingerprint(user_input: str, evidence: Sequence[EvidenceItem]) -> str:
+    """Return a stable digest of the user input and evidence (namespace, key, score) a scan sees.
+
+    Evidence order does not matter; values are not hashed, since a key identifies
+    the stored record.
+    """
+    entries = sorted((list(item.namespace), item.key, round(item.score, 6)) for item in evidence)
+    payload = json.dumps([user_input.strip(), entries], ensure_ascii=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def messages_fingerprint(messages: Sequence[AnyMessage]) -> str:
+    """Return a stable digest of a message history (type and content of each message, in order)."""
+    payload = json.dumps([[message.type, message.content] for message in messages], ensure_ascii=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
 def reset_clarification_context(
     state: SageState,
     target_step: str | None = None,
@@ -0,0 +1,131 @@
+"""Tombstones and namespace compaction for the vector write path.
+
+Items marked `deleted` are purged from every agent namespace. For live items,
+copies left in namespaces no longer listed in `agents` are purged as orphans.
+Both are found with `GetOp` probes that ride along with the write sweep and are
+removed with batched deletes (`PutOp` with `value=None`), as are chunk records
+superseded by a rewrite (trailing chunks, or a whole chunk set once chunking is off).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from langgraph.store.base import BaseStore, GetOp, Item, PutOp
+
+from app.platform.runtime.vector_write_plan import require_item_uuid
+from app.platform.utils.chunking import chunk_key
+from app.platform.utils.namespace_utils import build_agent_namespace, build_agent_namespace_prefix
+from app.state.write_state import VectorWriteItem
+
+# Page size for namespace listings; every page is read.
+NAMESPACE_PAGE_SIZE = 1000
+
+
+def list_agent_namespaces(store: BaseStore) -> list[tuple[str, ...]]:
+    """Return every agent namespace currently present in the Store.
+
+    List once per sync or ingest and pass the result to the writer; each call
+    walks the full namespace listing.
+    """
+    namespaces: list[tuple[str, ...]] = []
+    while True:
+        page = store.list_namespaces(
+            prefix=build_agent_namespace_prefix(), limit=NAMESPACE_PAGE_SIZE, offset=len(namespaces)
+        )
+        namespaces.extend(page)
+        if len(page) < NAMESPACE_PAGE_SIZE:
+            return namespaces
+
+
+async def alist_agent_namespaces(store: BaseStore) -> list[tuple[str, ...]]:
+    """Async variant of `list_agent_namespaces`."""
+    namespaces: list[tuple[str, ...]] = []
+    while True:
+        page = await store.alist_namespaces(
+            prefix=build_agent_namespace_prefix(), limit=NAMESPACE_PAGE_SIZE, offset=len(namespaces)
+        )
+        namespaces.extend(page)
+        if len(page) < NAMESPACE_PAGE_SIZE:
+            return namespaces
+
+
+def plan_orphan_probes(items: Iterable[VectorWriteItem], namespaces: Sequence[tuple[str, ...]]) -> list[GetOp]:
+    """Build lookups for item copies outside the namespaces each item should live in.
+
+    Tombstoned items (`deleted`) and items without agents are probed in every
+    namespace. Each probe pair covers the whole-document key and the first chunk.
+
+    Raises:
+        ValueError: If an item is missing its UUID.
+    """
+    probes: list[GetOp] = []
+    for item in items:
+        uuid = require_item_uuid(item)
+        agents = [] if item.get("deleted") else item.get("agents") or []
+        keep = {build_agent_namespace(agent) for agent in agents}
+        for namespace in namespaces:
+            if tuple(namespace) not in keep:
+                probes.extend((GetOp(tuple(namespace), uuid), GetOp(tuple(namespace), chunk_key(uuid, 0))))
+    return probes
+
+
+def orphan_deletes(probes: Sequence[GetOp], found: Sequence[Any]) -> list[PutOp]:
+    """Turn probe hits into deletes, expanding a first chunk to its whole chunk set."""
+    keys: dict[tuple[tuple[str, ...], str], None] = {}
+    for probe, stored in zip(probes, found, strict=True):
+        if stored is None:
+            continue
+        value = stored.value or {}
+        if "chunk_count" in value:
+            for index in range(int(value["chunk_count"] or 0)):
+                keys[(probe.namespace, chunk_key(str(value["uuid"]), index))] = None
+        else:
+            keys[(probe.namespace, probe.key)] = None
+    return [PutOp(namespace=namespace, key=key, value=None) for namespace, key in keys]
+
+
+def stale_chunk_deletes(op: PutOp, stored: Item | None) -> list[PutOp]:
+    """Delete records superseded by a rewritten chunk set.
+
+    When the first chunk is new, the item may still be stored whole under its plain
+    UUID (written before chunking was enabled); when it is rewritten, trailing chunks
+    beyond the new count are left over if the item shrank.
+    """
+    value = op.value or {}
+    if value.get("chunk_index") != 0:
+        return []
+    if stored is None:
+        return [PutOp(namespace=op.namespace, key=str(value["uuid"]), value=None)]
+    previous_count = int(stored.value.get("chunk_count", 0) or 0)
+    return [
+        PutOp(namespace=op.namespace, key=chunk_key(value["uuid"], index), value=None)
+        for index in range(int(value["chunk_count"]), previous_count)
+    ]
+
+
+def plan_chunk_set_probes(pending: Sequence[PutOp], stored: Sequence[Item | None]) -> list[GetOp]:
+    """Probe `uuid#0` for whole-record puts with no stored plain record.
+
+    Such an item is new, or was last written with chunking enabled.
+    """
+    return [
+        GetOp(op.namespace, chunk_key(op.key, 0))
+        for op, item in zip(pending, stored, strict=True)
+        if item is None and op.value is not None and "chunk_index" not in op.value
+    ]
+
+
+def chunk_set_deletes(probes: Sequence[GetOp], found: Sequence[Any]) -> list[PutOp]:
+    """Delete every chunk of the chunk sets found by `plan_chunk_set_probes`."""
+    deletes: list[PutOp] = []
+    for probe, item in zip(probes, found, strict=True):
+        if item is None:
+            continue
+        uuid = str(item.value.get("uuid") or probe.key.rsplit("#", 1)[0])
+        count = max(1, int(item.value.get("chunk_count", 0) or 0))
+        deletes.extend(
+            PutOp(namespace=probe.namespace, key=chunk_key(uuid, index), value=None) for index in range(count)
+        )
+    return deletes
@@ -0,0 +1,198 @@
+"""Streaming ingest of vector write items in bounded windows.
+
+Large imports never pass through graph state: items are pulled lazily from an
+iterator (or an NDJSON file), written through the batched vector writer one
+window at a time, and reported via `emit_event`-compatible progress updates.
+Agent namespaces are listed once per ingest, not once per window.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator, Mapping
+from itertools import islice
+from pathlib import Path
+from typing import Any
+
+from langgraph.config import get_store
+from langgraph.store.base import BaseStore
+
+from app.platform.adapters.events import emit_event
+from app.platform.core.dto.vector_writes import VectorWriteReport
+from app.platform.runtime.vector_compaction import alist_agent_namespaces, list_agent_namespaces
+from app.platform.runtime.vector_writes import (
+    DEFAULT_WRITE_CHUNK_SIZE,
+    awrite_vector_batch,
+    merge_reports,
+    write_vector_batch,
+)
+from app.platform.utils.chunking import ChunkingConfig
+from app.platform.utils.namespace_utils import build_agent_namespace
+from app.state.write_state import VectorWriteItem
+
+DEFAULT_INGEST_WINDOW_SIZE = 500
+
+ProgressCallback = Callable[[dict[str, Any]], None]
+
+
+def _item_from_payload(payload: Mapping[str, Any]) -> VectorWriteItem:
+    """Build a write item from a decoded JSON object (missing fields get defaults)."""
+    item = VectorWriteItem(
+        uuid=str(payload.get("uuid") or ""),
+        title=str(payload.get("title") or ""),
+        text=str(payload.get("text") or ""),
+        tags=[str(tag) for tag in payload.get("tags") or []],
+        agents=[str(agent) for agent in payload.get("agents") or []],
+        changed=int(payload.get("changed") or 0),
+    )
+    if payload.get("deleted"):
+        item["deleted"] = True
+    return item
+
+
+def iter_ndjson_items(path: Path | str) -> Iterator[VectorWriteItem]:
+    """Lazily yield vector write items from an NDJSON file (one JSON object per line).
+
+    Raises:
+        ValueError: If a non-blank line is not a JSON object.
+    """
+    with Path(path).open(encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                payload = json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"{path}:{line_number}: invalid JSON ({exc.msg})") from exc
+            if not isinstance(payload, dict):
+                raise ValueError(f"{path}:{line_number}: expected a JSON object")
+            yield _item_from_payload(payload)
+
+
+def _windows(items: Iterable[VectorWriteItem], window_size: int) -> Iterator[list[VectorWriteItem]]:
+    iterator = iter(items)
+    while window := list(islice(iterator, max(1, window_size))):
+        yield window
+
+
+async def _awindows(
+    items: Iterable[VectorWriteItem] | AsyncIterable[VectorWriteItem],
+    window_size: int,
+) -> AsyncIterator[list[VectorWriteItem]]:
+    if not isinstance(items, AsyncIterable):
+        for batch in _windows(items, window_size):
+            yield batch
+        return
+    size = max(1, window_size)
+    window: list[VectorWriteItem] = []
+    async for item in items:
+        window.append(item)
+        if len(window) >= size:
+            yield window
+            window = []
+    if window:
+        yield window
+
+
+def _with_item_namespaces(
+    namespaces: list[tuple[str, ...]], window: Iterable[VectorWriteItem]
+) -> list[tuple[str, ...]]:
+    """Add namespaces created by a written window to the listing later windows probe."""
+    written = (build_agent_namespace(agent) for item in window for agent in item.get("agents") or [])
+    return list(dict.fromkeys([*namespaces, *written]))
+
+
+def _report_window(
+    index: int,
+    size: int,
+    report: VectorWriteReport,
+    total: VectorWriteReport,
+    seconds: float,
+    on_progress: ProgressCallback | None,
+) -> None:
+    update = emit_event(
+        owner="vector_ingest",
+        kind="progress",
+        message=f"Ingested window {index} ({size} items).",
+        data={
+            "window": index,
+            "items": size,
+            "written": report.written,
+            "skipped": report.skipped,
+            "seconds": seconds,
+            "total_written": total.written,
+            "total_skipped": total.skipped,
+        },
+    )
+    if on_progress is not None:
+        on_progress(update)
+
+
+def ingest_vector_items(
+    items: Iterable[VectorWriteItem],
+    *,
+    store: BaseStore | None = None,
+    window_size: int = DEFAULT_INGEST_WINDOW_SIZE,
+    chunk_size: int = DEFAULT_WRITE_CHUNK_SIZE,
+    chunking: ChunkingConfig | None = None,
+    on_progress: ProgressCallback | None = None,
+) -> VectorWriteReport:
+    """Write items through `write_vector_batch` in bounded windows.
+
+    At most `window_size` items are held in memory at once, regardless of how many
+    the iterator yields.
+
+    Args:
+        items: Item iterator (e.g. `iter_ndjson_items(path)`).
+        store: Optional Store override. Defaults to the runtime Store.
+        window_size: Items pulled from the iterator per write batch.
+        chunk_size: Max put operations per Store batch call.
+        chunking: Optional text chunking; None stores each item as one record.
+        on_progress: Optional callback receiving one `emit_event` update per window.
+
+    Side effects/state writes:
+        Writes to the Store and logs one progress trace event per window.
+
+    Returns:
+        VectorWriteReport with summed counts (per-chunk timings are omitted).
+    """
+    total = VectorWriteReport()
+    resolved_store = store if store is not None else get_store()
+    # One namespace listing covers every window's orphan probes.
+    namespaces = list_agent_namespaces(resolved_store)
+    for index, window in enumerate(_windows(items, window_size)):
+        started = time.perf_counter()
+        report = write_vector_batch(
+            window, store=resolved_store, chunk_size=chunk_size, chunking=chunking, namespaces=namespaces
+        )
+        total = merge_reports(total, report)
+        namespaces = _with_item_namespaces(namespaces, window)
+        _report_window(index, len(window), report, total, time.perf_counter() - started, on_progress)
+    return total
+
+
+async def aingest_vector_items(
+    items: Iterable[VectorWriteItem] | AsyncIterable[VectorWriteItem],
+    *,
+    store: BaseStore | None = None,
+    window_size: int = DEFAULT_INGEST_WINDOW_SIZE,
+    chunk_size: int = DEFAULT_WRITE_CHUNK_SIZE,
+    chunking: ChunkingConfig | None = None,
+    on_progress: ProgressCallback | None = None,
+) -> VectorWriteReport:
+    """Async variant of `ingest_vector_items`; also accepts async iterators."""
+    total = VectorWriteReport()
+    resolved_store = store if store is not None else get_store()
+    namespaces = await alist_agent_namespaces(resolved_store)
+    index = 0
+    async for window in _awindows(items, window_size):
+        started = time.perf_counter()
+        report = await awrite_vector_batch(
+            window, store=resolved_store, chunk_size=chunk_size, chunking=chunking, namespaces=namespaces
+        )
+        total = merge_reports(total, report)
+        namespaces = _with_item_namespaces(namespaces, window)
+        _report_window(index, len(window), report, total, time.perf_counter() - started, on_progress)
+        index += 1
+    return total
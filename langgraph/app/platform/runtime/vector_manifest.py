@@ -0,0 +1,60 @@
+"""Delta-sync manifest of stored context items.
+
+Clients (the Drupal `vector_sync` module) fetch the manifest, diff it against their
+own content and send only items that are new or changed.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from langgraph.config import get_store
+from langgraph.store.base import BaseStore
+
+from app.platform.core.dto.vector_writes import ManifestEntry
+from app.platform.runtime.vector_write_plan import content_hash
+from app.platform.utils.namespace_utils import build_agent_namespace_prefix
+
+DEFAULT_MANIFEST_PAGE_SIZE = 500
+
+
+def build_vector_manifest(
+    namespace_prefix: Sequence[str] | None = None,
+    *,
+    store: BaseStore | None = None,
+    page_size: int = DEFAULT_MANIFEST_PAGE_SIZE,
+) -> list[ManifestEntry]:
+    """List `(uuid, changed, content_hash)` for every item under a namespace prefix.
+
+    An item written to several agent namespaces (or as several chunks) yields one
+    entry carrying its oldest copy, so a stale namespace makes the client resend it.
+
+    Args:
+        namespace_prefix: Namespace prefix to scan. Defaults to all agent namespaces.
+        store: Optional Store override. Defaults to the runtime Store.
+        page_size: Items fetched per `store.search` page.
+
+    Returns:
+        Manifest entries sorted by UUID.
+    """
+    resolved_store = store if store is not None else get_store()
+    prefix = tuple(namespace_prefix) if namespace_prefix else build_agent_namespace_prefix()
+    size = max(1, page_size)
+    entries: dict[str, ManifestEntry] = {}
+    offset = 0
+    while True:
+        page = resolved_store.search(prefix, limit=size, offset=offset)
+        for item in page:
+            value = item.value or {}
+            entry = ManifestEntry(
+                uuid=str(value.get("uuid") or item.key),  # chunk records carry their item uuid
+                changed=int(value.get("changed", 0) or 0),
+                content_hash=str(value.get("content_hash") or content_hash(str(value.get("text", "")))),
+            )
+            current = entries.get(entry.uuid)
+            if current is None or entry.changed < current.changed:
+                entries[entry.uuid] = entry
+        if len(page) < size:
+            break
+        offset += size
+    return [entries[uuid] for uuid in sorted(entries)]
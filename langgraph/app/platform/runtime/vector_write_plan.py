@@ -0,0 +1,116 @@
+"""Planning of Store records for vector write items.
+
+Turns items into `PutOp`s: one record per agent namespace, or one per chunk
+(keyed `uuid#n`) when a `ChunkingConfig` is given.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from langgraph.store.base import Item, PutOp
+
+from app.platform.utils.chunking import ChunkingConfig, chunk_key, split_text
+from app.platform.utils.namespace_utils import build_agent_namespace
+from app.state.write_state import VectorWriteItem
+
+# Tags mirrored as `{tag: True}` so Store filters can test membership (filters
+# compare whole lists, but match nested keys).
+TAG_INDEX_FIELD = "tag_index"
+
+
+def require_item_uuid(metadata: Mapping[str, Any]) -> str:
+    """Return the item UUID used as the Store key (required for idempotent upserts)."""
+    uuid = metadata.get("uuid")
+    if not uuid:
+        raise ValueError("metadata.uuid is required (Drupal content UUID).")
+    return str(uuid)
+
+
+def content_hash(text: str) -> str:
+    """Return the SHA-256 hex digest of item text (matches PHP `hash('sha256', $text)`)."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def build_context_value(content: str, metadata: Mapping[str, Any]) -> dict[str, Any]:
+    """Build the Store value for a context item."""
+    tags = metadata.get("tags") or []
+    return {
+        "text": content,  # <- this is what you embed (fields=["text"])
+        "content_hash": content_hash(content),
+        "title": metadata.get("title", ""),
+        "tags": tags,  # machine names
+        TAG_INDEX_FIELD: {str(tag): True for tag in tags},
+        "agents": metadata.get("agents") or [],  # machine names
+        "changed": int(metadata.get("changed", 0) or 0),
+    }
+
+
+def is_unchanged(existing: Item | None, changed: int) -> bool:
+    """Return True when the stored record is at least as new as `changed`."""
+    return bool(existing and int(existing.value.get("changed", 0)) >= changed)
+
+
+def _chunk_records(uuid: str, value: dict[str, Any], chunking: ChunkingConfig | None) -> list[tuple[str, dict]]:
+    if chunking is None or not chunking.enabled:
+        return [(uuid, value)]
+    chunks = split_text(
+        value["text"],
+        size=chunking.size,
+        overlap=chunking.overlap,
+        sentence_aware=chunking.sentence_aware,
+    )
+    return [
+        (
+            chunk_key(uuid, chunk.index),
+            {
+                **value,
+                "text": chunk.text,
+                "uuid": uuid,
+                "chunk_index": chunk.index,
+                "chunk_count": len(chunks),
+                "chunk_start": chunk.start,
+            },
+        )
+        for chunk in chunks
+    ]
+
+
+def plan_item_ops(
+    content: str,
+    metadata: Mapping[str, Any],
+    namespaces: Iterable[tuple[str, ...]],
+    *,
+    chunking: ChunkingConfig | None = None,
+) -> list[PutOp]:
+    """Build indexed `PutOp`s for one item in each namespace (one per chunk when chunking).
+
+    Raises:
+        ValueError: If the metadata is missing its UUID.
+    """
+    uuid = require_item_uuid(metadata)
+    records = _chunk_records(uuid, build_context_value(content, metadata), chunking)
+    # index=None -> use default index fields from langgraph.json
+    return [PutOp(namespace=ns, key=key, value=value, index=None) for ns in namespaces for key, value in records]
+
+
+def plan_put_ops(items: Iterable[VectorWriteItem], *, chunking: ChunkingConfig | None = None) -> list[PutOp]:
+    """Expand items into indexed `PutOp`s for every agent namespace they list.
+
+    Tombstoned items (`deleted`) are skipped; see `vector_compaction`.
+
+    Raises:
+        ValueError: If an item is missing its UUID.
+    """
+    ops: list[PutOp] = []
+    for item in items:
+        if item.get("deleted"):
+            continue
+        agents = list(dict.fromkeys(item.get("agents") or []))
+        if not agents:
+            continue
+        namespaces = [build_agent_namespace(agent) for agent in agents]
+        ops.extend(plan_item_ops(item.get("text", "") or "", {**item, "agents": agents}, namespaces, chunking=chunking))
+    return ops
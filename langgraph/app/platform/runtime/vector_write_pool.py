@@ -0,0 +1,247 @@
+"""Concurrent vector writes: batched chunks in flight at once, with retries.
+
+Items go through the same plan as `write_vector_batch`: one `abatch` sweep
+finds new or newer records, and the pending puts/deletes are split into
+`chunk_size` chunks (one Store round trip, one embedding call each). Chunks are
+sent concurrently, so slow embedding round trips overlap. A semaphore caps the
+chunks in flight. A chunk that fails is retried with exponential backoff, and
+the semaphore is released while it waits. When every attempt fails, the chunk's
+items are sent once more one item at a time, so only the items that still fail
+are reported (instead of raised).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from dataclasses import dataclass
+from functools import cache, partial
+
+from langgraph.config import get_store
+from langgraph.store.base import BaseStore, PutOp
+
+from app.platform.adapters.logging import get_logger
+from app.platform.config.file_loader import FileLoader
+from app.platform.core.dto.vector_writes import FailedWriteItem, VectorWriteReport, WriteChunkTiming
+from app.platform.runtime.vector_compaction import alist_agent_namespaces, plan_orphan_probes
+from app.platform.runtime.vector_write_plan import plan_put_ops, require_item_uuid
+from app.platform.runtime.vector_writes import (
+    DEFAULT_WRITE_CHUNK_SIZE,
+    asend_ops,
+    asweep_put_ops,
+    chunk_ops,
+    record_writes,
+)
+from app.platform.utils.chunking import ChunkingConfig, parse_chunk_key
+from app.state.write_state import VectorWriteItem
+
+DEFAULT_WRITE_CONCURRENCY = 8
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_BACKOFF_SECONDS = 0.5
+MAX_BACKOFF_SECONDS = 8.0
+
+logger = get_logger("runtime.vector_write_pool")
+
+
+@dataclass(frozen=True)
+class WritePoolSettings:
+    """Concurrency and retry settings for `awrite_vector_items`."""
+
+    concurrency: int = DEFAULT_WRITE_CONCURRENCY
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    backoff_seconds: float = DEFAULT_BACKOFF_SECONDS
+
+
+@cache
+def get_write_pool_settings() -> WritePoolSettings | None:
+    """Return the `writer` section of `config/embeddings.yaml`, or None when disabled.
+
+    The concurrent writer is enabled by a positive `writer.concurrency`.
+    """
+    try:
+        section = FileLoader.load_embeddings_config().get("writer") or {}
+    except FileNotFoundError:
+        return None
+    concurrency = int(section.get("concurrency") or 0)
+    if concurrency <= 0:
+        return None
+    return WritePoolSettings(
+        concurrency=concurrency,
+        max_attempts=int(section.get("max_attempts") or DEFAULT_MAX_ATTEMPTS),
+        backoff_seconds=float(section.get("backoff_seconds") or DEFAULT_BACKOFF_SECONDS),
+    )
+
+
+def _failure(uuid: str, error: Exception, attempts: int) -> FailedWriteItem:
+    return FailedWriteItem(uuid=uuid, error=f"{type(error).__name__}: {error}", attempts=attempts)
+
+
+def _valid_items(batch: Sequence[VectorWriteItem]) -> tuple[list[VectorWriteItem], list[FailedWriteItem]]:
+    """Split off items with an invalid payload (e.g. missing uuid); retrying cannot help."""
+    valid: list[VectorWriteItem] = []
+    failed: list[FailedWriteItem] = []
+    for item in batch:
+        try:
+            require_item_uuid(item)
+        except ValueError as exc:
+            failed.append(_failure(str(item.get("uuid") or ""), exc, 1))
+            continue
+        valid.append(item)
+    return valid, failed
+
+
+@dataclass(frozen=True)
+class _Attempts:
+    """Outcome of a retried round trip; `error` is set when every attempt failed."""
+
+    result: object
+    error: Exception | None
+    attempts: int
+
+
+class _RetryingSender:
+    """Runs Store round trips under a shared semaphore, backing off outside it."""
+
+    def __init__(self, *, concurrency: int, max_attempts: int, backoff_seconds: float) -> None:
+        self._semaphore = asyncio.Semaphore(max(1, concurrency))
+        self._max_attempts = max(1, max_attempts)
+        self._backoff_seconds = backoff_seconds
+
+    async def run(
+        self, call: Callable[[], Awaitable[object]], *, label: str, max_attempts: int | None = None
+    ) -> _Attempts:
+        limit = self._max_attempts if max_attempts is None else max(1, max_attempts)
+        attempt = 0
+        while True:
+            attempt += 1
+            async with self._semaphore:
+                try:
+                    return _Attempts(await call(), None, attempt)
+                except Exception as exc:
+                    error = exc
+            if attempt >= limit:
+                logger.error("vector_write_pool.failed", target=label, attempts=attempt, error=str(error))
+                return _Attempts(None, error, attempt)
+            delay = min(self._backoff_seconds * 2 ** (attempt - 1), MAX_BACKOFF_SECONDS)
+            logger.warning("vector_write_pool.retry", target=label, attempt=attempt, delay=delay)
+            # Back off without holding a slot, so other chunks keep going.
+            await asyncio.sleep(delay)
+
+
+async def _asend_items(
+    sender: _RetryingSender, store: BaseStore, chunk: Sequence[PutOp], *, index: int, chunk_outcome: _Attempts
+) -> tuple[list[PutOp], list[FailedWriteItem]]:
+    """Resend a failed chunk one item at a time (one attempt each); return (ops sent, failed items)."""
+    by_item: defaultdict[str, list[PutOp]] = defaultdict(list)
+    for op in chunk:
+        by_item[parse_chunk_key(op.key)[0]].append(op)
+    error = chunk_outcome.error or RuntimeError("chunk failed")
+    if len(by_item) == 1:
+        return [], [_failure(uuid, error, chunk_outcome.attempts) for uuid in by_item]
+    outcomes = await asyncio.gather(
+        *(
+            sender.run(partial(asend_ops, store, ops), label=f"chunk-{index}/{uuid}", max_attempts=1)
+            for uuid, ops in by_item.items()
+        )
+    )
+    sent: list[PutOp] = []
+    failed: list[FailedWriteItem] = []
+    for (uuid, ops), outcome in zip(by_item.items(), outcomes, strict=True):
+        if outcome.error is None:
+            sent.extend(ops)
+        else:
+            failed.append(_failure(uuid, outcome.error, chunk_outcome.attempts + outcome.attempts))
+    return sent, failed
+
+
+async def _asend_chunks(
+    sender: _RetryingSender, store: BaseStore, chunks: Sequence[Sequence[PutOp]]
+) -> tuple[list[PutOp], list[FailedWriteItem], tuple[WriteChunkTiming, ...]]:
+    """Send chunks concurrently; return (ops sent, failed items, per-chunk timings)."""
+
+    async def send(index: int, chunk: Sequence[PutOp]) -> tuple[list[PutOp], list[FailedWriteItem], WriteChunkTiming]:
+        started = time.perf_counter()
+        outcome = await sender.run(partial(asend_ops, store, chunk), label=f"chunk-{index}")
+        sent: list[PutOp] = list(chunk)
+        failed: list[FailedWriteItem] = []
+        if outcome.error is not None:
+            sent, failed = await _asend_items(sender, store, chunk, index=index, chunk_outcome=outcome)
+        return sent, failed, WriteChunkTiming(index=index, ops=len(chunk), seconds=time.perf_counter() - started)
+
+    results = await asyncio.gather(*(send(index, chunk) for index, chunk in enumerate(chunks)))
+    sent: list[PutOp] = []
+    failed: dict[str, FailedWriteItem] = {}
+    for chunk_sent, chunk_failed, _ in results:
+        sent.extend(chunk_sent)
+        for failure in chunk_failed:
+            failed.setdefault(failure.uuid, failure)
+    return sent, list(failed.values()), tuple(timing for _, _, timing in results)
+
+
+async def awrite_vector_items(
+    items: Iterable[VectorWriteItem],
+    *,
+    store: BaseStore | None = None,
+    concurrency: int = DEFAULT_WRITE_CONCURRENCY,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    backoff_seconds: float = DEFAULT_BACKOFF_SECONDS,
+    chunk_size: int = DEFAULT_WRITE_CHUNK_SIZE,
+    chunking: ChunkingConfig | None = None,
+    compact: bool = True,
+    namespaces: Sequence[tuple[str, ...]] | None = None,
+) -> VectorWriteReport:
+    """Write items in batched chunks, several chunks in flight at once.
+
+    Args:
+        items: Items to write (tombstones included).
+        store: Optional Store override. Defaults to the runtime Store.
+        concurrency: Max Store round trips in flight at once.
+        max_attempts: Attempts per chunk round trip. A chunk that still fails is resent
+            one item at a time, and only the items failing that too are reported.
+        backoff_seconds: Delay before the first retry; doubled per attempt (capped).
+        chunk_size: Max operations sent per chunk (one embedding call covers a chunk).
+        chunking: Optional text chunking; None stores each item as one record.
+        compact: Purge copies left in namespaces an item no longer lists in `agents`.
+        namespaces: Agent namespaces probed when compacting (listed once when None).
+
+    Returns:
+        VectorWriteReport with counts, per-chunk timings and `failed` items.
+    """
+    valid, failed = _valid_items(list(items))
+    if not valid:
+        return VectorWriteReport(failed=tuple(failed))
+    resolved_store = store if store is not None else get_store()
+    if not compact:
+        namespaces = []
+    elif namespaces is None:
+        namespaces = await alist_agent_namespaces(resolved_store)
+    candidates = plan_put_ops(valid, chunking=chunking)
+    probes = plan_orphan_probes(valid, namespaces)
+    sender = _RetryingSender(concurrency=concurrency, max_attempts=max_attempts, backoff_seconds=backoff_seconds)
+
+    started = time.perf_counter()
+    sweep = await sender.run(lambda: asweep_put_ops(candidates, store=resolved_store, probes=probes), label="sweep")
+    lookup_seconds = time.perf_counter() - started
+    if sweep.error is not None or not isinstance(sweep.result, tuple):
+        error = sweep.error or RuntimeError("sweep failed")
+        failed.extend(_failure(uuid, error, sweep.attempts) for uuid in dict.fromkeys(item["uuid"] for item in valid))
+        return VectorWriteReport(requested=len(candidates), lookup_seconds=lookup_seconds, failed=tuple(failed))
+    pending, deletes = sweep.result
+
+    sent, chunk_failures, timings = await _asend_chunks(
+        sender, resolved_store, chunk_ops([*pending, *deletes], chunk_size)
+    )
+    record_writes(resolved_store, sent)
+
+    written = sum(1 for op in sent if op.value is not None)
+    return VectorWriteReport(
+        requested=len(candidates),
+        written=written,
+        skipped=len(candidates) - len(pending),
+        deleted=len(sent) - written,
+        lookup_seconds=lookup_seconds,
+        chunks=timings,
+        failed=(*failed, *chunk_failures),
+    )
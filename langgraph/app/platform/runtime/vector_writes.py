@@ -0,0 +1,279 @@
+"""Batched vector write engine for the LangGraph Store.
+
+A batch is written in two phases:
+1. One multi-key `GetOp` sweep over every (item, agent namespace) pair to find
+   records whose stored `changed` timestamp is not older than the incoming one.
+2. The remaining `PutOp`s are sent in fixed-size chunks through `BaseStore.batch`
+   (or `abatch`), with per-chunk timings reported back to the caller.
+
+With a `ChunkingConfig`, each item is split into records keyed `uuid#n`; when a
+rewritten item has fewer chunks than before, its trailing chunks are deleted.
+Items written whole that have no stored plain record get one follow-up probe for
+`uuid#0`, so chunks left over from a run with chunking enabled are deleted too.
+Tombstones and orphaned namespace copies are probed in the same sweep and deleted
+in the same chunks (see `vector_compaction`). Written namespaces get a new lookup
+generation, invalidating cached `context_lookup` results (see `retrieval_cache`),
+and every written op is applied to the in-process BM25 index (see `lexical_index`).
+"""
+
+from __future__ import annotations
+
+import time
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from langgraph.config import get_store
+from langgraph.store.base import BaseStore, GetOp, Item, PutOp
+
+from app.platform.core.dto.vector_writes import VectorWriteReport, WriteChunkTiming
+from app.platform.runtime.lexical_index import get_lexical_index
+from app.platform.runtime.retrieval_cache import bump_namespace_generations
+from app.platform.runtime.vector_compaction import (
+    alist_agent_namespaces,
+    chunk_set_deletes,
+    list_agent_namespaces,
+    orphan_deletes,
+    plan_chunk_set_probes,
+    plan_orphan_probes,
+    stale_chunk_deletes,
+)
+from app.platform.runtime.vector_write_plan import is_unchanged, plan_put_ops
+from app.platform.utils.chunking import ChunkingConfig
+from app.state.write_state import VectorWriteItem
+
+DEFAULT_WRITE_CHUNK_SIZE = 64
+
+
+def _sweep_ops(candidates: Sequence[PutOp], probes: Sequence[GetOp]) -> list[GetOp]:
+    return [*(GetOp(op.namespace, op.key) for op in candidates), *probes]
+
+
+def _pending_ops(
+    candidates: Sequence[PutOp],
+    probes: Sequence[GetOp],
+    results: Sequence[Any],
+) -> tuple[list[PutOp], list[PutOp], list[GetOp]]:
+    """Return (puts for new or newer records, deletes for stale chunks and orphans, chunk set probes)."""
+    existing, found = results[: len(candidates)], results[len(candidates) :]
+    pending: list[PutOp] = []
+    pending_stored: list[Item | None] = []
+    deletes: list[PutOp] = orphan_deletes(probes, found)
+    for op, stored in zip(candidates, existing, strict=True):
+        if is_unchanged(stored, int((op.value or {}).get("changed", 0))):
+            continue
+        pending.append(op)
+        pending_stored.append(stored)
+        deletes.extend(stale_chunk_deletes(op, stored))
+    return pending, deletes, plan_chunk_set_probes(pending, pending_stored)
+
+
+def chunk_ops(ops: Sequence[PutOp], chunk_size: int) -> list[Sequence[PutOp]]:
+    """Split ops into consecutive chunks of at most `chunk_size`."""
+    size = max(1, chunk_size)
+    return [ops[start : start + size] for start in range(0, len(ops), size)]
+
+
+def _distinct_text_groups(chunk: Sequence[PutOp]) -> list[list[PutOp]]:
+    """Split a chunk so no two ops in one `batch` call carry the same text.
+
+    Stores group texts to embed per batch and some (e.g. InMemoryStore) reject
+    duplicates. Repeats land in follow-up groups, where the Store embedder
+    reuses the vector it just computed.
+    """
+    seen: Counter[str] = Counter()
+    groups: list[list[PutOp]] = []
+    for op in chunk:
+        # Deletes embed nothing and always go with the first group.
+        position = 0
+        if op.value is not None:
+            text = str(op.value.get("text", ""))
+            position = seen[text]
+            seen[text] += 1
+        if position == len(groups):
+            groups.append([])
+        groups[position].append(op)
+    return groups
+
+
+def _build_report(
+    candidates: Sequence[PutOp],
+    pending: Sequence[PutOp],
+    deletes: Sequence[PutOp],
+    lookup_seconds: float,
+    timings: Sequence[WriteChunkTiming],
+) -> VectorWriteReport:
+    return VectorWriteReport(
+        requested=len(candidates),
+        written=len(pending),
+        skipped=len(candidates) - len(pending),
+        deleted=len(deletes),
+        lookup_seconds=lookup_seconds,
+        chunks=tuple(timings),
+    )
+
+
+def merge_reports(total: VectorWriteReport, report: VectorWriteReport) -> VectorWriteReport:
+    """Sum two reports' counters and failures (per-chunk timings are dropped)."""
+    return VectorWriteReport(
+        requested=total.requested + report.requested,
+        written=total.written + report.written,
+        skipped=total.skipped + report.skipped,
+        deleted=total.deleted + report.deleted,
+        lookup_seconds=total.lookup_seconds + report.lookup_seconds,
+        failed=total.failed + report.failed,
+    )
+
+
+def record_writes(store: BaseStore, ops: Sequence[PutOp]) -> None:
+    """Invalidate cached lookups and update the Store's lexical index for written ops."""
+    bump_namespace_generations(store, (op.namespace for op in ops))
+    index = get_lexical_index(store)
+    if index is not None:
+        index.apply(ops)
+
+
+def _resolve_store(store: BaseStore | None) -> BaseStore:
+    return store if store is not None else get_store()
+
+
+async def asweep_put_ops(
+    candidates: Sequence[PutOp], *, store: BaseStore, probes: Sequence[GetOp] = ()
+) -> tuple[list[PutOp], list[PutOp]]:
+    """Look up every candidate and probe in one `abatch` sweep.
+
+    Returns:
+        (puts for new or newer records, deletes for stale chunks and orphans).
+    """
+    results = await store.abatch(_sweep_ops(candidates, probes))
+    pending, deletes, chunk_probes = _pending_ops(candidates, probes, results)
+    if chunk_probes:
+        deletes.extend(chunk_set_deletes(chunk_probes, await store.abatch(chunk_probes)))
+    return pending, deletes
+
+
+async def asend_ops(store: BaseStore, chunk: Sequence[PutOp]) -> None:
+    """Send one chunk of puts/deletes, split so no `abatch` call repeats a text."""
+    for group in _distinct_text_groups(chunk):
+        await store.abatch(group)
+
+
+def write_put_ops(
+    candidates: Sequence[PutOp],
+    *,
+    store: BaseStore | None = None,
+    chunk_size: int = DEFAULT_WRITE_CHUNK_SIZE,
+    probes: Sequence[GetOp] = (),
+) -> VectorWriteReport:
+    """Write planned `PutOp`s, skipping records whose stored copy is not older.
+
+    Args:
+        candidates: Ops from `plan_put_ops` / `plan_item_ops`.
+        store: Optional Store override. Defaults to the runtime Store.
+        chunk_size: Max operations sent per chunk.
+        probes: Orphan lookups from `plan_orphan_probes`; hits are deleted.
+
+    Returns:
+        VectorWriteReport with counts and per-chunk timings.
+    """
+    if not candidates and not probes:
+        return VectorWriteReport()
+    resolved_store = _resolve_store(store)
+
+    started = time.perf_counter()
+    results = resolved_store.batch(_sweep_ops(candidates, probes))
+    pending, deletes, chunk_probes = _pending_ops(candidates, probes, results)
+    if chunk_probes:
+        deletes.extend(chunk_set_deletes(chunk_probes, resolved_store.batch(chunk_probes)))
+    lookup_seconds = time.perf_counter() - started
+
+    timings: list[WriteChunkTiming] = []
+    for index, chunk in enumerate(chunk_ops([*pending, *deletes], chunk_size)):
+        started = time.perf_counter()
+        for group in _distinct_text_groups(chunk):
+            resolved_store.batch(group)
+        timings.append(WriteChunkTiming(index=index, ops=len(chunk), seconds=time.perf_counter() - started))
+    record_writes(resolved_store, [*pending, *deletes])
+
+    return _build_report(candidates, pending, deletes, lookup_seconds, timings)
+
+
+async def awrite_put_ops(
+    candidates: Sequence[PutOp],
+    *,
+    store: BaseStore | None = None,
+    chunk_size: int = DEFAULT_WRITE_CHUNK_SIZE,
+    probes: Sequence[GetOp] = (),
+) -> VectorWriteReport:
+    """Async variant of `write_put_ops` built on `BaseStore.abatch`."""
+    if not candidates and not probes:
+        return VectorWriteReport()
+    resolved_store = _resolve_store(store)
+
+    started = time.perf_counter()
+    pending, deletes = await asweep_put_ops(candidates, store=resolved_store, probes=probes)
+    lookup_seconds = time.perf_counter() - started
+
+    timings: list[WriteChunkTiming] = []
+    for index, chunk in enumerate(chunk_ops([*pending, *deletes], chunk_size)):
+        started = time.perf_counter()
+        await asend_ops(resolved_store, chunk)
+        timings.append(WriteChunkTiming(index=index, ops=len(chunk), seconds=time.perf_counter() - started))
+    record_writes(resolved_store, [*pending, *deletes])
+
+    return _build_report(candidates, pending, deletes, lookup_seconds, timings)
+
+
+def write_vector_batch(
+    items: Iterable[VectorWriteItem],
+    *,
+    store: BaseStore | None = None,
+    chunk_size: int = DEFAULT_WRITE_CHUNK_SIZE,
+    chunking: ChunkingConfig | None = None,
+    compact: bool = True,
+    namespaces: Sequence[tuple[str, ...]] | None = None,
+) -> VectorWriteReport:
+    """Write vector items to their agent namespaces using batched Store operations.
+
+    Args:
+        items: Items to write; each is fanned out to its `agents` namespaces.
+            Items marked `deleted` are purged from every agent namespace instead.
+        store: Optional Store override. Defaults to the runtime Store.
+        chunk_size: Max Store operations sent per chunk.
+        chunking: Optional text chunking; None stores each item as one record.
+        compact: Purge copies left in namespaces an item no longer lists in `agents`.
+        namespaces: Agent namespaces probed when compacting. Listed from the Store
+            when None; pass one listing when writing many batches (see `vector_ingest`).
+
+    Returns:
+        VectorWriteReport with counts and per-chunk timings.
+
+    Raises:
+        ValueError: If any item is missing its UUID (nothing is written).
+    """
+    batch = list(items)
+    resolved_store = _resolve_store(store)
+    if compact and namespaces is None:
+        namespaces = list_agent_namespaces(resolved_store)
+    probes = plan_orphan_probes(batch, namespaces) if compact and namespaces else []
+    candidates = plan_put_ops(batch, chunking=chunking)
+    return write_put_ops(candidates, store=resolved_store, chunk_size=chunk_size, probes=probes)
+
+
+async def awrite_vector_batch(
+    items: Iterable[VectorWriteItem],
+    *,
+    store: BaseStore | None = None,
+    chunk_size: int = DEFAULT_WRITE_CHUNK_SIZE,
+    chunking: ChunkingConfig | None = None,
+    compact: bool = True,
+    namespaces: Sequence[tuple[str, ...]] | None = None,
+) -> VectorWriteReport:
+    """Async variant of `write_vector_batch` built on `BaseStore.abatch`."""
+    batch = list(items)
+    resolved_store = _resolve_store(store)
+    if compact and namespaces is None:
+        namespaces = await alist_agent_namespaces(resolved_store)
+    probes = plan_orphan_probes(batch, namespaces) if compact and namespaces else []
+    candidates = plan_put_ops(batch, chunking=chunking)
+    return await awrite_put_ops(candidates, store=resolved_store, chunk_size=chunk_size, probes=probes)
@@ -8,14 +8,32 @@ from app.platform.utils.agent_utils import (
     load_agent_builder,
     load_agent_schema,
 )
+from app.platform.utils.chroma_store import ChromaStore, get_configured_store
+from app.platform.utils.chunking import ChunkingConfig, get_chunking_config, split_text
+from app.platform.utils.disk_cache import CacheStats, DiskCache
+from app.platform.utils.embeddings import SharedEmbeddings, get_store_embeddings
+from app.platform.utils.hashing_embeddings import HashingEmbeddings
+from app.platform.utils.llm_cache import LLMResponseCache, get_llm_cache
 from app.platform.utils.model_factory import get_model_for_agent
 from app.platform.utils.provider_config import ProviderFactory
 
 __all__ = [
+    "CacheStats",
+    "ChromaStore",
+    "ChunkingConfig",
+    "DiskCache",
+    "HashingEmbeddings",
+    "LLMResponseCache",
     "ProviderFactory",
+    "SharedEmbeddings",
     "build_tool_allowlist",
     "compose_agent_prompt",
+    "get_chunking_config",
+    "get_configured_store",
+    "get_llm_cache",
     "get_model_for_agent",
+    "get_store_embeddings",
     "load_agent_builder",
     "load_agent_schema",
+    "split_text",
 ]
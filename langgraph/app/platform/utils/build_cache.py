@@ -0,0 +1,58 @@
+"""Build-once cache for expensive, immutable objects such as compiled graphs."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Hashable
+
+
+class BuildCache[T]:
+    """Holds one built value and rebuilds it when its input signature changes.
+
+    Example:
+        >>> graphs = BuildCache(build_app, signature=files_signature)
+        >>> app = graphs.get()  # built on first use, reused until a watched file changes
+    """
+
+    def __init__(
+        self,
+        build: Callable[[], T],
+        *,
+        signature: Callable[[], Hashable],
+        on_invalidate: Callable[[], None] | None = None,
+    ) -> None:
+        """Create an empty cache.
+
+        Args:
+            build: Builds the value (called under a lock, at most once per signature).
+            signature: Returns a value that changes whenever `build` inputs change.
+            on_invalidate: Called whenever a built value is dropped (stale signature
+                or `clear`), e.g. to forget cached file reads before rebuilding.
+        """
+        self._build = build
+        self._signature = signature
+        self._on_invalidate = on_invalidate
+        self._lock = threading.Lock()
+        self._value: T | None = None
+        self._built_for: Hashable | None = None
+        self.builds = 0
+
+    def get(self) -> T:
+        """Return the cached value, building it first when missing or stale."""
+        current = self._signature()
+        with self._lock:
+            if self._value is None or current != self._built_for:
+                if self._value is not None and self._on_invalidate is not None:
+                    self._on_invalidate()
+                self._value = self._build()
+                self._built_for = current
+                self.builds += 1
+            return self._value
+
+    def clear(self) -> None:
+        """Drop the cached value; the next `get` rebuilds it."""
+        with self._lock:
+            if self._value is not None and self._on_invalidate is not None:
+                self._on_invalidate()
+            self._value = None
+            self._built_for = None
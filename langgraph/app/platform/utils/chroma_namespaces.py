@@ -0,0 +1,79 @@
+"""Namespace registry for `ChromaStore`.
+
+Namespaces that hold items are kept as record ids (`json.dumps(list(namespace))`)
+in a companion `<collection>_namespaces` collection. Listing namespaces reads the
+registry (one record per namespace) instead of every item's metadata.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Mapping, Sequence
+
+from chromadb.api import ClientAPI
+from chromadb.api.models.Collection import Collection
+
+from app.platform.utils.store_filters import NAMESPACE_PREFIX, combine_where, where_clauses
+
+NAMESPACE_REGISTRY_SUFFIX = "_namespaces"
+
+
+def _registry_id(namespace: tuple[str, ...]) -> str:
+    return json.dumps(list(namespace))
+
+
+def _metadata_namespace(metadata: Mapping[str, object]) -> tuple[str, ...]:
+    segments = sorted(
+        (int(field.removeprefix(NAMESPACE_PREFIX)), str(segment))
+        for field, segment in metadata.items()
+        if field.startswith(NAMESPACE_PREFIX)
+    )
+    return tuple(segment for _, segment in segments)
+
+
+class ChromaNamespaceRegistry:
+    """Tracks the namespaces present in a Chroma-backed Store collection."""
+
+    def __init__(self, client: ClientAPI, items: Collection) -> None:
+        """Open (or create) the registry for `items`.
+
+        Args:
+            client: Chroma client holding the item collection.
+            items: Item collection; its records carry `ns.<i>` namespace metadata.
+        """
+        self._items = items
+        self._registry = client.get_or_create_collection(
+            f"{items.name}{NAMESPACE_REGISTRY_SUFFIX}", embedding_function=None
+        )
+        if self._registry.count() == 0 and items.count() > 0:
+            # Collection written before the registry existed: register its namespaces once.
+            self.register(self._scan())
+
+    def namespaces(self) -> set[tuple[str, ...]]:
+        """Return every registered namespace."""
+        return {tuple(json.loads(record_id)) for record_id in self._registry.get(include=[])["ids"]}
+
+    def register(self, namespaces: Iterable[tuple[str, ...]]) -> None:
+        """Record namespaces that just received items."""
+        ids = list(dict.fromkeys(_registry_id(namespace) for namespace in namespaces))
+        if ids:
+            # The registry only stores ids; Chroma requires a vector per record.
+            placeholders: list[Sequence[float]] = [[1.0]] * len(ids)
+            self._registry.upsert(ids=ids, embeddings=placeholders)
+
+    def prune(self, namespaces: Iterable[tuple[str, ...]]) -> None:
+        """Drop namespaces left without items (e.g. after deletes).
+
+        A namespace is kept while it, or a namespace below it, still holds an item.
+        """
+        empty = [
+            _registry_id(namespace)
+            for namespace in set(namespaces)
+            if not self._items.get(where=combine_where(where_clauses(namespace, None)[0]), limit=1, include=[])["ids"]
+        ]
+        if empty:
+            self._registry.delete(ids=empty)
+
+    def _scan(self) -> set[tuple[str, ...]]:
+        response = self._items.get(include=["metadatas"])
+        return {_metadata_namespace(metadata) for metadata in response["metadatas"] or []}
@@ -0,0 +1,300 @@
+"""Persistent local Store backed by a Chroma collection under `VECTOR_DIR`.
+
+`ChromaStore` implements LangGraph's `BaseStore`, so Store consumers
+(`context_lookup`, `write_to_vectorstore`, `hydrate_evidence_docs`, the vector
+writer) run against it unchanged. Each item is one Chroma record: the value is
+kept as JSON metadata, namespace segments as `ns.<i>` metadata (prefix filters
+run inside Chroma), top-level scalar fields as `v.<field>` and nested flags such
+as `tag_index` as `v.<field>.<key>` metadata (simple filters are pushed down) and
+the embedding of the indexed fields as the vector. Namespaces holding items are
+registered in a companion collection (see `chroma_namespaces`), so listing them
+does not scan the items.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Iterable, Sequence
+from datetime import UTC, datetime
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+import chromadb
+from chromadb.api import ClientAPI
+from langchain_core.embeddings import Embeddings
+from langgraph.store.base import (
+    BaseStore,
+    GetOp,
+    Item,
+    ListNamespacesOp,
+    Op,
+    PutOp,
+    Result,
+    SearchItem,
+    SearchOp,
+)
+from langgraph.store.base.embed import get_text_at_path, tokenize_path
+
+from app.platform.config.file_loader import FileLoader
+from app.platform.config.paths import VECTOR_DIR
+from app.platform.utils.chroma_namespaces import ChromaNamespaceRegistry
+from app.platform.utils.embeddings import DEFAULT_EMBEDDING_DIMS, get_store_embeddings
+from app.platform.utils.store_filters import (
+    NAMESPACE_PREFIX,
+    Where,
+    combine_where,
+    matches_filter,
+    metadata_fields,
+    namespace_matches,
+    where_clauses,
+)
+
+DEFAULT_COLLECTION = "sagecompass_store"
+# Filters Chroma cannot evaluate are re-checked on this many candidates per result (capped).
+RESIDUAL_FILTER_OVERFETCH = 4
+MAX_RESIDUAL_FILTER_CANDIDATES = 2000
+
+_RECORD = "record"
+_VALUE = "value"
+_INDEXED = "indexed"
+_CREATED = "created_at"
+_UPDATED = "updated_at"
+
+
+def _record_id(namespace: tuple[str, ...], key: str) -> str:
+    return json.dumps([list(namespace), key])
+
+
+def _record_metadata(
+    record_id: str, namespace: tuple[str, ...], value: dict[str, Any], *, indexed: bool, created_at: str, now: str
+) -> dict[str, Any]:
+    metadata = metadata_fields(value)
+    metadata.update({f"{NAMESPACE_PREFIX}{index}": segment for index, segment in enumerate(namespace)})
+    metadata.update(
+        {_RECORD: record_id, _VALUE: json.dumps(value), _INDEXED: indexed, _CREATED: created_at, _UPDATED: now}
+    )
+    return metadata
+
+
+def _item_fields(metadata: dict[str, Any]) -> dict[str, Any]:
+    namespace, key = json.loads(str(metadata[_RECORD]))
+    return {
+        "namespace": tuple(namespace),
+        "key": key,
+        "value": json.loads(str(metadata[_VALUE])),
+        "created_at": datetime.fromisoformat(str(metadata[_CREATED])),
+        "updated_at": datetime.fromisoformat(str(metadata[_UPDATED])),
+    }
+
+
+class ChromaStore(BaseStore):
+    """`BaseStore` backed by a persistent (or in-process) Chroma collection.
+
+    Semantic search uses cosine similarity; `score` is `1 - distance`. When several
+    fields are indexed they are embedded as one newline-joined text per item. TTLs
+    are not supported.
+
+    Example:
+        >>> store = ChromaStore(VECTOR_DIR, index={"dims": 1536, "embed": get_store_embeddings()})
+        >>> store.put(("drupal", "context", "agent", "problem_framing"), "uuid-1", {"text": "..."})
+    """
+
+    def __init__(
+        self,
+        path: Path | str | None = None,
+        *,
+        index: dict[str, Any] | None = None,
+        collection: str = DEFAULT_COLLECTION,
+        client: ClientAPI | None = None,
+    ) -> None:
+        """Open (or create) the Chroma collection.
+
+        Args:
+            path: Directory for the persistent Chroma client. Ignored when `client` is given.
+            index: Optional `{"dims", "embed", "fields"}` index config (as in `langgraph.json`);
+                `embed` must be an `Embeddings` instance. Without it, search ignores `query`.
+            collection: Chroma collection name.
+            client: Optional Chroma client override (e.g. `chromadb.EphemeralClient()` in tests).
+        """
+        resolved_client = client or chromadb.PersistentClient(path=str(path or VECTOR_DIR))
+        self._collection = resolved_client.get_or_create_collection(
+            collection, embedding_function=None, metadata={"hnsw:space": "cosine"}
+        )
+        embed = (index or {}).get("embed")
+        if embed is not None and not isinstance(embed, Embeddings):
+            raise TypeError("ChromaStore index['embed'] must be an Embeddings instance.")
+        self._embeddings: Embeddings | None = embed
+        self._namespaces = ChromaNamespaceRegistry(resolved_client, self._collection)
+        self._dims = int(index.get("dims") or 1) if index else 1
+        self._fields = [(field, tokenize_path(field)) for field in (index or {}).get("fields") or ["$"]]
+
+    # -- BaseStore -----------------------------------------------------------------------
+
+    def batch(self, ops: Iterable[Op]) -> list[Result]:
+        """Execute operations; reads see the state before this batch's writes."""
+        batch = list(ops)
+        texts = self._texts_to_embed(batch)
+        vectors = self._embeddings.embed_documents(texts) if texts and self._embeddings else []
+        return self._execute(batch, dict(zip(texts, vectors, strict=True)))
+
+    async def abatch(self, ops: Iterable[Op]) -> list[Result]:
+        """Async variant of `batch`; Chroma I/O runs in a worker thread."""
+        batch = list(ops)
+        texts = self._texts_to_embed(batch)
+        vectors = await self._embeddings.aembed_documents(texts) if texts and self._embeddings else []
+        return await asyncio.to_thread(self._execute, batch, dict(zip(texts, vectors, strict=True)))
+
+    # -- Internals -----------------------------------------------------------------------
+
+    def _indexed_text(self, op: PutOp) -> str | None:
+        if op.value is None or op.index is False or self._embeddings is None:
+            return None
+        fields = self._fields if op.index is None else [(field, tokenize_path(field)) for field in op.index]
+        texts = [text for _, path in fields for text in get_text_at_path(op.value, path)]
+        return "\n".join(texts) if texts else None
+
+    def _texts_to_embed(self, ops: Sequence[Op]) -> list[str]:
+        texts: dict[str, None] = {}
+        for op in ops:
+            if isinstance(op, SearchOp) and op.query and self._embeddings is not None:
+                texts[op.query] = None
+            elif isinstance(op, PutOp) and (text := self._indexed_text(op)) is not None:
+                texts[text] = None
+        return list(texts)
+
+    def _execute(self, ops: Sequence[Op], vectors: dict[str, list[float]]) -> list[Result]:
+        results: list[Result] = [None] * len(ops)
+        gets = [(index, op) for index, op in enumerate(ops) if isinstance(op, GetOp)]
+        if gets:
+            ids = [_record_id(op.namespace, op.key) for _, op in gets]
+            found = self._get_items(ids)
+            for (index, _), record_id in zip(gets, ids, strict=True):
+                results[index] = found.get(record_id)
+        for index, op in enumerate(ops):
+            if isinstance(op, SearchOp):
+                results[index] = self._search(op, vectors.get(op.query) if op.query else None)
+            elif isinstance(op, ListNamespacesOp):
+                results[index] = self._list_namespaces(op)
+        self._apply_puts([op for op in ops if isinstance(op, PutOp)], vectors)
+        return results
+
+    def _get_items(self, ids: list[str]) -> dict[str, Item]:
+        response = self._collection.get(ids=list(dict.fromkeys(ids)), include=["metadatas"])
+        metadatas = response["metadatas"] or []
+        return {
+            record_id: Item(**_item_fields(dict(metadata)))
+            for record_id, metadata in zip(response["ids"], metadatas, strict=True)
+        }
+
+    def _search(self, op: SearchOp, vector: list[float] | None) -> list[SearchItem]:
+        clauses, exact = where_clauses(op.namespace_prefix, op.filter)
+        if not exact:
+            return self._residual_search(op, clauses, vector)
+        if vector is None:
+            return self._scan(clauses, limit=op.limit, offset=op.offset)
+        wanted = op.offset + op.limit
+        return self._query(vector, [*clauses, {_INDEXED: True}], wanted)[op.offset :] if wanted > 0 else []
+
+    def _residual_search(self, op: SearchOp, clauses: list[Where], vector: list[float] | None) -> list[SearchItem]:
+        """Search with a filter Chroma cannot fully evaluate, reading at most the candidate cap."""
+        needed = op.offset + op.limit
+        page = min(needed * RESIDUAL_FILTER_OVERFETCH, MAX_RESIDUAL_FILTER_CANDIDATES)
+        indexed = [*clauses, {_INDEXED: True}]
+        while needed > 0:
+            # Chroma queries have no offset, so a short page is re-read with twice the candidates.
+            items = self._scan(clauses, limit=page, offset=0) if vector is None else self._query(vector, indexed, page)
+            matched = [item for item in items if matches_filter(item.value, op.filter)]
+            if len(matched) >= needed or len(items) < page or page >= MAX_RESIDUAL_FILTER_CANDIDATES:
+                return matched[op.offset : needed]
+            page = min(page * 2, MAX_RESIDUAL_FILTER_CANDIDATES)
+        return []
+
+    def _scan(self, clauses: list[Where], *, limit: int | None, offset: int | None) -> list[SearchItem]:
+        """List items matching `clauses` in insertion order (no similarity ranking)."""
+        response = self._collection.get(where=combine_where(clauses), limit=limit, offset=offset, include=["metadatas"])
+        return [SearchItem(**_item_fields(dict(metadata))) for metadata in response["metadatas"] or []]
+
+    def _query(self, vector: list[float], clauses: list[Where], wanted: int) -> list[SearchItem]:
+        """Return the `wanted` nearest items matching `clauses`, scored by cosine similarity."""
+        query: list[Sequence[float]] = [vector]
+        response = self._collection.query(
+            query_embeddings=query,
+            n_results=wanted,
+            where=combine_where(clauses),
+            include=["metadatas", "distances"],
+        )
+        metadatas = (response["metadatas"] or [[]])[0]
+        distances = (response["distances"] or [[]])[0]
+        return [
+            SearchItem(**_item_fields(dict(metadata)), score=1.0 - float(distance))
+            for metadata, distance in zip(metadatas, distances, strict=True)
+        ]
+
+    def _list_namespaces(self, op: ListNamespacesOp) -> list[tuple[str, ...]]:
+        namespaces = self._namespaces.namespaces()
+        matched = [ns for ns in namespaces if all(namespace_matches(ns, cond) for cond in op.match_conditions or ())]
+        if op.max_depth is not None:
+            matched = list({ns[: op.max_depth] for ns in matched})
+        return sorted(matched)[op.offset : op.offset + op.limit]
+
+    def _apply_puts(self, ops: Sequence[PutOp], vectors: dict[str, list[float]]) -> None:
+        latest = {_record_id(op.namespace, op.key): op for op in ops}
+        deletes = {record_id: op.namespace for record_id, op in latest.items() if op.value is None}
+        if deletes:
+            self._collection.delete(ids=list(deletes))
+        upserts = {record_id: (op, op.value) for record_id, op in latest.items() if op.value is not None}
+        if upserts:
+            self._upsert(upserts, vectors)
+            self._namespaces.register(op.namespace for op, _ in upserts.values())
+        if deletes:
+            self._namespaces.prune(deletes.values())
+
+    def _upsert(self, upserts: dict[str, tuple[PutOp, dict[str, Any]]], vectors: dict[str, list[float]]) -> None:
+        existing = self._collection.get(ids=list(upserts), include=["metadatas"])
+        created = {
+            record_id: str(metadata[_CREATED])
+            for record_id, metadata in zip(existing["ids"], existing["metadatas"] or [], strict=True)
+        }
+        now = datetime.now(UTC).isoformat()
+        placeholder = [1.0] + [0.0] * (self._dims - 1)
+        metadatas: list[dict[str, Any]] = []
+        embeddings: list[list[float]] = []
+        for record_id, (op, value) in upserts.items():
+            text = self._indexed_text(op)
+            metadatas.append(
+                _record_metadata(
+                    record_id,
+                    op.namespace,
+                    value,
+                    indexed=text is not None,
+                    created_at=created.get(record_id, now),
+                    now=now,
+                )
+            )
+            embeddings.append(vectors[text] if text is not None else placeholder)
+        self._collection.upsert(ids=list(upserts), embeddings=embeddings, metadatas=metadatas)  # type: ignore[arg-type]
+
+
+@cache
+def get_configured_store() -> BaseStore | None:
+    """Return the Store selected by the `store` section of `config/embeddings.yaml`.
+
+    `backend: chroma` opens a persistent `ChromaStore` under `VECTOR_DIR` indexed with
+    the shared Store embedder. Any other backend (the default, `deployment`) returns
+    None so the graphs use the Store provided by the LangGraph runtime.
+    """
+    try:
+        config = FileLoader.load_embeddings_config()
+    except FileNotFoundError:
+        return None
+    section = config.get("store") or {}
+    if section.get("backend") != "chroma":
+        return None
+    dims = int(config.get("dims") or DEFAULT_EMBEDDING_DIMS)
+    return ChromaStore(
+        Path(section.get("path") or VECTOR_DIR),
+        index={"dims": dims, "embed": get_store_embeddings(), "fields": ["text"]},
+        collection=str(section.get("collection") or DEFAULT_COLLECTION),
+    )
@@ -0,0 +1,145 @@
+"""Text chunking for long context documents before embedding.
+
+Chunks are contiguous slices of the source text (with their start offsets), so
+overlapping neighbours can be stitched back together without duplicating text.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import cache
+
+from app.platform.config.file_loader import FileLoader
+
+CHUNK_KEY_SEPARATOR = "#"
+
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+|\n\s*\n")
+
+
+@dataclass(frozen=True)
+class ChunkingConfig:
+    """Chunking settings for the vector write path.
+
+    Attributes:
+        enabled: Whether documents are split into chunks before writing.
+        size: Max chunk length in characters.
+        overlap: Max characters repeated from the end of the previous chunk.
+        sentence_aware: Cut on sentence/paragraph boundaries when possible.
+        stitch_neighbors: Neighbouring chunks merged on each side during hydration.
+    """
+
+    enabled: bool = True
+    size: int = 1200
+    overlap: int = 200
+    sentence_aware: bool = True
+    stitch_neighbors: int = 1
+
+
+@dataclass(frozen=True)
+class TextChunk:
+    """One chunk of a source text.
+
+    Attributes:
+        index: Zero-based chunk position.
+        start: Offset of the chunk in the source text.
+        text: Chunk text (`source[start:start + len(text)]`).
+    """
+
+    index: int
+    start: int
+    text: str
+
+
+def chunk_key(uuid: str, index: int) -> str:
+    """Return the Store key of chunk `index` of item `uuid` (e.g. `uuid#0`)."""
+    return f"{uuid}{CHUNK_KEY_SEPARATOR}{index}"
+
+
+def parse_chunk_key(key: str) -> tuple[str, int | None]:
+    """Split a Store key into (uuid, chunk index); the index is None for unchunked keys."""
+    uuid, separator, index = key.rpartition(CHUNK_KEY_SEPARATOR)
+    if separator and index.isdigit():
+        return uuid, int(index)
+    return key, None
+
+
+def _sentence_spans(text: str, size: int) -> list[tuple[int, int]]:
+    """Return sentence spans, hard-splitting sentences longer than `size`."""
+    spans: list[tuple[int, int]] = []
+    start = 0
+    boundaries = [(match.start(), match.end()) for match in _SENTENCE_BOUNDARY.finditer(text)]
+    for end, next_start in [*boundaries, (len(text), len(text))]:
+        spans.extend((offset, min(offset + size, end)) for offset in range(start, end, size))
+        start = next_start
+    return spans
+
+
+def _fixed_spans(length: int, size: int, overlap: int) -> list[tuple[int, int]]:
+    step = size - overlap
+    return [(start, min(start + size, length)) for start in range(0, max(length - overlap, 1), step)]
+
+
+def _pack(units: list[tuple[int, int]], size: int, overlap: int) -> list[tuple[int, int]]:
+    """Greedily pack sentence spans into chunks, repeating trailing sentences as overlap."""
+    chunks: list[tuple[int, int]] = []
+    first = 0
+    while first < len(units):
+        start = units[first][0]
+        last = first
+        while last + 1 < len(units) and units[last + 1][1] - start <= size:
+            last += 1
+        chunks.append((start, units[last][1]))
+        if last + 1 >= len(units):
+            break
+        next_first = last + 1
+        # Step back over trailing sentences while they fit the overlap and still leave
+        # room for the next new sentence.
+        while (
+            next_first - 1 > first
+            and units[last][1] - units[next_first - 1][0] <= overlap
+            and units[last + 1][1] - units[next_first - 1][0] <= size
+        ):
+            next_first -= 1
+        first = next_first
+    return chunks
+
+
+def split_text(text: str, *, size: int, overlap: int = 0, sentence_aware: bool = True) -> list[TextChunk]:
+    """Split text into overlapping chunks of at most `size` characters.
+
+    Args:
+        text: Source text.
+        size: Max chunk length in characters.
+        overlap: Max characters shared by consecutive chunks (capped at half of `size`).
+        sentence_aware: Prefer sentence/paragraph boundaries over fixed-width cuts.
+
+    Returns:
+        Chunks in order. Text that fits in one chunk yields a single chunk.
+    """
+    size = max(1, size)
+    overlap = min(max(0, overlap), size // 2)
+    if len(text) <= size:
+        return [TextChunk(index=0, start=0, text=text)]
+    if sentence_aware:
+        spans = _pack(_sentence_spans(text, size), size, overlap)
+    else:
+        spans = _fixed_spans(len(text), size, overlap)
+    return [TextChunk(index=index, start=start, text=text[start:end]) for index, (start, end) in enumerate(spans)]
+
+
+@cache
+def get_chunking_config() -> ChunkingConfig:
+    """Return chunking settings from the `chunking` section of `config/embeddings.yaml`."""
+    try:
+        section = FileLoader.load_embeddings_config().get("chunking") or {}
+    except FileNotFoundError:
+        section = {}
+    defaults = ChunkingConfig()
+    return ChunkingConfig(
+        enabled=bool(section.get("enabled", defaults.enabled)),
+        size=int(section.get("size", defaults.size)),
+        overlap=int(section.get("overlap", defaults.overlap)),
+        sentence_aware=bool(section.get("sentence_aware", defaults.sentence_aware)),
+        stitch_neighbors=int(section.get("stitch_neighbors", defaults.stitch_neighbors)),
+    )
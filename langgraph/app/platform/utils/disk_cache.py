@@ -0,0 +1,153 @@
+"""Persistent, size-bounded key/value cache backed by SQLite."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+
+_SCHEMA = "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value BLOB NOT NULL, accessed REAL NOT NULL)"
+_EVICT_LRU = "DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY accessed ASC, rowid ASC LIMIT ?)"
+_SQLITE_MAX_PARAMS = 500
+# Read access times are kept in memory and written with the next write, or once this many are pending.
+_TOUCH_FLUSH_SIZE = 1_000
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Counters for a cache instance (since it was opened)."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups served from the cache (0.0 before any lookup)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class DiskCache:
+    """SQLite-backed cache of bytes values with least-recently-used eviction.
+
+    Entries survive process restarts. Once more than `max_entries` are stored, the
+    least recently read or written entries are evicted. Reads do not write: their
+    access times are flushed with the next write (before eviction), on `close()`
+    or once enough are pending. Hit/miss counters are kept per instance and
+    exposed through `stats()`.
+
+    Example:
+        >>> cache = DiskCache(CACHE_DIR / "embeddings.sqlite3", max_entries=50_000)
+        >>> cache.set_many({"key": b"value"})
+        >>> cache.get_many(["key", "other"])
+        {'key': b'value'}
+    """
+
+    def __init__(self, path: Path | str, *, max_entries: int = 10_000) -> None:
+        """Open (or create) the cache file.
+
+        Args:
+            path: SQLite file path. Parent directories are created as needed.
+                `":memory:"` keeps the cache in-process only.
+            max_entries: Maximum number of entries kept before LRU eviction.
+        """
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._max_entries = max(1, max_entries)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+        self._touched: dict[str, float] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: str) -> bytes | None:
+        """Return the cached value for `key`, or None on a miss."""
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, bytes]:
+        """Return cached values for the keys that are present.
+
+        Side effects/state writes:
+            Records the access time of every hit (written later, see the class
+            docstring) and updates hit/miss counters.
+        """
+        wanted = list(dict.fromkeys(keys))
+        found: dict[str, bytes] = {}
+        with self._lock:
+            for start in range(0, len(wanted), _SQLITE_MAX_PARAMS):
+                batch = wanted[start : start + _SQLITE_MAX_PARAMS]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, value FROM entries WHERE key IN ({placeholders})",
+                    batch,
+                ).fetchall()
+                found.update((key, bytes(value)) for key, value in rows)
+            now = time.time()
+            self._touched.update(dict.fromkeys(found, now))
+            if len(self._touched) >= _TOUCH_FLUSH_SIZE:
+                self._flush_touches()
+                self._conn.commit()
+            self._hits += len(found)
+            self._misses += len(wanted) - len(found)
+        return found
+
+    def set(self, key: str, value: bytes) -> None:
+        """Store a single value."""
+        self.set_many({key: value})
+
+    def set_many(self, values: Mapping[str, bytes]) -> None:
+        """Store values and evict least recently used entries beyond `max_entries`."""
+        if not values:
+            return
+        now = time.time()
+        with self._lock:
+            for key in values:
+                self._touched.pop(key, None)
+            self._flush_touches()
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO entries (key, value, accessed) VALUES (?, ?, ?)",
+                [(key, value, now) for key, value in values.items()],
+            )
+            overflow = self._count() - self._max_entries
+            if overflow > 0:
+                self._conn.execute(_EVICT_LRU, (overflow,))
+                self._evictions += overflow
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Remove every entry (counters are kept)."""
+        with self._lock:
+            self._touched.clear()
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
+
+    def stats(self) -> CacheStats:
+        """Return hit/miss/eviction counters and the current entry count."""
+        with self._lock:
+            return CacheStats(hits=self._hits, misses=self._misses, evictions=self._evictions, entries=self._count())
+
+    def close(self) -> None:
+        """Write pending access times and close the underlying SQLite connection."""
+        with self._lock:
+            self._flush_touches()
+            self._conn.commit()
+            self._conn.close()
+
+    def _flush_touches(self) -> None:
+        """Write pending read access times (the caller holds the lock and commits)."""
+        if self._touched:
+            self._conn.executemany(
+                "UPDATE entries SET accessed = ? WHERE key = ?", [(at, key) for key, at in self._touched.items()]
+            )
+            self._touched.clear()
+
+    def _count(self) -> int:
+        return int(self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0])
@@ -0,0 +1,203 @@
+"""Embedding factories for the LangGraph Store index.
+
+`langgraph.json` points `store.index.embed` at `aembed_texts`, so every embedding the
+Store computes (vector writes and `context_lookup` queries) goes through this module
+and its persistent, content-addressed cache.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import threading
+import unicodedata
+from array import array
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from functools import cache
+
+from langchain.embeddings import init_embeddings
+from langchain_core.embeddings import Embeddings
+
+from app.platform.config.env import load_project_env
+from app.platform.config.file_loader import FileLoader
+from app.platform.config.paths import CACHE_DIR
+from app.platform.utils.disk_cache import CacheStats, DiskCache
+from app.platform.utils.hashing_embeddings import HASHING_EMBEDDING_MODEL, HashingEmbeddings
+
+DEFAULT_EMBEDDING_MODEL = "openai:text-embedding-3-small"
+DEFAULT_EMBEDDING_DIMS = 1536
+DEFAULT_EMBEDDING_CACHE_MAX_ENTRIES = 50_000
+EMBEDDING_CACHE_PATH = CACHE_DIR / "embeddings.sqlite3"
+EMBEDDING_MODEL_ENV = "SAGECOMPASS_EMBEDDING_MODEL"
+
+
+def normalize_embedding_text(text: str) -> str:
+    """Normalize text for cache addressing (Unicode NFC, collapsed whitespace)."""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def embedding_cache_key(model: str, dims: int, text: str) -> str:
+    """Return the content address of `text` embedded by `model` at `dims` dimensions."""
+    payload = f"{model}\x00{dims}\x00{normalize_embedding_text(text)}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SharedEmbeddings(Embeddings):
+    """Embeddings wrapper that computes each distinct text once.
+
+    The vector writer fans one item out to several agent namespaces and the Store
+    embeds on every indexed put. This wrapper dedupes texts within a call and keeps
+    a small in-process LRU of recent vectors, so the per-agent copies of an item
+    reuse the vector computed for the first namespace.
+
+    With a `DiskCache`, vectors are also persisted under `embedding_cache_key`, so
+    re-syncing unchanged content or re-running the same query never re-embeds.
+
+    Example:
+        >>> embeddings = SharedEmbeddings(init_embeddings("openai:text-embedding-3-small"))
+        >>> store = InMemoryStore(index={"embed": embeddings, "dims": 1536, "fields": ["text"]})
+    """
+
+    def __init__(
+        self,
+        delegate: Embeddings,
+        *,
+        max_entries: int = 1024,
+        cache: DiskCache | None = None,
+        model: str = DEFAULT_EMBEDDING_MODEL,
+        dims: int = DEFAULT_EMBEDDING_DIMS,
+    ) -> None:
+        """Wrap a delegate embedder.
+
+        Args:
+            delegate: Embedder that computes vectors for texts not seen recently.
+            max_entries: Number of recent vectors kept in memory for reuse.
+            cache: Optional persistent cache consulted before the delegate.
+            model: Model identifier used in persistent cache keys.
+            dims: Vector dimensions used in persistent cache keys.
+        """
+        self._delegate = delegate
+        self._max_entries = max_entries
+        self._cache = cache
+        self._model = model
+        self._dims = dims
+        self._recent: OrderedDict[str, list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _lookup(self, texts: Sequence[str]) -> tuple[dict[str, list[float]], list[str]]:
+        """Split texts into recently embedded vectors and distinct texts still to embed."""
+        found: dict[str, list[float]] = {}
+        missing: list[str] = []
+        with self._lock:
+            for text in dict.fromkeys(texts):
+                if text in self._recent:
+                    self._recent.move_to_end(text)
+                    found[text] = self._recent[text]
+                else:
+                    missing.append(text)
+        return found, missing
+
+    def _remember(self, vectors: Mapping[str, list[float]]) -> None:
+        with self._lock:
+            for text, vector in vectors.items():
+                self._recent[text] = vector
+                self._recent.move_to_end(text)
+            while len(self._recent) > self._max_entries:
+                self._recent.popitem(last=False)
+
+    def _load_cached(self, texts: Sequence[str]) -> dict[str, list[float]]:
+        """Read persisted vectors for texts missing from the in-memory LRU."""
+        if self._cache is None or not texts:
+            return {}
+        keys = {text: embedding_cache_key(self._model, self._dims, text) for text in texts}
+        stored = self._cache.get_many(keys.values())
+        return {text: array("d", stored[key]).tolist() for text, key in keys.items() if key in stored}
+
+    def _save_cached(self, vectors: Mapping[str, list[float]]) -> None:
+        if self._cache is None or not vectors:
+            return
+        self._cache.set_many(
+            {
+                embedding_cache_key(self._model, self._dims, text): array("d", vector).tobytes()
+                for text, vector in vectors.items()
+            }
+        )
+
+    @staticmethod
+    def _computed(texts: Sequence[str], vectors: Sequence[list[float]]) -> dict[str, list[float]]:
+        return {text: list(vector) for text, vector in zip(texts, vectors, strict=True)}
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Embed documents, computing each distinct text at most once."""
+        found, missing = self._lookup(texts)
+        loaded = self._load_cached(missing)
+        missing = [text for text in missing if text not in loaded]
+        computed = self._computed(missing, self._delegate.embed_documents(missing)) if missing else {}
+        self._save_cached(computed)
+        self._remember({**loaded, **computed})
+        found.update(loaded)
+        found.update(computed)
+        return [list(found[text]) for text in texts]
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Async variant of `embed_documents`."""
+        found, missing = self._lookup(texts)
+        # SQLite I/O runs off the event loop.
+        loaded = await asyncio.to_thread(self._load_cached, missing) if self._cache is not None else {}
+        missing = [text for text in missing if text not in loaded]
+        computed = self._computed(missing, await self._delegate.aembed_documents(missing)) if missing else {}
+        if computed and self._cache is not None:
+            await asyncio.to_thread(self._save_cached, computed)
+        self._remember({**loaded, **computed})
+        found.update(loaded)
+        found.update(computed)
+        return [list(found[text]) for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        """Embed a query text."""
+        return self.embed_documents([text])[0]
+
+    async def aembed_query(self, text: str) -> list[float]:
+        """Async variant of `embed_query`."""
+        return (await self.aembed_documents([text]))[0]
+
+    def cache_stats(self) -> CacheStats | None:
+        """Return persistent cache counters, or None when no cache is configured."""
+        return self._cache.stats() if self._cache is not None else None
+
+
+@cache
+def get_store_embeddings() -> SharedEmbeddings:
+    """Return the process-wide Store embedder configured in `config/embeddings.yaml`.
+
+    `SAGECOMPASS_EMBEDDING_MODEL` overrides the configured `model`. The offline
+    `local:hashing` model is computed in-process and never uses the disk cache.
+
+    Side effects/state writes:
+        Loads environment variables, reads the embeddings config file and opens the
+        persistent embedding cache (unless `cache.enabled` is false).
+    """
+    load_project_env()
+    try:
+        config = FileLoader.load_embeddings_config()
+    except FileNotFoundError:
+        config = {}
+    model = os.getenv(EMBEDDING_MODEL_ENV) or str(config.get("model") or DEFAULT_EMBEDDING_MODEL)
+    dims = int(config.get("dims") or DEFAULT_EMBEDDING_DIMS)
+    if model == HASHING_EMBEDDING_MODEL:
+        return SharedEmbeddings(HashingEmbeddings(dims), model=model, dims=dims)
+    cache_config = config.get("cache") or {}
+    disk_cache = None
+    if cache_config.get("enabled", True):
+        disk_cache = DiskCache(
+            EMBEDDING_CACHE_PATH,
+            max_entries=int(cache_config.get("max_entries") or DEFAULT_EMBEDDING_CACHE_MAX_ENTRIES),
+        )
+    return SharedEmbeddings(init_embeddings(model), cache=disk_cache, model=model, dims=dims)
+
+
+async def aembed_texts(texts: list[str]) -> list[list[float]]:
+    """Embed texts for the LangGraph Store index (referenced from langgraph.json)."""
+    return await get_store_embeddings().aembed_documents(texts)
@@ -0,0 +1,83 @@
+"""Deterministic offline embedder (feature-hashed bag of words).
+
+Selected with `model: local:hashing` in `config/embeddings.yaml`. Vectors depend
+only on the text and `dims`, never on the network or the process (no `hash()`
+randomization), so retrieval benchmarks and tests are repeatable on CI hardware.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import re
+import unicodedata
+from collections import Counter
+from itertools import pairwise
+
+from langchain_core.embeddings import Embeddings
+
+HASHING_EMBEDDING_MODEL = "local:hashing"
+
+_TOKEN = re.compile(r"\w+")
+
+
+def _features(text: str, *, bigrams: bool) -> Counter[str]:
+    tokens = _TOKEN.findall(unicodedata.normalize("NFC", text).casefold())
+    features = Counter(tokens)
+    if bigrams:
+        features.update(f"{first} {second}" for first, second in pairwise(tokens))
+    # Empty texts still get a (fixed) unit vector so cosine similarity stays defined.
+    return features or Counter({"": 1})
+
+
+def _bucket(feature: str, dims: int) -> tuple[int, float]:
+    """Return the signed bucket of a feature (the sign bit halves collision bias)."""
+    digest = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big")
+    return digest % dims, 1.0 if digest >> 63 else -1.0
+
+
+class HashingEmbeddings(Embeddings):
+    """Embeds texts as L2-normalized, signed, feature-hashed term counts.
+
+    Tokens are casefolded word characters; word bigrams are added by default so
+    phrase overlap ranks above shared vocabulary. Term counts are damped with
+    `1 + log(tf)`.
+
+    Example:
+        >>> embeddings = HashingEmbeddings(dims=1536)
+        >>> store = InMemoryStore(index={"embed": embeddings, "dims": 1536, "fields": ["text"]})
+    """
+
+    def __init__(self, dims: int = 1536, *, bigrams: bool = True) -> None:
+        """Configure the embedder.
+
+        Args:
+            dims: Output vector dimensions (hash buckets).
+            bigrams: Also hash adjacent word pairs.
+        """
+        self._dims = max(1, dims)
+        self._bigrams = bigrams
+
+    def _embed(self, text: str) -> list[float]:
+        vector = [0.0] * self._dims
+        for feature, count in _features(text, bigrams=self._bigrams).items():
+            index, sign = _bucket(feature, self._dims)
+            vector[index] += sign * (1.0 + math.log(count))
+        norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+        return [value / norm for value in vector]
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Embed documents."""
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        """Embed a query text."""
+        return self._embed(text)
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Embed documents inline (pure CPU, no executor hop)."""
+        return self.embed_documents(texts)
+
+    async def aembed_query(self, text: str) -> list[float]:
+        """Embed a query text inline."""
+        return self._embed(text)
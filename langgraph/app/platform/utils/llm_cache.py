@@ -0,0 +1,196 @@
+"""Persistent LLM response cache with record/replay modes.
+
+Responses are keyed on the model identity and params, the rendered system
+prompt, the conversation and the response schema. Message ids are left out of
+the key (graph runs assign fresh ones), so re-running the same inputs hits the
+recorded responses. Two installation points share one store:
+
+- `LLMCacheMiddleware` (`app/middlewares/llm_cache.py`) for an agent's
+  `_extra_middleware` hook; it replays the full model call, including the
+  structured response.
+- `ChatModelCache`, a LangChain `BaseCache` set on models by
+  `get_model_for_agent` when `SAGECOMPASS_LLM_CACHE` is enabled.
+
+In `replay` mode a miss raises `LLMCacheMissError` instead of calling the model,
+which makes regression runs and offline benchmarks fully deterministic.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Mapping, Sequence
+from functools import cache
+from typing import Any, Literal
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.messages import BaseMessage, message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration
+
+from app.platform.adapters.logging import get_logger
+from app.platform.config.env import load_project_env
+from app.platform.config.paths import CACHE_DIR
+from app.platform.utils.disk_cache import CacheStats, DiskCache
+
+LLMCacheMode = Literal["off", "record", "replay"]
+
+LLM_CACHE_ENV = "SAGECOMPASS_LLM_CACHE"
+LLM_CACHE_MAX_ENTRIES_ENV = "SAGECOMPASS_LLM_CACHE_MAX_ENTRIES"
+LLM_CACHE_PATH = CACHE_DIR / "llm_responses.sqlite3"
+DEFAULT_LLM_CACHE_MAX_ENTRIES = 20_000
+
+logger = get_logger("utils.llm_cache")
+
+
+class LLMCacheMissError(LookupError):
+    """Raised in `replay` mode when no recorded response matches a model call."""
+
+
+def _message_key(message: BaseMessage | Mapping[str, Any]) -> dict[str, Any]:
+    """Return the id-free parts of a message (or its `dumps` form) that shape the answer."""
+    fields: Mapping[str, Any] = (message.get("kwargs") or {}) if isinstance(message, Mapping) else message.__dict__
+    return {
+        "type": fields.get("type"),
+        "content": fields.get("content"),
+        "name": fields.get("name"),
+        "tool_calls": [
+            {"name": call["name"], "args": call["args"], "id": call.get("id")}
+            for call in fields.get("tool_calls") or []
+        ],
+        "tool_call_id": fields.get("tool_call_id"),
+    }
+
+
+def llm_cache_key(
+    *,
+    model: Mapping[str, Any] | str,
+    params: Mapping[str, Any] | None = None,
+    system_prompt: str | None = None,
+    messages: Sequence[BaseMessage | Mapping[str, Any]] = (),
+    response_schema: Mapping[str, Any] | str | None = None,
+) -> str:
+    """Return the cache key of one model call."""
+    payload = json.dumps(
+        {
+            "model": model,
+            "params": params or {},
+            "system_prompt": system_prompt,
+            "messages": [_message_key(message) for message in messages],
+            "response_schema": response_schema,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """Serialized model responses stored in a `DiskCache`.
+
+    Example:
+        >>> llm_cache = LLMResponseCache(DiskCache(LLM_CACHE_PATH), mode="replay")
+        >>> llm_cache.lookup(key)  # raises LLMCacheMissError when nothing was recorded
+    """
+
+    def __init__(self, disk_cache: DiskCache, *, mode: LLMCacheMode = "record") -> None:
+        """Wrap a disk cache.
+
+        Args:
+            disk_cache: Persistent store for the serialized responses (bounded, LRU).
+            mode: `record` answers hits from the cache and stores misses; `replay`
+                raises `LLMCacheMissError` on a miss.
+        """
+        self._cache = disk_cache
+        self.mode = mode
+
+    def lookup(self, key: str) -> str | None:
+        """Return the recorded response for `key`, or None on a miss (`record` mode)."""
+        raw = self._cache.get(key)
+        if raw is not None:
+            return raw.decode("utf-8")
+        if self.mode == "replay":
+            logger.warning("llm_cache.replay_miss", key=key)
+            raise LLMCacheMissError(f"No recorded LLM response for cache key {key}.")
+        return None
+
+    def record(self, key: str, response: str) -> None:
+        """Store a serialized response."""
+        self._cache.set(key, response.encode("utf-8"))
+
+    def clear(self) -> None:
+        """Drop every recorded response."""
+        self._cache.clear()
+
+    def stats(self) -> CacheStats:
+        """Return the hit/miss/eviction counters of the underlying cache."""
+        return self._cache.stats()
+
+
+class ChatModelCache(BaseCache):
+    """LangChain `BaseCache` adapter over an `LLMResponseCache`.
+
+    Set as a chat model's `cache`, it is consulted by LangChain before every
+    call. The LLM string carries the model params and the bound tools or
+    response format; the prompt carries the rendered system prompt and messages.
+    """
+
+    def __init__(self, llm_cache: LLMResponseCache) -> None:
+        """Wrap an LLM response cache.
+
+        Args:
+            llm_cache: Shared response store (its mode applies).
+        """
+        self._llm_cache = llm_cache
+
+    @staticmethod
+    def _key(prompt: str, llm_string: str) -> str:
+        # `prompt` is the `dumps` form of the messages; keying reads it without deserializing.
+        return llm_cache_key(model=llm_string, messages=json.loads(prompt))
+
+    def lookup(self, prompt: str, llm_string: str) -> RETURN_VAL_TYPE | None:
+        """Return the recorded generations for a call."""
+        raw = self._llm_cache.lookup(self._key(prompt, llm_string))
+        if raw is None:
+            return None
+        entries = json.loads(raw)
+        messages = messages_from_dict([entry["message"] for entry in entries])
+        return [
+            ChatGeneration(message=message, generation_info=entry["generation_info"])
+            for message, entry in zip(messages, entries, strict=True)
+        ]
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        """Record the generations of a call (chat generations only)."""
+        entries = [
+            {"message": message_to_dict(generation.message), "generation_info": generation.generation_info}
+            for generation in return_val
+            if isinstance(generation, ChatGeneration)
+        ]
+        self._llm_cache.record(self._key(prompt, llm_string), json.dumps(entries, default=str))
+
+    def clear(self, **kwargs: Any) -> None:  # noqa: ARG002
+        """Drop every recorded response."""
+        self._llm_cache.clear()
+
+
+def llm_cache_mode() -> LLMCacheMode:
+    """Return the mode set by `SAGECOMPASS_LLM_CACHE` (`off` unless `record` or `replay`)."""
+    load_project_env()
+    mode = os.getenv(LLM_CACHE_ENV, "").strip().lower()
+    return "record" if mode == "record" else "replay" if mode == "replay" else "off"
+
+
+@cache
+def get_llm_cache() -> LLMResponseCache | None:
+    """Return the process-wide LLM response cache, or None when disabled.
+
+    Enabled by `SAGECOMPASS_LLM_CACHE=record|replay`; responses are stored in
+    `data/cache/llm_responses.sqlite3`, bounded by
+    `SAGECOMPASS_LLM_CACHE_MAX_ENTRIES` (least recently used entries are evicted).
+    """
+    mode = llm_cache_mode()
+    if mode == "off":
+        return None
+    max_entries = int(os.getenv(LLM_CACHE_MAX_ENTRIES_ENV) or DEFAULT_LLM_CACHE_MAX_ENTRIES)
+    return LLMResponseCache(DiskCache(LLM_CACHE_PATH, max_entries=max_entries), mode=mode)
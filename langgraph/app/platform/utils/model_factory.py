@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from langchain_core.language_models import BaseChatModel
 
+from app.platform.utils.llm_cache import ChatModelCache, get_llm_cache
 from app.platform.utils.provider_config import ProviderFactory
 
 
@@ -12,6 +13,11 @@ def get_model_for_agent(agent_name: str) -> BaseChatModel:
 
     Uses the existing ProviderFactory.for_agent(agent_name) which
     reads config/provider/*.yaml (or env) and returns a (instance, params) pair.
+    With `SAGECOMPASS_LLM_CACHE=record|replay`, the returned model answers from
+    the persistent LLM response cache (a copy, so pooled clients stay uncached).
     """
     instance, _params = ProviderFactory.for_agent(agent_name)
-    return instance
+    llm_cache = get_llm_cache()
+    if llm_cache is None:
+        return instance
+    return instance.model_copy(update={"cache": ChatModelCache(llm_cache)})
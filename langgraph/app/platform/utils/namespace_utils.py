@@ -27,3 +27,12 @@ def build_agent_namespace(collection: str) -> tuple[str, ...]:
             artifact_type=collection,
         )
     )
+
+
+def build_agent_namespace_prefix() -> tuple[str, ...]:
+    """Build the namespace prefix shared by every agent-scoped namespace.
+
+    Returns:
+        Namespace prefix tuple (`build_agent_namespace` without the agent segment).
+    """
+    return build_agent_namespace("agent")[:-1]
@@ -1,7 +1,17 @@
-"""Provider configuration loader for model factories."""
+"""Provider configuration loader for model factories.
 
+Model instances are pooled per process: agents that resolve to the same provider,
+class and params share one instance (and its HTTP client), and providers that
+accept an `http_client` share one keep-alive connection pool across params.
+"""
+
+import hashlib
 import importlib
+import json
 import os
+import threading
+from collections.abc import Mapping
+from functools import cache
 from typing import Any
 
 from app.platform.adapters.logging import get_logger
@@ -11,6 +21,80 @@ from app.platform.config.paths import CONFIG_DIR
 
 PROVIDER_CONFIG_DIR = CONFIG_DIR / "provider"
 
+ClientKey = tuple[str, str, str]
+
+
+def params_fingerprint(params: Mapping[str, Any]) -> str:
+    """Return a stable hash of constructor params (non-JSON values hash by repr)."""
+    payload = json.dumps(params, sort_keys=True, default=repr)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ModelClientPool:
+    """Process-wide pool of provider model instances and shared HTTP clients.
+
+    Instances are keyed by provider, class and a hash of the frozen constructor
+    params (API key included, so a rotated key builds a new client). Classes with
+    an `http_client` field (ChatOpenAI) also share one sync keep-alive connection
+    pool per provider; async clients stay with the provider SDK defaults.
+
+    Example:
+        >>> pool = get_client_pool()
+        >>> model = pool.get("openai", ChatOpenAI, {"api_key": key, "model": "gpt-4.1-mini"})
+        >>> pool.evict("openai")  # next get() reconnects with fresh clients
+    """
+
+    def __init__(self) -> None:
+        """Create an empty pool."""
+        self._models: dict[ClientKey, Any] = {}
+        self._http_clients: dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def get(self, provider: str, provider_class: type, params: Mapping[str, Any]) -> Any:
+        """Return the pooled instance for these params, building it on first use."""
+        key = (provider, f"{provider_class.__module__}.{provider_class.__qualname__}", params_fingerprint(params))
+        with self._lock:
+            instance = self._models.get(key)
+            if instance is None:
+                instance = provider_class(**self._with_http_client(provider, provider_class, params))
+                self._models[key] = instance
+        return instance
+
+    def evict(self, provider: str | None = None) -> None:
+        """Drop pooled instances and HTTP clients so later `get` calls build fresh ones.
+
+        Evicted clients are not closed: built agents and cached graphs may still
+        hold them, and they are released once those are garbage-collected.
+
+        Args:
+            provider: Only refresh this provider; None evicts everything.
+        """
+        with self._lock:
+            for key in [key for key in self._models if provider in (None, key[0])]:
+                del self._models[key]
+            for name in [name for name in self._http_clients if provider in (None, name)]:
+                del self._http_clients[name]
+
+    def __len__(self) -> int:
+        """Return the number of pooled model instances."""
+        return len(self._models)
+
+    def _with_http_client(self, provider: str, provider_class: type, params: Mapping[str, Any]) -> dict[str, Any]:
+        if "http_client" not in getattr(provider_class, "model_fields", {}) or "http_client" in params:
+            return dict(params)
+        client = self._http_clients.get(provider)
+        if client is None:
+            import httpx  # installed with the SDKs that accept http_client
+
+            client = self._http_clients[provider] = httpx.Client()
+        return {**params, "http_client": client}
+
+
+@cache
+def get_client_pool() -> ModelClientPool:
+    """Return the process-wide model client pool."""
+    return ModelClientPool()
+
 
 class ProviderFactory:
     """Instantiate an LLM provider for a given agent.
@@ -29,10 +113,12 @@ class ProviderFactory:
 
         Side effects/state writes:
             Loads environment variables and reads provider config files.
+            Builds or reuses an instance from the process-wide `ModelClientPool`.
 
         Returns:
             Tuple of (provider instance, merged params).
             Provider instance type is dynamic (ChatOpenAI, ChatAnthropic, etc.).
+            Agents with equal provider and params receive the same instance.
         """
         logger = get_logger("utils.provider_config")
         try:
@@ -77,7 +163,7 @@ class ProviderFactory:
 
             # Detect constructor signature for LangChain v1 providers
             # ChatOpenAI → api_key=..., model=..., temperature=...
-            instance = provider_class(api_key=api_key, **params)
+            instance = get_client_pool().get(provider_name, provider_class, {"api_key": api_key, **params})
 
             logger.info(
                 "provider.load.success",
@@ -91,3 +177,12 @@ class ProviderFactory:
         except Exception as e:
             logger.error("provider.load.error", agent=agent_name, error=str(e))
             raise
+
+    @staticmethod
+    def refresh_clients(provider: str | None = None) -> None:
+        """Evict pooled model clients so the next `for_agent` call reconnects.
+
+        Args:
+            provider: Only refresh this provider; None refreshes every pooled client.
+        """
+        get_client_pool().evict(provider)
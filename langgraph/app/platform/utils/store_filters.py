@@ -0,0 +1,127 @@
+"""Store filter evaluation and Chroma `where` translation.
+
+LangGraph Store filters map top-level value fields to a value, to a dict of
+comparison operators (`$eq`, `$ne`, `$gt`, `$gte`, `$lt`, `$lte`) or to a dict of
+nested field conditions. `matches_filter` evaluates them like `InMemoryStore`;
+`where_clauses` pushes the subset Chroma can evaluate on scalar metadata (top-level
+fields and one level of nested flags, see `metadata_fields`) down into the query.
+"""
+
+from __future__ import annotations
+
+import operator
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from langgraph.store.base import MatchCondition
+
+FIELD_PREFIX = "v."
+NAMESPACE_PREFIX = "ns."
+
+_PUSHDOWN_OPERATORS = frozenset({"$eq", "$gt", "$gte", "$lt", "$lte"})
+_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "$gt": operator.gt,
+    "$gte": operator.ge,
+    "$lt": operator.lt,
+    "$lte": operator.le,
+}
+
+Where = dict[str, Any]
+
+
+def is_scalar(value: Any) -> bool:
+    """Return whether `value` can be stored as (and compared in) Chroma metadata."""
+    return isinstance(value, str | int | float) and not isinstance(value, bool)
+
+
+def _is_flag(value: Any) -> bool:
+    return is_scalar(value) or isinstance(value, bool)
+
+
+def metadata_fields(value: dict[str, Any]) -> dict[str, Any]:
+    """Return the `v.`-prefixed metadata of a value's scalar fields and nested scalar flags."""
+    fields: dict[str, Any] = {}
+    for field, item in value.items():
+        if is_scalar(item):
+            fields[f"{FIELD_PREFIX}{field}"] = item
+        elif isinstance(item, dict):
+            fields.update({f"{FIELD_PREFIX}{field}.{sub}": flag for sub, flag in item.items() if _is_flag(flag)})
+    return fields
+
+
+def _pushdown(field: str, condition: Any) -> list[Where] | None:
+    """Translate one filter condition into Chroma clauses, or None when unsupported."""
+    if is_scalar(condition):
+        return [{f"{FIELD_PREFIX}{field}": {"$eq": condition}}]
+    if not isinstance(condition, dict) or not condition:
+        return None
+    if not any(key.startswith("$") for key in condition):
+        # Nested equality (e.g. {"tag_index": {"gdpr": True}}); other nested conditions stay client-side.
+        if not all(_is_flag(flag) for flag in condition.values()):
+            return None
+        return [{f"{FIELD_PREFIX}{field}.{sub}": {"$eq": flag}} for sub, flag in condition.items()]
+    if not set(condition) <= _PUSHDOWN_OPERATORS:
+        return None
+    # Range operators only compare numbers in Chroma.
+    if not all(
+        is_scalar(operand) and (op == "$eq" or not isinstance(operand, str)) for op, operand in condition.items()
+    ):
+        return None
+    return [{f"{FIELD_PREFIX}{field}": {op: operand}} for op, operand in condition.items()]
+
+
+def where_clauses(prefix: tuple[str, ...], filter_: dict[str, Any] | None) -> tuple[list[Where], bool]:
+    """Return Chroma clauses for a namespace prefix and Store filter.
+
+    Returns:
+        The clauses and whether the whole filter was pushed down. When it was not,
+        callers must re-check candidates with `matches_filter`.
+    """
+    clauses: list[Where] = [{f"{NAMESPACE_PREFIX}{index}": segment} for index, segment in enumerate(prefix)]
+    exact = True
+    for field, condition in (filter_ or {}).items():
+        pushed = _pushdown(field, condition)
+        if pushed is None:
+            exact = False
+        else:
+            clauses.extend(pushed)
+    return clauses, exact
+
+
+def combine_where(clauses: Sequence[Where]) -> Where | None:
+    """AND clauses together (Chroma rejects a single-element `$and`)."""
+    if not clauses:
+        return None
+    return clauses[0] if len(clauses) == 1 else {"$and": list(clauses)}
+
+
+def _apply(value: Any, op: str, operand: Any) -> bool:
+    if op == "$eq":
+        return bool(value == operand)
+    if op == "$ne":
+        return bool(value != operand)
+    if op not in _OPERATORS:
+        raise ValueError(f"Unsupported operator: {op}")
+    return value is not None and _OPERATORS[op](float(value), float(operand))
+
+
+def matches_filter(value: Any, condition: Any) -> bool:
+    """Return whether a stored value satisfies a Store filter condition.
+
+    Raises:
+        ValueError: If the condition uses an unsupported operator.
+    """
+    if isinstance(condition, dict):
+        if any(key.startswith("$") for key in condition):
+            return all(_apply(value, op, operand) for op, operand in condition.items())
+        return isinstance(value, dict) and all(matches_filter(value.get(key), sub) for key, sub in condition.items())
+    return bool(value == condition)
+
+
+def namespace_matches(namespace: tuple[str, ...], condition: MatchCondition) -> bool:
+    """Return whether a namespace satisfies a `list_namespaces` prefix/suffix condition (`*` wildcards)."""
+    path = tuple(condition.path)
+    if len(namespace) < len(path):
+        return False
+    segment = namespace[: len(path)] if condition.match_type == "prefix" else namespace[len(namespace) - len(path) :]
+    return all(want in ("*", have) for have, want in zip(segment, path, strict=True))
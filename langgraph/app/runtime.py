@@ -10,9 +10,13 @@ class SageRuntimeContext(TypedDict, total=False):
 
     This data MUST NOT be persisted into SageState. It is supplied via
     `context=` when invoking a compiled graph or running nodes directly.
+
+    Attributes:
+        bypass_scan_cache: Skip the persistent ambiguity scan result cache and
+            call the agent (the fresh result still replaces the cached one).
     """
 
-    pass
+    bypass_scan_cache: bool
 
 
 def build_runtime_context(
@@ -20,7 +24,7 @@ def build_runtime_context(
 ) -> SageRuntimeContext:
     """Return a runtime context dict merged with defaults.
 
-    Context is intentionally empty for now; keep this function to preserve
-    call sites and allow future runtime knobs without refactors.
+    No knob is set by default; keep this function to preserve call sites and
+    allow future runtime defaults without refactors.
     """
     return overrides if overrides is not None else {}
@@ -6,7 +6,7 @@ from .ambiguity import AmbiguityContext
 from .gating import GatingContext
 from .state import EvidenceItem, PhaseEntry, PhaseSnapshot, PhaseStatus, SageState
 from .trace import add_events
-from .write_state import VectorWriteState
+from .write_state import VectorManifestState, VectorWriteState
 
 __all__ = [
     "AmbiguityContext",
@@ -16,6 +16,7 @@ __all__ = [
     "PhaseSnapshot",
     "PhaseStatus",
     "SageState",
+    "VectorManifestState",
     "VectorWriteState",
     "add_events",
 ]
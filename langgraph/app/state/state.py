@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Annotated, Literal
+from typing import Annotated, Any, Literal
 
 from langchain_core.messages import AnyMessage
 from langgraph.graph import add_messages
@@ -25,6 +25,8 @@ class EvidenceItem(BaseModel):
         namespace: Logical category or storage domain (e.g., ["project", "docs"]).
         key: Identifier within the namespace.
         score: Relevance or match score (e.g., vector search or heuristic).
+        value: Stored value captured at retrieval time (text, title, chunk fields).
+            When present, hydration uses it instead of reading the Store again.
 
     Example:
         >>> item = EvidenceItem(namespace=["context", "problem"], key="doc_123", score=0.95)
@@ -36,6 +38,7 @@ class EvidenceItem(BaseModel):
     namespace: list[str]
     key: str
     score: float
+    value: dict[str, Any] | None = None
 
 
 PhaseStatus = Literal["pending", "complete", "stale"]
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from typing import TypedDict
+from typing import Any, NotRequired, TypedDict
 
 
 class VectorWriteItem(TypedDict):
-    """Single vector write item payload."""
+    """Single vector write item payload.
+
+    `deleted` marks a tombstone: the item is purged from every agent namespace.
+    """
 
     uuid: str
     title: str
@@ -14,9 +17,22 @@ class VectorWriteItem(TypedDict):
     tags: list[str]
     agents: list[str]
     changed: int
+    deleted: NotRequired[bool]
 
 
 class VectorWriteState(TypedDict, total=False):
     """State container for vector write batches."""
 
     items: list[VectorWriteItem]
+    report: dict[str, Any]
+
+
+class VectorManifestState(TypedDict, total=False):
+    """State container for delta-sync manifest requests.
+
+    `namespace_prefix` is optional input (defaults to all agent namespaces);
+    `manifest` holds `{uuid, changed, content_hash}` entries.
+    """
+
+    namespace_prefix: list[str]
+    manifest: list[dict[str, Any]]
@@ -2,61 +2,139 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from typing import Any
+
 from langchain_core.documents import Document
-from langchain_core.tools import tool
+from langchain_core.tools import StructuredTool
 from langgraph.config import get_store
+from langgraph.store.base import BaseStore
 
+from app.platform.adapters.logging import get_logger
+from app.platform.runtime.retrieval import asearch_context, build_store_filter, search_context
+from app.platform.runtime.retrieval_cache import (
+    LookupKey,
+    QueryResultCache,
+    get_lookup_cache,
+    lookup_key,
+    namespace_generation,
+)
 from app.platform.utils.namespace_utils import build_agent_namespace
 
+DEFAULT_LOOKUP_LIMIT = 8
+
+logger = get_logger("tools.context_lookup")
+
+
+@dataclass(frozen=True)
+class _Lookup:
+    """Resolved namespace, Store filter and cache entry of one lookup."""
+
+    ns_prefix: tuple[str, ...]
+    filter_: dict[str, Any] | None
+    cache: QueryResultCache | None
+    key: LookupKey
+    generation: int
 
-@tool
-def context_lookup(query: str, collection: str) -> list[Document]:
+    def remember(self, docs: list[Document]) -> list[Document]:
+        """Cache `docs` under this lookup and return them."""
+        if self.cache is not None:
+            self.cache.set(self.key, docs, generation=self.generation)
+        return docs
+
+
+def _prepare(
+    store: BaseStore,
+    query: str,
+    collection: str,
+    limit: int,
+    tags: list[str] | None,
+    exclude_tags: list[str] | None,
+    changed_since: int | None,
+) -> tuple[_Lookup, list[Document] | None]:
+    """Resolve a lookup and return the cached documents on a hit."""
+    ns_prefix = build_agent_namespace(collection)
+    # Filters run inside store.search, before scoring.
+    filter_ = build_store_filter(tags=tags or (), exclude_tags=exclude_tags or (), changed_since=changed_since)
+    # Repeated lookups are served from the query-result cache until the vector writer
+    # touches this namespace (or the entry expires).
+    lookup = _Lookup(
+        ns_prefix,
+        filter_,
+        get_lookup_cache(),
+        lookup_key(store, query, collection, limit, filter_),
+        namespace_generation(store, ns_prefix),
+    )
+    if lookup.cache is None:
+        return lookup, None
+    cached = lookup.cache.get(lookup.key, generation=lookup.generation)
+    stats = lookup.cache.stats()
+    logger.info(
+        "context_lookup.cache",
+        collection=collection,
+        hit=cached is not None,
+        hits=stats.hits,
+        misses=stats.misses,
+        hit_rate=round(stats.hit_rate, 3),
+    )
+    return lookup, cached
+
+
+def lookup_context(
+    query: str,
+    collection: str,
+    limit: int = DEFAULT_LOOKUP_LIMIT,
+    tags: list[str] | None = None,
+    exclude_tags: list[str] | None = None,
+    changed_since: int | None = None,
+) -> list[Document]:
     """Retrieve agent-scoped context relevant to a query from long-term memory (Store-backed).
 
     Use this when an agent needs supporting context (policies, definitions, constraints,
     prior decisions, curated notes) that was previously stored. This performs semantic
-    search over the Store index (typically embedding only the stored "text" field) and
-    returns the best matches scoped to the agent namespace derived from `collection`.
+    search over the Store index (typically embedding only the stored "text" field),
+    fuses it with keyword (BM25) matches on "text" and "title", and returns the best
+    matches scoped to the agent namespace derived from `collection`.
 
     Args:
         query: Natural-language query describing what context is needed right now.
         collection: Agent machine name used as a namespace segment (e.g. "problem_framing").
                     Only context stored under this agent scope will be searched.
+        limit: Max documents returned (callers that re-rank fetch extra candidates).
+        tags: Only return context carrying every one of these tags (machine names).
+        exclude_tags: Never return context carrying any of these tags.
+        changed_since: Only return context changed at or after this Unix timestamp.
 
     Returns:
         A list of LangChain Documents ordered by relevance. Each Document contains:
           - page_content: the stored plain-text context ("text")
-          - metadata: includes stored fields (title, tags, agents, changed) plus provenance
-            (store_namespace, store_key) and an optional similarity score.
+          - metadata: includes stored fields (title, tags, agents, changed, and chunk fields
+            for chunked records) plus provenance (store_namespace, store_key), an
+            optional similarity score and, with hybrid retrieval, lexical_score/rrf_score.
     """
     store = get_store()
-    ns_prefix = build_agent_namespace(collection)
+    lookup, cached = _prepare(store, query, collection, limit, tags, exclude_tags, changed_since)
+    if cached is not None:
+        return cached
+    return lookup.remember(search_context(store, lookup.ns_prefix, query, limit=limit, filter_=lookup.filter_))
+
+
+async def alookup_context(
+    query: str,
+    collection: str,
+    limit: int = DEFAULT_LOOKUP_LIMIT,
+    tags: list[str] | None = None,
+    exclude_tags: list[str] | None = None,
+    changed_since: int | None = None,
+) -> list[Document]:
+    """Async variant of `lookup_context` (searches via `store.asearch`)."""
+    store = get_store()
+    lookup, cached = _prepare(store, query, collection, limit, tags, exclude_tags, changed_since)
+    if cached is not None:
+        return cached
+    docs = await asearch_context(store, lookup.ns_prefix, query, limit=limit, filter_=lookup.filter_)
+    return lookup.remember(docs)
 
-    # NOTE: namespace prefix is positional (not namespace_prefix=...)
-    results = store.search(
-        ns_prefix,
-        query=query,
-        limit=8,
-        offset=0,
-        # filter={...}  # optional
-    )
 
-    docs: list[Document] = []
-    for item in results:
-        value = item.value or {}
-        docs.append(
-            Document(
-                page_content=value.get("text", ""),
-                metadata={
-                    "title": value.get("title", ""),
-                    "tags": value.get("tags", []),
-                    "agents": value.get("agents", []),
-                    "changed": value.get("changed", 0),
-                    "store_namespace": list(getattr(item, "namespace", ns_prefix)),
-                    "store_key": getattr(item, "key", None),
-                    "score": getattr(item, "score", None),
-                },
-            )
-        )
-
-    return docs
+# `ainvoke`/`abatch` run the coroutine, so async nodes never block on the Store.
+context_lookup = StructuredTool.from_function(func=lookup_context, coroutine=alookup_context, name="context_lookup")
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Any
 
 from langchain_core.tools import tool
 from langgraph.config import get_store
+from langgraph.store.base import BaseStore
 
+from app.platform.runtime.vector_write_plan import plan_item_ops, require_item_uuid
+from app.platform.runtime.vector_writes import write_put_ops
+from app.platform.utils.chunking import get_chunking_config
 from app.platform.utils.namespace_utils import build_agent_namespace
 
 
@@ -16,40 +21,56 @@ def write_to_vectorstore(content: str, collection: str, metadata: dict | None =
     - `collection` is treated as a namespace segment (e.g. agent machine name).
     - Store embeddings happen automatically based on langgraph.json store.index config
       (e.g., fields=["text"]).
+    - Long content is split into chunks stored under `uuid#n` keys (config/embeddings.yaml).
+    - Batches of items go through `app/platform/runtime/vector_writes.write_vector_batch`.
+    """
+    return write_shared_to_vectorstore(content, [collection], metadata)[0]
+
+
+def write_shared_to_vectorstore(
+    content: str,
+    collections: Sequence[str],
+    metadata: dict | None = None,
+    *,
+    store: BaseStore | None = None,
+) -> list[str]:
+    """Write one item into every agent namespace it is tagged with.
+
+    Validates and chunks the item once, then writes the same records to each agent
+    namespace back to back. The Store embedder (`app/platform/utils/embeddings.py`)
+    reuses the vector of a text it has just embedded, so fan-out adds no extra
+    embedding calls.
+
+    Args:
+        content: Plain-text content to store and embed.
+        collections: Agent machine names used as namespace segments.
+        metadata: Item metadata; `uuid` is required (see `vector_write`).
+        store: Optional Store override. Defaults to the runtime Store.
+
+    Returns:
+        One status message per collection, in input order.
+
+    Raises:
+        ValueError: If `metadata.uuid` is missing.
     """
     md: dict[str, Any] = metadata or {}
     # Required for idempotent upsert (stable key)
-    uuid = md.get("uuid")
-    if not uuid:
-        raise ValueError("metadata.uuid is required (Drupal content UUID).")
-
-    changed = int(md.get("changed", 0))
-
-    store = get_store()
-
-    # Agent-scoped namespace so you can query per agent later:
-    # ("drupal","context","agent","problem_framing")
-    ns = build_agent_namespace(collection)
-
-    # Optional: skip if unchanged
-    existing = store.get(ns, uuid)
-    if existing and int(existing.value.get("changed", 0)) >= changed:
-        return f"Skipped (unchanged) for namespace={ns}, key={uuid}"
-
-    store.put(
-        ns,
-        uuid,
-        value={
-            "text": content,  # <- this is what you embed (fields=["text"])
-            "title": md.get("title", ""),
-            "tags": md.get("tags", []),  # machine names
-            "agents": md.get("agents", []),  # machine names
-            "changed": changed,
-        },
-        index=None,  # use default index fields from langgraph.json
-    )
-
-    return f"Document written to Store namespace={ns}, key='{uuid}'."
+    uuid = require_item_uuid(md)
+    resolved_store = store if store is not None else get_store()
+    chunking = get_chunking_config()
+
+    statuses: list[str] = []
+    for collection in dict.fromkeys(collections):
+        # Agent-scoped namespace so you can query per agent later:
+        # ("drupal","context","agent","problem_framing")
+        ns = build_agent_namespace(collection)
+        report = write_put_ops(plan_item_ops(content, md, [ns], chunking=chunking), store=resolved_store)
+        # Optional: skip if unchanged
+        if not report.written:
+            statuses.append(f"Skipped (unchanged) for namespace={ns}, key={uuid}")
+            continue
+        statuses.append(f"Document written to Store namespace={ns}, key='{uuid}' ({report.written} chunk(s)).")
+    return statuses
 
 
 @tool
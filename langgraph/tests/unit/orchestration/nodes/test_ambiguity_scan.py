@@ -0,0 +1,163 @@
+"""Tests for the ambiguity scan node and its routing through the ambiguity supervisor."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+from langchain_core.documents import Document
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.runnables import RunnableLambda
+from langgraph.runtime import Runtime
+from langgraph.types import Command
+
+from app.nodes import ambiguity_scan as ambiguity_scan_module
+from app.nodes.ambiguity_supervisor import make_node_ambiguity_supervisor
+from app.platform.runtime import ambiguity_scan_steps
+from app.platform.runtime.ambiguity_scan_steps import AmbiguityScanRoute
+from app.platform.runtime.retrieval_prefetch import PrefetchKey, RetrievalPrefetcher, prefetch_key
+from app.platform.runtime.scan_cache import ScanResultCache
+from app.platform.utils.disk_cache import DiskCache
+from app.platform.utils.namespace_utils import build_agent_namespace
+from app.runtime import SageRuntimeContext
+from app.state import SageState
+
+pytestmark = pytest.mark.orchestration
+
+
+PHASE = "problem_framing"
+RUNTIME: Runtime[SageRuntimeContext] = Runtime(context={})
+
+
+class ReadyPrefetcher:
+    """Hands out one finished lookup and records each claim with how long it may wait."""
+
+    def __init__(self, docs: list[Document] | None) -> None:
+        self.docs: list[Document] | None = docs
+        self.claims: list[tuple[PrefetchKey, float]] = []
+
+    def take(self, key: PrefetchKey, *, timeout: float) -> list[Document] | None:
+        self.claims.append((key, timeout))
+        docs, self.docs = self.docs, None
+        return docs
+
+
+def _scan_agent(calls: list[dict[str, Any]]) -> RunnableLambda:
+    def scan(agent_input: dict[str, Any]) -> dict[str, Any]:
+        calls.append(agent_input)
+        return {"structured_response": {"ambiguities": []}}
+
+    return RunnableLambda(scan)
+
+
+def _state(text: str = "Reduce churn for the KPI owners", *, history: list[Any] | None = None) -> SageState:
+    return SageState(messages=[*(history or []), HumanMessage(content=text)])
+
+
+def _apply(state: SageState, update: Any) -> SageState:
+    return state.model_copy(update={key: update[key] for key in ("phases", "ambiguity") if key in update})
+
+
+def test_scan_adopts_prefetched_evidence_and_supervisor_skips_retrieval(monkeypatch: pytest.MonkeyPatch) -> None:
+    doc = Document(
+        page_content="KPI owners are listed per region.",
+        metadata={"store_namespace": list(build_agent_namespace(PHASE)), "store_key": "kpi", "score": 0.8},
+    )
+    prefetcher = ReadyPrefetcher([doc])
+    monkeypatch.setattr(ambiguity_scan_steps, "get_prefetcher", lambda: prefetcher)
+    calls: list[dict[str, Any]] = []
+    scan = ambiguity_scan_module.make_node_ambiguity_scan(
+        _scan_agent(calls), phase=PHASE, goto="ambiguity_supervisor", claim_prefetch=True
+    )
+    supervisor = make_node_ambiguity_supervisor(phase=PHASE, goto="__end__")
+    state = _state()
+
+    update = scan(state, runtime=RUNTIME).update
+    assert isinstance(update, dict)
+    routed = supervisor(_apply(state, update), runtime=RUNTIME)
+
+    assert prefetcher.claims == [(prefetch_key(PHASE, "Reduce churn for the KPI owners"), 0.0)]
+    assert state.phases == {}
+    assert state.ambiguity.context_retrieval_round == 0
+    assert [item.key for item in update["phases"][PHASE].evidence] == ["kpi"]
+    assert [doc.page_content for doc in calls[0]["context_docs"]] == ["KPI owners are listed per region."]
+    assert update["ambiguity"].last_scan_retrieval_round == 1
+    assert routed.goto == "__end__"
+
+
+def test_async_scan_adopts_a_finished_prefetch_without_a_rescan(monkeypatch: pytest.MonkeyPatch) -> None:
+    doc = Document(
+        page_content="KPI owners are listed per region.",
+        metadata={"store_namespace": list(build_agent_namespace(PHASE)), "store_key": "kpi", "score": 0.8},
+    )
+    prefetcher = RetrievalPrefetcher(max_workers=1)
+    key = prefetch_key(PHASE, "Reduce churn for the KPI owners")
+    prefetcher.start(key, lambda: [doc])
+    # One worker: once a later lookup is claimed, the prefetch has finished.
+    drain = prefetch_key("drain", "")
+    prefetcher.start(drain, list)
+    prefetcher.take(drain, timeout=1.0)
+    monkeypatch.setattr(ambiguity_scan_steps, "get_prefetcher", lambda: prefetcher)
+    calls: list[dict[str, Any]] = []
+    scan = ambiguity_scan_module.make_node_ambiguity_scan_async(
+        _scan_agent(calls), phase=PHASE, goto="ambiguity_supervisor", claim_prefetch=True
+    )
+    supervisor = make_node_ambiguity_supervisor(phase=PHASE, goto="__end__")
+    state = _state()
+
+    async def run_scan() -> Command[AmbiguityScanRoute]:
+        return await scan(state, runtime=RUNTIME)
+
+    update = asyncio.run(run_scan()).update
+    assert isinstance(update, dict)
+    routed = supervisor(_apply(state, update), runtime=RUNTIME)
+
+    assert not prefetcher.pending(key)
+    assert [item.key for item in update["phases"][PHASE].evidence] == ["kpi"]
+    assert [doc.page_content for doc in calls[0]["context_docs"]] == ["KPI owners are listed per region."]
+    assert update["ambiguity"].last_scan_retrieval_round == 1
+    assert routed.goto == "__end__"
+
+
+def test_scan_without_a_finished_prefetch_leaves_retrieval_to_the_supervisor(monkeypatch: pytest.MonkeyPatch) -> None:
+    prefetcher = ReadyPrefetcher(None)
+    monkeypatch.setattr(ambiguity_scan_steps, "get_prefetcher", lambda: prefetcher)
+    scan = ambiguity_scan_module.make_node_ambiguity_scan(
+        _scan_agent([]), phase=PHASE, goto="ambiguity_supervisor", claim_prefetch=True
+    )
+    supervisor = make_node_ambiguity_supervisor(phase=PHASE, goto="__end__")
+    state = _state()
+
+    command = scan(state, runtime=RUNTIME)
+    routed = supervisor(_apply(state, command.update), runtime=RUNTIME)
+
+    assert prefetcher.claims == [(prefetch_key(PHASE, "Reduce churn for the KPI owners"), 0.0)]
+    assert routed.goto == "retrieve_context"
+
+
+def test_scan_serves_repeats_from_the_result_cache_unless_bypassed() -> None:
+    calls: list[dict[str, Any]] = []
+    scan = ambiguity_scan_module.make_node_ambiguity_scan(
+        _scan_agent(calls), phase=PHASE, result_cache=ScanResultCache(DiskCache(":memory:"), version="v1")
+    )
+
+    fresh = scan(_state(), runtime=RUNTIME)
+    cached = scan(_state(), runtime=RUNTIME)
+    assert len(calls) == 1
+    assert cached.goto == fresh.goto == "supervisor"
+
+    scan(_state(), runtime=Runtime(context={"bypass_scan_cache": True}))
+    assert len(calls) == 2
+
+
+def test_scan_cache_key_covers_the_message_history() -> None:
+    calls: list[dict[str, Any]] = []
+    scan = ambiguity_scan_module.make_node_ambiguity_scan(
+        _scan_agent(calls), phase=PHASE, result_cache=ScanResultCache(DiskCache(":memory:"), version="v1")
+    )
+
+    scan(_state(), runtime=RUNTIME)
+    scan(_state(history=[HumanMessage(content="Focus on EMEA"), AIMessage(content="Noted.")]), runtime=RUNTIME)
+
+    assert len(calls) == 2
@@ -0,0 +1,47 @@
+"""Tests for ambiguity supervisor routing around context retrieval."""
+
+from __future__ import annotations
+
+import pytest
+from langchain_core.messages import HumanMessage
+from langgraph.runtime import Runtime
+
+from app.nodes.ambiguity_supervisor import make_node_ambiguity_supervisor
+from app.runtime import SageRuntimeContext
+from app.state import AmbiguityContext, EvidenceItem, PhaseEntry, SageState
+
+pytestmark = pytest.mark.orchestration
+
+PHASE = "problem_framing"
+RUNTIME: Runtime[SageRuntimeContext] = Runtime(context={})
+
+
+def _scanned_state(*, context_retrieval_round: int, last_scan_retrieval_round: int) -> SageState:
+    evidence = [EvidenceItem(namespace=["context", PHASE], key="kpi", score=0.8, value={"text": "KPI owners"})]
+    return SageState(
+        messages=[HumanMessage(content="Reduce churn for the KPI owners")],
+        phases={PHASE: PhaseEntry(evidence=evidence)},
+        ambiguity=AmbiguityContext(
+            target_step=PHASE,
+            checked=True,
+            eligible=True,
+            context_retrieval_round=context_retrieval_round,
+            last_scan_retrieval_round=last_scan_retrieval_round,
+        ),
+    )
+
+
+def test_supervisor_skips_the_rescan_when_the_scan_covered_the_retrieval_round() -> None:
+    supervisor = make_node_ambiguity_supervisor(phase=PHASE, goto="__end__")
+
+    routed = supervisor(_scanned_state(context_retrieval_round=1, last_scan_retrieval_round=1), runtime=RUNTIME)
+
+    assert routed.goto == "__end__"
+
+
+def test_supervisor_rescans_evidence_retrieved_after_the_scan() -> None:
+    supervisor = make_node_ambiguity_supervisor(phase=PHASE, goto="__end__")
+
+    routed = supervisor(_scanned_state(context_retrieval_round=1, last_scan_retrieval_round=0), runtime=RUNTIME)
+
+    assert routed.goto == "ambiguity_scan"
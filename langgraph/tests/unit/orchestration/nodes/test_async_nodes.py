@@ -0,0 +1,92 @@
+"""Smoke tests for the async node variants run through `ainvoke`."""
+
+from __future__ import annotations
+
+import asyncio
+from decimal import Decimal
+from typing import Any
+
+import pytest
+from langchain_core.documents import Document
+from langchain_core.messages import HumanMessage
+from langchain_core.runnables import RunnableLambda
+from langgraph.runtime import Runtime
+from langgraph.types import Command
+
+from app.graphs.subgraphs.ambiguity_check.subgraph import build_ambiguity_preflight_subgraph
+from app.nodes.ambiguity_clarification import make_node_ambiguity_clarification_async
+from app.platform.runtime.ambiguity_clarification_steps import AmbiguityClarificationRoute
+from app.platform.utils.namespace_utils import build_agent_namespace
+from app.runtime import SageRuntimeContext
+from app.schemas.ambiguities import AmbiguityItem
+from app.state import AmbiguityContext, SageState
+
+pytestmark = pytest.mark.orchestration
+
+PHASE = "problem_framing"
+INPUT = "Reduce churn for the KPI owners"
+
+
+def _recording(calls: list[Any], result: Any) -> RunnableLambda:
+    def call(payload: Any) -> Any:
+        calls.append(payload)
+        return result
+
+    return RunnableLambda(call)
+
+
+def test_async_preflight_subgraph_scans_retrieves_and_rescans() -> None:
+    scans: list[Any] = []
+    lookups: list[Any] = []
+    doc = Document(
+        page_content="KPI owners are listed per region.",
+        metadata={"store_namespace": list(build_agent_namespace(PHASE)), "store_key": "kpi", "score": 0.8},
+    )
+    graph = build_ambiguity_preflight_subgraph(
+        ambiguity_scan_agent=_recording(scans, {"structured_response": {"ambiguities": []}}),
+        ambiguity_clarification_agent=_recording([], {"structured_response": {"responses": []}}),
+        retrieve_tool=_recording(lookups, [doc]),
+        phase=PHASE,
+        prefetch_context=False,
+        async_nodes=True,
+    )
+
+    result = asyncio.run(graph.ainvoke(SageState(messages=[HumanMessage(content=INPUT)]), context={}))
+
+    assert len(scans) == 2
+    assert len(lookups) == 1
+    assert [item.key for item in result["phases"][PHASE].evidence] == ["kpi"]
+    assert result["ambiguity"].eligible
+
+
+def test_async_clarification_node_applies_the_agent_answer() -> None:
+    item = AmbiguityItem(
+        key=["scope", "market", "region"],
+        description="Which regions are in scope?",
+        clarifying_question="Which regions should we cover?",
+        resolution_assumption="All regions.",
+        resolution_impact_direction="0",
+        resolution_impact_value=0.2,
+        importance=Decimal("0.95"),
+        confidence=Decimal("0.9"),
+    )
+    answer = {"clarified_input": "Reduce churn in EMEA", "clarified_keys": ["scope | market | region"]}
+    calls: list[Any] = []
+    node = make_node_ambiguity_clarification_async(
+        _recording(calls, {"structured_response": {"responses": [answer]}}), phase=PHASE
+    )
+    state = SageState(
+        messages=[HumanMessage(content="EMEA only")],
+        ambiguity=AmbiguityContext(target_step=PHASE, checked=True, detected=[item]),
+    )
+    runtime: Runtime[SageRuntimeContext] = Runtime(context={})
+
+    async def clarify() -> Command[AmbiguityClarificationRoute]:
+        return await node(state, runtime=runtime)
+
+    command = asyncio.run(clarify())
+
+    assert calls[0]["keys_to_clarify"] == ["scope | market | region"]
+    assert command.goto == "ambiguity_supervisor"
+    assert isinstance(command.update, dict)
+    assert command.update["ambiguity"].eligible
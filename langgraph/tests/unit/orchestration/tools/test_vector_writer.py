@@ -0,0 +1,68 @@
+"""Tests for the Store-backed vector writer."""
+
+from __future__ import annotations
+
+import pytest
+from langchain_core.embeddings import Embeddings
+from langgraph.store.memory import InMemoryStore
+
+from app.platform.utils.embeddings import SharedEmbeddings
+from app.platform.utils.namespace_utils import build_agent_namespace
+from app.tools.vector_writer import write_shared_to_vectorstore
+
+pytestmark = pytest.mark.orchestration
+
+
+class CountingEmbeddings(Embeddings):
+    def __init__(self) -> None:
+        self.embedded_texts: list[str] = []
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.embedded_texts.extend(texts)
+        return [[float(len(text)), 1.0] for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return self.embed_documents([text])[0]
+
+
+def _build_store() -> tuple[InMemoryStore, CountingEmbeddings]:
+    counting = CountingEmbeddings()
+    store = InMemoryStore(index={"embed": SharedEmbeddings(counting), "dims": 2, "fields": ["text"]})
+    return store, counting
+
+
+def test_write_shared_to_vectorstore_embeds_once_for_all_agents() -> None:
+    store, counting = _build_store()
+    agents = ["problem_framing", "ambiguity_scan", "ambiguity_clarification"]
+
+    statuses = write_shared_to_vectorstore(
+        "Shared context body",
+        agents,
+        {"uuid": "doc-1", "agents": agents, "changed": 10},
+        store=store,
+    )
+
+    assert len(statuses) == 3
+    assert counting.embedded_texts == ["Shared context body"]
+    for agent in agents:
+        # Keyed `doc-1` or `doc-1#0` depending on the chunking config.
+        stored = store.search(build_agent_namespace(agent))
+        assert [item.value["text"] for item in stored] == ["Shared context body"]
+
+
+def test_write_shared_to_vectorstore_skips_unchanged_namespaces() -> None:
+    store, _counting = _build_store()
+    md = {"uuid": "doc-1", "agents": ["problem_framing"], "changed": 10}
+    write_shared_to_vectorstore("Body", ["problem_framing"], md, store=store)
+
+    statuses = write_shared_to_vectorstore("Body", ["problem_framing", "ambiguity_scan"], md, store=store)
+
+    assert statuses[0].startswith("Skipped (unchanged)")
+    assert statuses[1].startswith("Document written")
+
+
+def test_write_shared_to_vectorstore_requires_uuid() -> None:
+    store, _counting = _build_store()
+
+    with pytest.raises(ValueError, match="uuid is required"):
+        write_shared_to_vectorstore("Body", ["problem_framing"], {}, store=store)
@@ -5,6 +5,7 @@ from __future__ import annotations
 from langchain_core.documents import Document
 
 from app.platform.adapters.evidence import (
+    documents_to_evidence,
     evidence_to_items,
     items_to_evidence_dicts,
     update_phase_evidence,
@@ -68,3 +69,29 @@ def test_update_phase_evidence_preserves_phase_data():
     assert updated.status == "complete"
     assert len(updated.evidence) == 1
     assert updated.evidence[0].key == "test-1"
+
+
+def test_documents_to_evidence_carries_stored_value():
+    """Test that context_lookup Documents become evidence carrying their stored value."""
+    docs = [
+        Document(
+            page_content="Chunk text",
+            metadata={
+                "title": "Doc",
+                "tags": [],
+                "uuid": "doc-1",
+                "chunk_index": 1,
+                "store_namespace": ["drupal", "context"],
+                "store_key": "doc-1#1",
+                "score": 0.7,
+            },
+        ),
+        Document(page_content="No provenance", metadata={"title": "Orphan"}),
+    ]
+
+    items = documents_to_evidence(docs)
+
+    assert len(items) == 1
+    assert items[0].key == "doc-1#1"
+    assert items[0].score == 0.7
+    assert items[0].value == {"text": "Chunk text", "title": "Doc", "tags": [], "uuid": "doc-1", "chunk_index": 1}
@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from app.platform.config import CONFIG_DIR, FileLoader, load_project_env
+from app.platform.config import AGENTS_DIR, CONFIG_DIR, FileLoader, build_input_files, files_signature, load_project_env
 
 pytestmark = pytest.mark.platform
 
@@ -23,3 +23,29 @@ def test_file_loader_resolves_agent_prompt() -> None:
 def test_env_loader_is_idempotent() -> None:
     load_project_env()
     load_project_env()
+
+
+def test_build_input_files_cover_prompts_and_configs() -> None:
+    files = build_input_files()
+
+    assert AGENTS_DIR / "ambiguity_scan" / "prompts" / "system.prompt" in files
+    assert CONFIG_DIR / "provider" / "openai.yaml" in files
+    assert CONFIG_DIR / "embeddings.yaml" in files
+
+
+def test_files_signature_tracks_edits_and_missing_files(tmp_path: Path) -> None:
+    prompt = tmp_path / "system.prompt"
+    prompt.write_text("v1")
+    before = files_signature([prompt, tmp_path / "missing.yaml"])
+
+    prompt.write_text("version 2")
+
+    assert files_signature([prompt, tmp_path / "missing.yaml"]) != before
+    assert before[1][2] == -1
+
+
+def test_file_loader_clear_cache_rereads_files() -> None:
+    FileLoader.load_agent_config("ambiguity_scan")
+    FileLoader.clear_cache()
+
+    assert FileLoader.load_agent_config.cache_info().currsize == 0
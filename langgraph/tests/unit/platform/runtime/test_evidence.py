@@ -0,0 +1,155 @@
+"""Tests for evidence hydration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from typing import Any
+
+import pytest
+from langgraph.store.base import GetOp, Op, Result
+from langgraph.store.memory import InMemoryStore
+
+from app.platform.runtime.evidence import ahydrate_evidence_docs, hydrate_evidence_docs
+from app.platform.runtime.vector_writes import write_vector_batch
+from app.platform.utils.chunking import ChunkingConfig
+from app.platform.utils.namespace_utils import build_agent_namespace
+from app.state.write_state import VectorWriteItem
+
+pytestmark = pytest.mark.platform
+
+NAMESPACE = list(build_agent_namespace("problem_framing"))
+TEXT = "Alpha one. Bravo two. Charlie three. Delta four. Echo five."
+
+
+class CountingStore(InMemoryStore):
+    def __init__(self) -> None:
+        super().__init__()
+        self.get_keys: list[str] = []
+        self.get_batches = 0
+
+    def batch(self, ops: Iterable[Op]) -> list[Result]:
+        ops = list(ops)
+        self.get_keys.extend(op.key for op in ops if isinstance(op, GetOp))
+        self.get_batches += any(isinstance(op, GetOp) for op in ops)
+        return super().batch(ops)
+
+    async def abatch(self, ops: Iterable[Op]) -> list[Result]:
+        return self.batch(ops)
+
+
+def _store_chunked(chunking: ChunkingConfig | None = None) -> CountingStore:
+    store = CountingStore()
+    item = VectorWriteItem(uuid="doc-1", title="Doc", text=TEXT, tags=[], agents=["problem_framing"], changed=1)
+    write_vector_batch([item], store=store, chunking=chunking or ChunkingConfig(size=16, overlap=0))
+    return store
+
+
+def test_hydrate_evidence_docs_stitches_neighbouring_chunks() -> None:
+    store = _store_chunked()
+
+    docs = hydrate_evidence_docs(
+        [{"namespace": NAMESPACE, "key": "doc-1#2", "score": 0.9}],
+        phase="problem_framing",
+        store=store,
+        stitch_neighbors=1,
+    )
+
+    assert [doc.page_content for doc in docs] == ["Bravo two. Charlie three. Delta four."]
+    assert docs[0].metadata["chunk_keys"] == ["doc-1#1", "doc-1#2", "doc-1#3"]
+
+
+def test_hydrate_evidence_docs_skips_chunks_already_stitched() -> None:
+    store = _store_chunked()
+
+    docs = hydrate_evidence_docs(
+        [{"namespace": NAMESPACE, "key": "doc-1#0", "score": 0.9}, {"namespace": NAMESPACE, "key": "doc-1#1"}],
+        phase="problem_framing",
+        store=store,
+        stitch_neighbors=1,
+    )
+
+    assert [doc.page_content for doc in docs] == ["Alpha one. Bravo two."]
+
+
+def test_hydrate_evidence_docs_drops_overlap_when_stitching() -> None:
+    store = _store_chunked(ChunkingConfig(size=16, overlap=5, sentence_aware=False))
+
+    docs = hydrate_evidence_docs(
+        [{"namespace": NAMESPACE, "key": "doc-1#2", "score": 0.5}],
+        phase="problem_framing",
+        store=store,
+        stitch_neighbors=4,
+    )
+
+    assert docs[0].page_content == TEXT
+
+
+def test_hydrate_evidence_docs_returns_single_chunk_without_stitching() -> None:
+    store = _store_chunked()
+
+    docs = hydrate_evidence_docs(
+        [{"namespace": NAMESPACE, "key": "doc-1#2", "score": 0.9}],
+        phase="problem_framing",
+        store=store,
+        stitch_neighbors=0,
+    )
+
+    assert docs[0].page_content == "Charlie three."
+
+
+def test_hydrate_evidence_docs_uses_carried_values_without_store_reads() -> None:
+    store = _store_chunked()
+    stored = store.get(tuple(NAMESPACE), "doc-1#2")
+    assert stored is not None
+    carried = dict(stored.value)
+    store.get_keys.clear()
+
+    docs = hydrate_evidence_docs(
+        [
+            {"namespace": NAMESPACE, "key": "doc-1#2", "score": 0.9, "value": carried},
+            {"namespace": NAMESPACE, "key": "doc-1#3", "score": 0.5},
+        ],
+        phase="problem_framing",
+        store=store,
+        stitch_neighbors=1,
+    )
+
+    assert [doc.page_content for doc in docs] == ["Bravo two. Charlie three. Delta four."]
+    assert "doc-1#2" not in store.get_keys
+
+
+def test_hydrate_evidence_docs_hydrates_carried_values_without_a_store() -> None:
+    docs = hydrate_evidence_docs(
+        [{"namespace": NAMESPACE, "key": "doc-9", "score": 0.4, "value": {"text": "Carried", "title": "T"}}],
+        phase="problem_framing",
+        stitch_neighbors=0,
+    )
+
+    assert [(doc.page_content, doc.metadata["title"]) for doc in docs] == [("Carried", "T")]
+
+
+def test_hydrate_evidence_docs_batches_reads_and_keeps_order() -> None:
+    store = _store_chunked()
+    store.get_keys.clear()
+    store.get_batches = 0
+    evidence = [{"namespace": NAMESPACE, "key": key, "score": 0.5} for key in ("doc-1#4", "missing", "doc-1#0")]
+
+    docs = hydrate_evidence_docs(evidence, phase="problem_framing", store=store, stitch_neighbors=1)
+
+    assert [doc.metadata["store_key"] for doc in docs] == ["doc-1#4", "doc-1#0"]
+    assert store.get_batches == 2
+    assert sorted(store.get_keys) == ["doc-1#0", "doc-1#1", "doc-1#3", "doc-1#4", "missing"]
+
+
+def test_ahydrate_evidence_docs_matches_sync_hydration() -> None:
+    store = _store_chunked()
+    evidence: list[dict[str, Any]] = [
+        {"namespace": NAMESPACE, "key": "doc-1#2", "score": 0.9},
+        {"namespace": NAMESPACE, "key": "doc-1#0"},
+    ]
+
+    sync_docs = hydrate_evidence_docs(evidence, phase="problem_framing", store=store, stitch_neighbors=1)
+    async_docs = asyncio.run(ahydrate_evidence_docs(evidence, phase="problem_framing", store=store, stitch_neighbors=1))
+
+    assert async_docs == sync_docs
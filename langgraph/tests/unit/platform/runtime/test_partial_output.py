@@ -0,0 +1,116 @@
+"""Tests for incremental structured output parsing."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+import pytest
+from langchain_core.messages import AIMessageChunk, ToolMessage
+from langchain_core.messages.tool import tool_call_chunk
+
+from app.platform.runtime.partial_output import (
+    PARTIAL_OUTPUT_EVENT,
+    PartialOutputParser,
+    astream_agent,
+    partial_output_payload,
+    stream_agent,
+)
+
+pytestmark = pytest.mark.platform
+
+ARGS = '{"business_domain": "retail", "actors": ["CRM team", "Support"]}'
+
+
+def _tool_chunks(args: str, *, message_id: str = "run-1", name: str = "ProblemFrame") -> list[AIMessageChunk]:
+    parts = [args[i : i + 10] for i in range(0, len(args), 10)]
+    return [
+        AIMessageChunk(
+            content="",
+            id=message_id,
+            tool_call_chunks=[tool_call_chunk(name=name if i == 0 else None, args=part, id=None, index=0)],
+        )
+        for i, part in enumerate(parts)
+    ]
+
+
+def test_parser_reports_fields_as_tool_call_arguments_arrive() -> None:
+    parser = PartialOutputParser("ProblemFrame")
+
+    snapshots = [fields for chunk in _tool_chunks(ARGS) if (fields := parser.feed(chunk)) is not None]
+
+    assert snapshots[0] == {"business_domain": "retail"}
+    assert {"business_domain": "retail", "actors": ["CRM team"]} in snapshots
+    assert snapshots[-1] == parser.fields == {"business_domain": "retail", "actors": ["CRM team", "Support"]}
+
+
+def test_parser_ignores_other_tools_and_restarts_on_a_new_message() -> None:
+    parser = PartialOutputParser("ProblemFrame")
+
+    assert all(parser.feed(chunk) is None for chunk in _tool_chunks('{"query": "kpi"}', name="context_docs"))
+    assert parser.feed(ToolMessage(content="[]", tool_call_id="c1")) is None
+    for chunk in _tool_chunks('{"business_domain": "retail"}'):
+        parser.feed(chunk)
+    for chunk in _tool_chunks('{"business_domain": "fintech"}', message_id="run-2"):
+        parser.feed(chunk)
+
+    assert parser.fields == {"business_domain": "fintech"}
+
+
+def test_parser_reads_json_text_from_provider_structured_output() -> None:
+    parser = PartialOutputParser("ProblemFrame")
+
+    parser.feed(AIMessageChunk(content='{"business_domain": "ret', id="run-1"))
+
+    assert parser.fields == {"business_domain": "ret"}
+    assert parser.feed(AIMessageChunk(content="", id="run-1")) is None
+
+
+class StreamingAgent:
+    """Replays chunks and a final state like a compiled agent graph."""
+
+    def __init__(self) -> None:
+        self.final = {"structured_response": {"business_domain": "retail"}}
+        self.calls: list[tuple[dict[str, Any], list[str]]] = []
+
+    def _events(self) -> list[tuple[str, Any]]:
+        return [
+            ("values", {"messages": []}),
+            *[("messages", (chunk, {})) for chunk in _tool_chunks(ARGS)],
+            ("values", self.final),
+        ]
+
+    def stream(self, agent_input: dict[str, Any], *, stream_mode: list[str]) -> Iterator[tuple[str, Any]]:
+        self.calls.append((agent_input, stream_mode))
+        yield from self._events()
+
+    async def astream(self, agent_input: dict[str, Any], *, stream_mode: list[str]) -> AsyncIterator[tuple[str, Any]]:
+        self.calls.append((agent_input, stream_mode))
+        for event in self._events():
+            yield event
+
+
+def test_stream_agent_returns_final_state_and_reports_partials() -> None:
+    agent = StreamingAgent()
+    partials: list[dict[str, Any]] = []
+
+    result = stream_agent(agent, {}, schema_name="ProblemFrame", on_partial=partials.append)  # type: ignore[arg-type]
+    async_partials: list[dict[str, Any]] = []
+    async_result = asyncio.run(
+        astream_agent(agent, {}, schema_name="ProblemFrame", on_partial=async_partials.append)  # type: ignore[arg-type]
+    )
+
+    assert result is async_result is agent.final
+    assert agent.calls == [({}, ["messages", "values"])] * 2
+    assert partials == async_partials
+    assert partials[-1]["actors"] == ["CRM team", "Support"]
+
+
+def test_partial_output_payload_shape() -> None:
+    assert partial_output_payload(owner="problem_framing", phase="problem_framing", fields={"a": 1}) == {
+        "type": PARTIAL_OUTPUT_EVENT,
+        "owner": "problem_framing",
+        "phase": "problem_framing",
+        "data": {"a": 1},
+    }
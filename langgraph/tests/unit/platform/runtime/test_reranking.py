@@ -0,0 +1,88 @@
+"""Tests for phase-level re-ranking of retrieved documents."""
+
+from __future__ import annotations
+
+import pytest
+from langchain_core.documents import Document
+
+from app.platform.core.contract.phases import RetrievalPolicy
+from app.platform.runtime.reranking import merge_collection_results, rerank_documents
+
+pytestmark = pytest.mark.platform
+
+
+def _doc(key: str, text: str, score: float | None) -> Document:
+    return Document(page_content=text, metadata={"store_key": key, "score": score})
+
+
+DOCS = [
+    _doc("kpi", "KPI owners and quarterly metric targets", 0.9),
+    _doc("kpi-copy", "KPI owners and quarterly metric targets", 0.88),
+    _doc("kpi-near", "KPI owners and quarterly metric targets per team", 0.85),
+    _doc("risk", "Risk register and mitigation plans", 0.6),
+    _doc("noise", "Unrelated office catering menu", 0.1),
+    _doc("exact", "ZX-9000 product identifier", None),
+]
+
+
+def _keys(docs: list[Document]) -> list[str]:
+    return [doc.metadata["store_key"] for doc in docs]
+
+
+def test_default_policy_keeps_lookup_order() -> None:
+    assert _keys(rerank_documents(DOCS, RetrievalPolicy(top_k=3))) == ["kpi", "kpi-copy", "kpi-near"]
+
+
+def test_min_score_drops_weak_matches_but_keeps_lexical_only_hits() -> None:
+    ranked = rerank_documents(DOCS, RetrievalPolicy(min_score=0.5))
+
+    assert "noise" not in _keys(ranked)
+    assert "exact" in _keys(ranked)
+
+
+def test_duplicate_threshold_collapses_same_content() -> None:
+    ranked = rerank_documents(DOCS, RetrievalPolicy(duplicate_threshold=0.95))
+
+    assert _keys(ranked) == ["kpi", "kpi-near", "risk", "noise", "exact"]
+
+
+def test_mmr_promotes_diverse_documents() -> None:
+    ranked = rerank_documents(DOCS[:4], RetrievalPolicy(top_k=2, mmr_lambda=0.5))
+
+    assert _keys(ranked) == ["kpi", "risk"]
+
+
+def test_mmr_with_relevance_only_matches_score_order() -> None:
+    ranked = rerank_documents(DOCS[:4], RetrievalPolicy(top_k=2, mmr_lambda=1.0))
+
+    assert _keys(ranked) == ["kpi", "kpi-copy"]
+
+
+def test_merge_collection_results_normalizes_and_weights_scores() -> None:
+    phase = [_doc("kpi", "KPI owners", 0.8), _doc("risk", "Risk register", 0.4)]
+    glossary = [
+        Document(page_content="KPI: key performance indicator", metadata={"store_key": "kpi-term", "score": 0.3})
+    ]
+
+    merged = merge_collection_results(
+        {"problem_framing": phase, "glossary": glossary}, {"problem_framing": 1.0, "glossary": 0.75}
+    )
+
+    assert _keys(merged) == ["kpi", "kpi-term", "risk"]
+    assert [doc.metadata["relevance"] for doc in merged] == pytest.approx([1.0, 0.75, 0.5])
+    assert merged[1].metadata["collection"] == "glossary"
+
+
+def test_merge_collection_results_keeps_best_copy_and_feeds_mmr() -> None:
+    shared = {"store_namespace": ["drupal", "shared"], "store_key": "policy", "score": 0.5}
+    merged = merge_collection_results(
+        {
+            "a": [Document(page_content="Policy", metadata=shared)],
+            "b": [Document(page_content="Policy", metadata=shared), _doc("other", "Other", 1.0)],
+        },
+        {"a": 1.0, "b": 0.5},
+    )
+
+    assert _keys(merged) == ["policy", "other"]
+    assert merged[0].metadata["collection"] == "a"
+    assert _keys(rerank_documents(merged, RetrievalPolicy(top_k=1, mmr_lambda=1.0))) == ["policy"]
@@ -0,0 +1,134 @@
+"""Tests for hybrid BM25 + vector retrieval."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+from langgraph.store.base import SearchItem
+from langgraph.store.memory import InMemoryStore
+
+from app.platform.runtime.lexical_index import LexicalIndex, get_lexical_index
+from app.platform.runtime.retrieval import (
+    asearch_context,
+    build_store_filter,
+    reciprocal_rank_fusion,
+    search_context,
+)
+from app.platform.runtime.vector_writes import VectorWriteItem, write_vector_batch
+from app.platform.utils.hashing_embeddings import HashingEmbeddings
+from app.platform.utils.namespace_utils import build_agent_namespace
+
+pytestmark = pytest.mark.platform
+
+NAMESPACE = build_agent_namespace("problem_framing")
+
+
+def _item(uuid: str, title: str, text: str, changed: int = 1, tags: list[str] | None = None) -> VectorWriteItem:
+    return {
+        "uuid": uuid,
+        "title": title,
+        "text": text,
+        "tags": tags or [],
+        "agents": ["problem_framing"],
+        "changed": changed,
+    }
+
+
+def test_reciprocal_rank_fusion_rewards_agreement() -> None:
+    fused = reciprocal_rank_fusion([["a", "b", "c"], ["b", "c"]], k=60)
+
+    assert [key for key, _ in fused] == ["b", "c", "a"]
+    assert fused[0][1] == pytest.approx(1 / 62 + 1 / 61)
+
+
+def test_lexical_index_ranks_title_terms_and_forgets_deletes() -> None:
+    index = LexicalIndex()
+    index.upsert(NAMESPACE, "gdpr", {"title": "GDPR", "text": "Retention rules."})
+    index.upsert(NAMESPACE, "notes", {"title": "Notes", "text": "Mentions GDPR once among many other words."})
+    index.upsert(("other",), "gdpr", {"title": "GDPR", "text": "Outside the prefix."})
+
+    assert [hit.key for hit in index.search(NAMESPACE[:2], "gdpr", limit=5)] == ["gdpr", "notes"]
+
+    index.upsert(NAMESPACE, "gdpr", None)
+
+    assert [hit.key for hit in index.search(NAMESPACE, "gdpr", limit=5)] == ["notes"]
+
+
+def test_search_context_fuses_exact_term_hits_from_the_writer() -> None:
+    store = InMemoryStore(index={"embed": HashingEmbeddings(dims=64), "dims": 64, "fields": ["text"]})
+    write_vector_batch(
+        [
+            _item("kpi", "KPIs", "KPI owners and metric targets"),
+            _item("sku", "Catalog", "Use the ZX-9000 identifier for the product feed"),
+        ],
+        store=store,
+    )
+    write_vector_batch([_item("kpi", "KPIs", "KPI owners", changed=2)], store=store)
+
+    docs = search_context(store, NAMESPACE, "ZX-9000", limit=1)
+
+    assert [doc.metadata["store_key"] for doc in docs] == ["sku"]
+    assert docs[0].metadata["lexical_score"] > 0
+    assert docs[0].metadata["rrf_score"] > 0
+    index = get_lexical_index(store)
+    assert index is not None
+    assert [hit.value["text"] for hit in index.search(NAMESPACE, "owners", limit=5)] == ["KPI owners"]
+
+
+def test_search_context_loads_records_written_before_the_index() -> None:
+    store = InMemoryStore(index={"embed": HashingEmbeddings(dims=64), "dims": 64, "fields": ["text"]})
+    store.put(NAMESPACE, "legacy", {"title": "Legacy", "text": "Mainframe COBOL batch jobs"})
+    store.put(NAMESPACE, "cloud", {"title": "Cloud", "text": "Serverless functions"})
+
+    docs = search_context(store, NAMESPACE, "cobol", limit=2)
+
+    assert docs[0].metadata["store_key"] == "legacy"
+    assert docs[0].metadata["lexical_score"] > 0
+
+
+def test_asearch_context_matches_sync_search() -> None:
+    store = InMemoryStore(index={"embed": HashingEmbeddings(dims=64), "dims": 64, "fields": ["text"]})
+    store.put(NAMESPACE, "legacy", {"title": "Legacy", "text": "Mainframe COBOL batch jobs"})
+    store.put(NAMESPACE, "cloud", {"title": "Cloud", "text": "Serverless functions"})
+
+    async_docs = asyncio.run(asearch_context(store, NAMESPACE, "cobol", limit=2))
+
+    assert async_docs[0].metadata["store_key"] == "legacy"
+    assert async_docs == search_context(store, NAMESPACE, "cobol", limit=2)
+
+
+def test_build_store_filter_covers_tags_and_recency() -> None:
+    assert build_store_filter() is None
+    assert build_store_filter(tags=["gdpr"], exclude_tags=["draft"], changed_since=10) == {
+        "tag_index": {"gdpr": True, "draft": {"$ne": True}},
+        "changed": {"$gte": 10},
+    }
+
+
+class FilterRecordingStore(InMemoryStore):
+    filters: list[object]
+
+    def search(self, *args: Any, **kwargs: Any) -> list[SearchItem]:
+        self.filters.append(kwargs.get("filter"))
+        return super().search(*args, **kwargs)
+
+
+def test_search_context_pushes_filters_into_store_and_lexical_hits() -> None:
+    store = FilterRecordingStore(index={"embed": HashingEmbeddings(dims=64), "dims": 64, "fields": ["text"]})
+    store.filters = []
+    write_vector_batch(
+        [
+            _item("policy", "Policy", "GDPR retention policy", changed=5, tags=["gdpr"]),
+            _item("draft", "Draft", "GDPR retention draft", changed=5, tags=["gdpr", "draft"]),
+            _item("old", "Old", "GDPR retention notes", changed=1, tags=["gdpr"]),
+        ],
+        store=store,
+    )
+    filter_ = build_store_filter(tags=["gdpr"], exclude_tags=["draft"], changed_since=3)
+
+    docs = search_context(store, NAMESPACE, "GDPR retention", limit=5, filter_=filter_)
+
+    assert [doc.metadata["store_key"] for doc in docs] == ["policy"]
+    assert filter_ in store.filters
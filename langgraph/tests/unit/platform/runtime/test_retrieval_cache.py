@@ -0,0 +1,166 @@
+"""Tests for the context_lookup query-result cache."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+from typing import Any
+
+import pytest
+from langchain_core.documents import Document
+from langgraph.store.base import SearchItem
+from langgraph.store.memory import InMemoryStore
+
+from app.platform.runtime.retrieval_cache import (
+    QueryResultCache,
+    bump_namespace_generations,
+    lookup_key,
+    namespace_generation,
+)
+from app.platform.runtime.vector_writes import VectorWriteItem, write_vector_batch
+from app.platform.utils.hashing_embeddings import HashingEmbeddings
+from app.platform.utils.namespace_utils import build_agent_namespace
+
+pytestmark = pytest.mark.platform
+
+# `app.tools` re-exports the tool under the module's name.
+context_lookup_module = importlib.import_module("app.tools.context_lookup")
+
+
+class SearchCountingStore(InMemoryStore):
+    """Counts query searches (the lexical index also lists namespaces without a query)."""
+
+    searches = 0
+
+    def search(self, *args: Any, **kwargs: Any) -> list[SearchItem]:
+        if kwargs.get("query"):
+            self.searches += 1
+        return super().search(*args, **kwargs)
+
+
+STORE = InMemoryStore()
+KEY = lookup_key(STORE, "KPI owners", "problem_framing", 8)
+
+
+def _item(text: str = "KPI owners", changed: int = 1) -> VectorWriteItem:
+    return {
+        "uuid": "doc-1",
+        "title": "KPIs",
+        "text": text,
+        "tags": [],
+        "agents": ["problem_framing"],
+        "changed": changed,
+    }
+
+
+def _counting_store() -> SearchCountingStore:
+    return SearchCountingStore(index={"embed": HashingEmbeddings(dims=64), "dims": 64, "fields": ["text"]})
+
+
+def test_lookup_key_normalizes_case_and_whitespace() -> None:
+    assert lookup_key(STORE, "  kpi   OWNERS ", "problem_framing", 8) == KEY
+
+
+def test_lookup_key_and_generations_are_scoped_to_the_store() -> None:
+    other = InMemoryStore()
+    namespace = ("tests", "retrieval_cache", "scoped")
+
+    bump_namespace_generations(STORE, [namespace])
+
+    assert lookup_key(other, "KPI owners", "problem_framing", 8) != KEY
+    assert namespace_generation(other, namespace) == 0
+
+
+def test_cache_returns_copies_until_generation_changes() -> None:
+    cache = QueryResultCache()
+    cache.set(KEY, [Document(page_content="cached")], generation=1)
+
+    first = cache.get(KEY, generation=1)
+    assert first is not None
+    first[0].page_content = "mutated"
+
+    assert [doc.page_content for doc in cache.get(KEY, generation=1) or []] == ["cached"]
+    assert cache.get(KEY, generation=2) is None
+    assert cache.stats().hits == 2
+    assert cache.stats().misses == 1
+    assert cache.stats().entries == 0
+
+
+def test_cache_expires_entries_after_ttl() -> None:
+    cache = QueryResultCache(ttl_seconds=0)
+    cache.set(KEY, [Document(page_content="cached")], generation=0)
+
+    assert cache.get(KEY, generation=0) is None
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    cache = QueryResultCache(max_entries=1)
+    other = lookup_key(STORE, "risks", "problem_framing", 8)
+    cache.set(KEY, [], generation=0)
+    cache.set(other, [], generation=0)
+
+    assert cache.get(KEY, generation=0) is None
+    assert cache.get(other, generation=0) == []
+    assert cache.stats().evictions == 1
+
+
+def test_bump_namespace_generations_covers_prefixes() -> None:
+    namespace = ("tests", "retrieval_cache", "agent")
+    before = namespace_generation(STORE, namespace[:2])
+
+    bump_namespace_generations(STORE, [namespace, namespace])
+
+    assert namespace_generation(STORE, namespace[:2]) == before + 1
+
+
+def test_context_lookup_serves_repeats_from_cache_until_written(monkeypatch: pytest.MonkeyPatch) -> None:
+    store = _counting_store()
+    monkeypatch.setattr(context_lookup_module, "get_store", lambda: store)
+    cache = QueryResultCache()
+    monkeypatch.setattr(context_lookup_module, "get_lookup_cache", lambda: cache)
+    write_vector_batch([_item()], store=store)
+
+    lookup = context_lookup_module.context_lookup
+    first = lookup.invoke({"query": "KPI owners", "collection": "problem_framing"})
+    second = lookup.invoke({"query": "kpi  owners", "collection": "problem_framing"})
+    write_vector_batch([_item("KPI owners and targets", changed=2)], store=store)
+    third = lookup.invoke({"query": "KPI owners", "collection": "problem_framing"})
+
+    assert store.searches == 2
+    assert first == second
+    assert third[0].page_content == "KPI owners and targets"
+    assert third[0].metadata["store_namespace"] == list(build_agent_namespace("problem_framing"))
+
+
+def test_context_lookup_ainvoke_shares_the_query_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    store = _counting_store()
+    monkeypatch.setattr(context_lookup_module, "get_store", lambda: store)
+    cache = QueryResultCache()
+    monkeypatch.setattr(context_lookup_module, "get_lookup_cache", lambda: cache)
+    write_vector_batch([_item()], store=store)
+
+    lookup = context_lookup_module.context_lookup
+    first = asyncio.run(lookup.ainvoke({"query": "KPI owners", "collection": "problem_framing"}))
+    second = lookup.invoke({"query": "kpi owners", "collection": "problem_framing"})
+
+    assert store.searches == 0
+    assert first == second
+    assert first[0].page_content == "KPI owners"
+
+
+def test_context_lookup_does_not_share_results_across_stores(monkeypatch: pytest.MonkeyPatch) -> None:
+    first_store, second_store = _counting_store(), _counting_store()
+    write_vector_batch([_item()], store=first_store)
+    write_vector_batch([_item("KPI owners per region")], store=second_store)
+    cache = QueryResultCache()
+    monkeypatch.setattr(context_lookup_module, "get_lookup_cache", lambda: cache)
+
+    lookup = context_lookup_module.context_lookup
+    monkeypatch.setattr(context_lookup_module, "get_store", lambda: first_store)
+    first = lookup.invoke({"query": "KPI owners", "collection": "problem_framing"})
+    monkeypatch.setattr(context_lookup_module, "get_store", lambda: second_store)
+    second = lookup.invoke({"query": "KPI owners", "collection": "problem_framing"})
+
+    assert (first_store.searches, second_store.searches) == (1, 1)
+    assert first[0].page_content == "KPI owners"
+    assert second[0].page_content == "KPI owners per region"
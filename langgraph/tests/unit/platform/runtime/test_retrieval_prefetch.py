@@ -0,0 +1,139 @@
+"""Tests for speculative context retrieval prefetch."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+from typing import Any, TypedDict
+
+import pytest
+from langchain_core.documents import Document
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.graph import START, StateGraph
+from langgraph.store.base import BaseStore
+from langgraph.store.memory import InMemoryStore
+
+from app.platform.runtime.retrieval_prefetch import PrefetchKey, RetrievalPrefetcher, prefetch_key
+
+pytestmark = pytest.mark.platform
+
+KEY = prefetch_key("problem_framing", "KPI owners")
+REQUEST = contextvars.ContextVar("request", default="unset")
+
+
+def test_prefetch_key_normalizes_query() -> None:
+    assert prefetch_key("problem_framing", "  kpi   OWNERS ") == KEY
+
+
+class _KeyState(TypedDict):
+    query: str
+
+
+def _key_in_run(store: BaseStore, thread_id: str) -> PrefetchKey:
+    keys: list[PrefetchKey] = []
+
+    def node(state: _KeyState) -> dict[str, Any]:
+        keys.append(prefetch_key("problem_framing", state["query"]))
+        return {}
+
+    builder = StateGraph(_KeyState)
+    builder.add_node("node", node)
+    builder.add_edge(START, "node")
+    config: RunnableConfig = {"configurable": {"thread_id": thread_id}}
+    builder.compile(checkpointer=InMemorySaver(), store=store).invoke({"query": "KPI owners"}, config)
+    return keys[0]
+
+
+def test_prefetch_key_is_scoped_to_the_store_and_thread() -> None:
+    store, other_store = InMemoryStore(), InMemoryStore()
+
+    key = _key_in_run(store, "thread-1")
+
+    assert _key_in_run(store, "thread-1") == key
+    assert _key_in_run(store, "thread-2") != key
+    assert _key_in_run(other_store, "thread-1") != key
+    assert key != KEY
+
+
+def test_take_claims_result_once() -> None:
+    prefetcher = RetrievalPrefetcher()
+    assert prefetcher.start(KEY, lambda: [Document(page_content="KPI owners")])
+
+    docs = prefetcher.take(KEY, timeout=1.0)
+
+    assert [doc.page_content for doc in docs or []] == ["KPI owners"]
+    assert not prefetcher.pending(KEY)
+    assert prefetcher.take(KEY, timeout=0.0) is None
+
+
+def test_start_deduplicates_pending_lookups_and_take_can_time_out() -> None:
+    release = threading.Event()
+    prefetcher = RetrievalPrefetcher()
+
+    def slow_lookup() -> list[Document]:
+        release.wait(1.0)
+        return []
+
+    assert prefetcher.start(KEY, slow_lookup)
+    assert not prefetcher.start(KEY, slow_lookup)
+    assert prefetcher.take(KEY, timeout=0.0) is None
+    assert prefetcher.pending(KEY)
+
+    release.set()
+    assert prefetcher.take(KEY, timeout=1.0) == []
+
+
+def test_atake_times_out_without_cancelling_the_lookup() -> None:
+    release = threading.Event()
+    prefetcher = RetrievalPrefetcher()
+
+    def slow_lookup() -> list[Document]:
+        release.wait(1.0)
+        return [Document(page_content="KPI owners")]
+
+    prefetcher.start(KEY, slow_lookup)
+    assert asyncio.run(prefetcher.atake(KEY, timeout=0.0)) is None
+    assert prefetcher.pending(KEY)
+
+    release.set()
+    docs = asyncio.run(prefetcher.atake(KEY, timeout=1.0))
+    assert [doc.page_content for doc in docs or []] == ["KPI owners"]
+    assert not prefetcher.pending(KEY)
+
+
+def _finished(prefetcher: RetrievalPrefetcher) -> None:
+    """Wait until earlier lookups finished (single worker: a later lookup runs after them)."""
+    drain = prefetch_key("drain", "")
+    prefetcher.start(drain, list)
+    prefetcher.take(drain, timeout=1.0)
+
+
+def test_atake_without_waiting_claims_a_finished_lookup() -> None:
+    prefetcher = RetrievalPrefetcher(max_workers=1)
+    prefetcher.start(KEY, lambda: [Document(page_content="KPI owners")])
+    _finished(prefetcher)
+
+    docs = asyncio.run(prefetcher.atake(KEY, timeout=0.0))
+
+    assert [doc.page_content for doc in docs or []] == ["KPI owners"]
+    assert not prefetcher.pending(KEY)
+
+
+def test_failed_lookup_is_dropped_and_context_is_propagated() -> None:
+    prefetcher = RetrievalPrefetcher()
+
+    def failing() -> list[Document]:
+        raise RuntimeError("store down")
+
+    prefetcher.start(KEY, failing)
+    assert prefetcher.take(KEY, timeout=1.0) is None
+    assert not prefetcher.pending(KEY)
+
+    token = REQUEST.set("thread-1")
+    try:
+        prefetcher.start(KEY, lambda: [Document(page_content=REQUEST.get())])
+    finally:
+        REQUEST.reset(token)
+    assert [doc.page_content for doc in prefetcher.take(KEY, timeout=1.0) or []] == ["thread-1"]
@@ -5,6 +5,7 @@ from decimal import Decimal
 from langchain_core.messages import HumanMessage
 
 from app.platform.runtime import (
+    evidence_fingerprint,
     format_ambiguity_key,
     get_clarified_keys,
     get_current_clarifying_question,
@@ -17,7 +18,7 @@ from app.platform.runtime import (
 )
 from app.schemas.ambiguities import AmbiguityItem
 from app.schemas.clarification import ClarificationResponse
-from app.state import AmbiguityContext, SageState
+from app.state import AmbiguityContext, EvidenceItem, SageState
 
 
 def test_get_latest_user_input_returns_last_human_message() -> None:
@@ -46,6 +47,18 @@ def _build_ambiguity_item(key: list[str], question: str) -> AmbiguityItem:
     )
 
 
+def test_evidence_fingerprint_ignores_order_but_tracks_scores_and_input() -> None:
+    first = EvidenceItem(namespace=["ctx"], key="a", score=0.9)
+    second = EvidenceItem(namespace=["ctx"], key="b", score=0.5)
+
+    fingerprint = evidence_fingerprint("KPI owners", [first, second])
+
+    assert evidence_fingerprint("KPI owners ", [second, first]) == fingerprint
+    assert evidence_fingerprint("KPI owners", [first, second.model_copy(update={"score": 0.6})]) != fingerprint
+    assert evidence_fingerprint("Risk owners", [first, second]) != fingerprint
+    assert evidence_fingerprint("KPI owners", []) != fingerprint
+
+
 def test_reset_clarification_context_clears_state() -> None:
     item = _build_ambiguity_item(
         ["scope", "channels", "coverage"],
@@ -0,0 +1,72 @@
+"""Tests for the persistent ambiguity scan result cache."""
+
+from __future__ import annotations
+
+import pytest
+from pydantic import BaseModel
+
+from app.platform.runtime.scan_cache import (
+    ScanResultCache,
+    agent_cache_version,
+    scan_cache_bypassed,
+    scan_cache_key,
+)
+from app.platform.utils.disk_cache import DiskCache
+
+pytestmark = pytest.mark.platform
+
+
+class Output(BaseModel):
+    ambiguities: list[str] = []
+
+
+def _key(version: str = "v1", phase: str = "problem_framing", fingerprint: str = "f", history: str = "h") -> str:
+    return scan_cache_key(
+        version=version, phase=phase, user_input="reduce churn", fingerprint=fingerprint, history=history
+    )
+
+
+def test_scan_cache_key_normalizes_input_and_separates_inputs() -> None:
+    key = scan_cache_key(
+        version="v1", phase="problem_framing", user_input="Reduce  churn ", fingerprint="f", history="h"
+    )
+
+    assert key == _key()
+    assert key != _key(version="v2")
+    assert key != _key(phase="other")
+    assert key != _key(fingerprint="g")
+    assert key != _key(history="other history")
+
+
+def test_agent_cache_version_is_stable_per_agent() -> None:
+    assert agent_cache_version("ambiguity_scan") == agent_cache_version("ambiguity_scan")
+    assert agent_cache_version("ambiguity_scan") != agent_cache_version("problem_framing")
+
+
+def test_round_trip_and_invalid_entries_miss() -> None:
+    disk_cache = DiskCache(":memory:")
+    scan_cache = ScanResultCache(disk_cache, version="v1")
+    key = scan_cache.key("problem_framing", "Reduce churn", "f", history="h")
+
+    assert scan_cache.get(key, Output) is None
+    scan_cache.set(key, Output(ambiguities=["scope"]))
+    assert scan_cache.get(key, Output) == Output(ambiguities=["scope"])
+
+    disk_cache.set(key, b'{"ambiguities": 1}')
+    assert scan_cache.get(key, Output) is None
+    assert scan_cache.stats().hits == 2
+
+
+def test_least_recently_used_results_are_evicted() -> None:
+    scan_cache = ScanResultCache(DiskCache(":memory:", max_entries=1), version="v1")
+    scan_cache.set("a", Output())
+    scan_cache.set("b", Output())
+
+    assert scan_cache.get("a", Output) is None
+    assert scan_cache.stats().evictions == 1
+
+
+def test_bypass_flag_reads_runtime_context() -> None:
+    assert scan_cache_bypassed({"bypass_scan_cache": True})
+    assert not scan_cache_bypassed({})
+    assert not scan_cache_bypassed(None)
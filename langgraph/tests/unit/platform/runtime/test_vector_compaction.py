@@ -0,0 +1,115 @@
+"""Tests for tombstones and namespace compaction in the vector write path."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from langgraph.store.memory import InMemoryStore
+
+from app.platform.runtime.vector_compaction import list_agent_namespaces
+from app.platform.runtime.vector_ingest import ingest_vector_items
+from app.platform.runtime.vector_writes import awrite_vector_batch, write_vector_batch
+from app.platform.utils.chunking import ChunkingConfig
+from app.platform.utils.namespace_utils import build_agent_namespace
+from app.state.write_state import VectorWriteItem
+
+pytestmark = pytest.mark.platform
+
+AGENTS = ["problem_framing", "ambiguity_scan", "ambiguity_clarification"]
+
+
+def _item(agents: list[str], *, changed: int = 1, deleted: bool = False, uuid: str = "doc-1") -> VectorWriteItem:
+    item: VectorWriteItem = {
+        "uuid": uuid,
+        "title": "Doc",
+        "text": "First sentence. Second sentence.",
+        "tags": [],
+        "agents": agents,
+        "changed": changed,
+    }
+    if deleted:
+        item["deleted"] = True
+    return item
+
+
+def _keys(store: InMemoryStore, agent: str) -> list[str]:
+    return [item.key for item in store.search(build_agent_namespace(agent))]
+
+
+def test_tombstone_purges_item_from_every_namespace() -> None:
+    store = InMemoryStore()
+    write_vector_batch([_item(AGENTS)], store=store)
+
+    report = write_vector_batch([_item([], deleted=True)], store=store)
+
+    assert report.deleted == 3
+    assert all(_keys(store, agent) == [] for agent in AGENTS)
+
+
+def test_tombstone_purges_every_chunk() -> None:
+    store = InMemoryStore()
+    chunking = ChunkingConfig(size=20, overlap=0)
+    write_vector_batch([_item(AGENTS[:1])], store=store, chunking=chunking)
+    assert _keys(store, AGENTS[0]) == ["doc-1#0", "doc-1#1"]
+
+    write_vector_batch([_item(AGENTS[:1], deleted=True)], store=store, chunking=chunking)
+
+    assert _keys(store, AGENTS[0]) == []
+
+
+def test_shrinking_agents_purges_orphaned_namespaces() -> None:
+    store = InMemoryStore()
+    write_vector_batch([_item(AGENTS)], store=store)
+
+    report = write_vector_batch([_item(AGENTS[:1], changed=2)], store=store)
+
+    assert (report.written, report.deleted) == (1, 2)
+    assert _keys(store, AGENTS[0]) == ["doc-1"]
+    assert _keys(store, AGENTS[1]) == _keys(store, AGENTS[2]) == []
+
+
+def test_compaction_can_be_disabled() -> None:
+    store = InMemoryStore()
+    write_vector_batch([_item(AGENTS)], store=store)
+
+    write_vector_batch([_item(AGENTS[:1], changed=2)], store=store, compact=False)
+
+    assert _keys(store, AGENTS[1]) == ["doc-1"]
+
+
+def test_async_tombstone_purges_item() -> None:
+    store = InMemoryStore()
+    asyncio.run(awrite_vector_batch([_item(AGENTS[:2])], store=store))
+
+    report = asyncio.run(awrite_vector_batch([_item(AGENTS[:2], deleted=True)], store=store))
+
+    assert report.deleted == 2
+    assert _keys(store, AGENTS[1]) == []
+
+
+def test_list_agent_namespaces_reads_every_page(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("app.platform.runtime.vector_compaction.NAMESPACE_PAGE_SIZE", 2)
+    store = InMemoryStore()
+    write_vector_batch([_item(AGENTS)], store=store)
+
+    assert sorted(list_agent_namespaces(store)) == sorted(build_agent_namespace(agent) for agent in AGENTS)
+
+
+def test_ingest_lists_namespaces_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    store = InMemoryStore()
+    write_vector_batch([_item(AGENTS)], store=store)
+    calls: list[InMemoryStore] = []
+
+    def counting_list(target: InMemoryStore) -> list[tuple[str, ...]]:
+        calls.append(target)
+        return list_agent_namespaces(target)
+
+    monkeypatch.setattr("app.platform.runtime.vector_ingest.list_agent_namespaces", counting_list)
+    monkeypatch.setattr("app.platform.runtime.vector_writes.list_agent_namespaces", counting_list)
+    items = [_item(AGENTS[:1], changed=2), *(_item(AGENTS, uuid=f"doc-{index}") for index in range(2, 5))]
+
+    ingest_vector_items(items, store=store, window_size=1)
+
+    assert len(calls) == 1
+    assert _keys(store, AGENTS[1]) == ["doc-2", "doc-3", "doc-4"]
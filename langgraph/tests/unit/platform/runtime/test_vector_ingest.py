@@ -0,0 +1,84 @@
+"""Tests for streaming vector ingest."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import AsyncIterator, Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from langgraph.store.memory import InMemoryStore
+
+from app.platform.runtime.vector_ingest import aingest_vector_items, ingest_vector_items, iter_ndjson_items
+from app.platform.utils.namespace_utils import build_agent_namespace
+from app.state.write_state import VectorWriteItem
+
+pytestmark = pytest.mark.platform
+
+
+def _item(index: int) -> VectorWriteItem:
+    return {
+        "uuid": f"doc-{index}",
+        "title": f"Doc {index}",
+        "text": f"Body {index}",
+        "tags": [],
+        "agents": ["problem_framing"],
+        "changed": 1,
+    }
+
+
+def test_ingest_vector_items_pulls_bounded_windows() -> None:
+    store = InMemoryStore()
+    pulled: list[int] = []
+    events: list[dict[str, Any]] = []
+
+    def source() -> Iterator[VectorWriteItem]:
+        for index in range(5):
+            pulled.append(index)
+            yield _item(index)
+
+    def on_progress(update: dict[str, Any]) -> None:
+        # Each window is written before more items are pulled from the source.
+        events.append(update)
+        assert len(pulled) <= 2 * len(events)
+
+    report = ingest_vector_items(source(), store=store, window_size=2, on_progress=on_progress)
+
+    assert report.written == 5
+    assert report.chunks == ()
+    assert [update["events"][0].data["items"] for update in events] == [2, 2, 1]
+    assert events[-1]["events"][0].kind == "progress"
+    assert events[-1]["events"][0].data["total_written"] == 5
+
+
+def test_iter_ndjson_items_streams_file(tmp_path: Path) -> None:
+    path = tmp_path / "items.ndjson"
+    path.write_text("\n".join(json.dumps(_item(index)) for index in range(3)) + "\n\n", encoding="utf-8")
+    store = InMemoryStore()
+
+    report = ingest_vector_items(iter_ndjson_items(path), store=store, window_size=2)
+
+    assert report.written == 3
+    assert store.get(build_agent_namespace("problem_framing"), "doc-2") is not None
+
+
+def test_iter_ndjson_items_reports_line_of_invalid_json(tmp_path: Path) -> None:
+    path = tmp_path / "items.ndjson"
+    path.write_text(json.dumps(_item(0)) + "\n[1, 2]\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match=r"items\.ndjson:2: expected a JSON object"):
+        list(iter_ndjson_items(path))
+
+
+def test_aingest_vector_items_accepts_async_iterators() -> None:
+    store = InMemoryStore()
+
+    async def source() -> AsyncIterator[VectorWriteItem]:
+        for index in range(3):
+            yield _item(index)
+
+    report = asyncio.run(aingest_vector_items(source(), store=store, window_size=2))
+
+    assert (report.requested, report.written) == (3, 3)
@@ -0,0 +1,63 @@
+"""Tests for the delta-sync vector manifest."""
+
+from __future__ import annotations
+
+import pytest
+from langgraph.store.memory import InMemoryStore
+
+from app.platform.runtime.vector_manifest import build_vector_manifest
+from app.platform.runtime.vector_write_plan import content_hash
+from app.platform.runtime.vector_writes import write_vector_batch
+from app.platform.utils.chunking import ChunkingConfig
+from app.platform.utils.namespace_utils import build_agent_namespace
+from app.state.write_state import VectorWriteItem
+
+pytestmark = pytest.mark.platform
+
+
+def _put(store: InMemoryStore, agent: str, uuid: str, *, text: str, changed: int) -> None:
+    store.put(build_agent_namespace(agent), uuid, {"text": text, "changed": changed}, index=False)
+
+
+def test_build_vector_manifest_lists_items_across_pages() -> None:
+    store = InMemoryStore()
+    for index in range(5):
+        _put(store, "problem_framing", f"doc-{index}", text=f"Body {index}", changed=index)
+
+    manifest = build_vector_manifest(store=store, page_size=2)
+
+    assert [entry.uuid for entry in manifest] == [f"doc-{index}" for index in range(5)]
+    assert manifest[3].changed == 3
+    assert manifest[3].content_hash == content_hash("Body 3")
+
+
+def test_build_vector_manifest_reports_oldest_namespace_copy() -> None:
+    store = InMemoryStore()
+    _put(store, "problem_framing", "doc-1", text="New", changed=20)
+    _put(store, "ambiguity_scan", "doc-1", text="Old", changed=10)
+
+    (entry,) = build_vector_manifest(store=store)
+
+    assert (entry.changed, entry.content_hash) == (10, content_hash("Old"))
+
+
+def test_build_vector_manifest_scopes_to_namespace_prefix() -> None:
+    store = InMemoryStore()
+    _put(store, "problem_framing", "doc-1", text="Body", changed=1)
+    _put(store, "ambiguity_scan", "doc-2", text="Body", changed=1)
+
+    manifest = build_vector_manifest(list(build_agent_namespace("ambiguity_scan")), store=store)
+
+    assert [entry.uuid for entry in manifest] == ["doc-2"]
+
+
+def test_build_vector_manifest_collapses_chunk_records() -> None:
+    store = InMemoryStore()
+    item = VectorWriteItem(
+        uuid="doc-1", title="", text="One. Two. Three.", tags=[], agents=["problem_framing"], changed=5
+    )
+    write_vector_batch([item], store=store, chunking=ChunkingConfig(size=5, overlap=0))
+
+    (entry,) = build_vector_manifest(store=store)
+
+    assert (entry.uuid, entry.changed, entry.content_hash) == ("doc-1", 5, content_hash("One. Two. Three."))
@@ -0,0 +1,148 @@
+"""Tests for concurrent vector writes."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+from langchain_core.embeddings import Embeddings
+from langgraph.store.memory import InMemoryStore
+
+from app.platform.runtime import vector_write_pool
+from app.platform.runtime.vector_write_pool import awrite_vector_items
+from app.platform.utils.namespace_utils import build_agent_namespace
+from app.state.write_state import VectorWriteItem
+
+pytestmark = pytest.mark.platform
+
+_real_sleep = asyncio.sleep
+
+
+def _item(uuid: str) -> VectorWriteItem:
+    return {
+        "uuid": uuid,
+        "title": uuid,
+        "text": f"Body {uuid}",
+        "tags": [],
+        "agents": ["problem_framing"],
+        "changed": 1,
+    }
+
+
+class CountingEmbeddings(Embeddings):
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        return [[float(len(text)), 1.0] for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return self.embed_documents([text])[0]
+
+
+class FlakyStore(InMemoryStore):
+    """InMemoryStore whose puts fail a set number of times and track concurrency."""
+
+    def __init__(self, *, failures: int = 0, fail_key: str | None = None) -> None:
+        super().__init__()
+        self.failures = failures
+        self.fail_key = fail_key
+        self.in_flight = 0
+        self.peak = 0
+
+    async def abatch(self, ops: Any) -> list[Any]:
+        ops = list(ops)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await _real_sleep(0.01)
+            is_put = any(getattr(op, "value", None) is not None for op in ops)
+            if is_put and any(op.key == self.fail_key for op in ops) and self.failures:
+                self.failures -= 1
+                raise ConnectionError("embedder unavailable")
+            return await super().abatch(ops)
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture(autouse=True)
+def _no_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def _sleep(_delay: float) -> None:
+        return None
+
+    monkeypatch.setattr(vector_write_pool.asyncio, "sleep", _sleep)
+
+
+def test_awrite_vector_items_bounds_concurrency() -> None:
+    store = FlakyStore()
+
+    report = asyncio.run(
+        awrite_vector_items([_item(f"doc-{i}") for i in range(6)], store=store, concurrency=2, chunk_size=1)
+    )
+
+    assert report.written == 6
+    assert len(report.chunks) == 6
+    assert store.peak <= 2
+
+
+def test_awrite_vector_items_embeds_across_items_in_one_call() -> None:
+    embeddings = CountingEmbeddings()
+    store = InMemoryStore(index={"embed": embeddings, "dims": 2, "fields": ["text"]})
+
+    report = asyncio.run(awrite_vector_items([_item(f"doc-{i}") for i in range(4)], store=store))
+
+    assert report.written == 4
+    assert embeddings.calls == [[f"Body doc-{i}" for i in range(4)]]
+
+
+def test_awrite_vector_items_retries_transient_failures() -> None:
+    store = FlakyStore(failures=2, fail_key="doc-1")
+
+    report = asyncio.run(awrite_vector_items([_item("doc-1")], store=store, max_attempts=3))
+
+    assert (report.written, report.failed) == (1, ())
+    assert store.get(build_agent_namespace("problem_framing"), "doc-1") is not None
+
+
+def test_awrite_vector_items_backs_off_without_holding_a_slot(monkeypatch: pytest.MonkeyPatch) -> None:
+    store = FlakyStore(failures=1, fail_key="doc-1")
+
+    async def _sleep_until_doc_2_written(_delay: float) -> None:
+        # With the slot held during backoff, doc-2 could never be written here.
+        for _ in range(100):
+            if store.get(build_agent_namespace("problem_framing"), "doc-2") is not None:
+                return
+            await _real_sleep(0.005)
+        raise AssertionError("backoff held the semaphore")
+
+    monkeypatch.setattr(vector_write_pool.asyncio, "sleep", _sleep_until_doc_2_written)
+    items = [_item("doc-1"), _item("doc-2")]
+
+    report = asyncio.run(awrite_vector_items(items, store=store, concurrency=1, chunk_size=1))
+
+    assert (report.written, report.failed) == (2, ())
+
+
+def test_awrite_vector_items_reports_failures_without_aborting() -> None:
+    store = FlakyStore(failures=5, fail_key="doc-1")
+    items = [_item("doc-1"), _item("doc-2"), _item("")]
+
+    report = asyncio.run(awrite_vector_items(items, store=store, max_attempts=2, chunk_size=1))
+
+    assert report.written == 1
+    assert [(failure.uuid, failure.attempts) for failure in report.failed] == [("", 1), ("doc-1", 2)]
+    assert report.failed[1].error.startswith("ConnectionError")
+
+
+def test_awrite_vector_items_falls_back_to_single_items_for_a_failed_chunk() -> None:
+    store = FlakyStore(failures=5, fail_key="doc-2")
+    items = [_item(f"doc-{i}") for i in range(4)]
+
+    report = asyncio.run(awrite_vector_items(items, store=store, max_attempts=2, chunk_size=4))
+
+    assert report.written == 3
+    assert [(failure.uuid, failure.attempts) for failure in report.failed] == [("doc-2", 3)]
+    assert store.get(build_agent_namespace("problem_framing"), "doc-1") is not None
+    assert store.get(build_agent_namespace("problem_framing"), "doc-2") is None
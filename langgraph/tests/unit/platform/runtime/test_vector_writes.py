@@ -0,0 +1,142 @@
+"""Tests for the batched vector write engine."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from langchain_core.embeddings import Embeddings
+from langgraph.store.memory import InMemoryStore
+
+from app.platform.runtime.vector_writes import awrite_vector_batch, write_vector_batch
+from app.platform.utils.chunking import ChunkingConfig
+from app.platform.utils.embeddings import SharedEmbeddings
+from app.platform.utils.namespace_utils import build_agent_namespace
+from app.state.write_state import VectorWriteItem
+
+pytestmark = pytest.mark.platform
+
+
+class CountingEmbeddings(Embeddings):
+    def __init__(self) -> None:
+        self.embedded_texts: list[str] = []
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.embedded_texts.extend(texts)
+        return [[float(len(text)), 1.0] for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return self.embed_documents([text])[0]
+
+
+def _build_store() -> tuple[InMemoryStore, CountingEmbeddings]:
+    counting = CountingEmbeddings()
+    store = InMemoryStore(index={"embed": SharedEmbeddings(counting), "dims": 2, "fields": ["text"]})
+    return store, counting
+
+
+def _item(uuid: str, agents: list[str], *, text: str = "Body", changed: int = 10) -> VectorWriteItem:
+    return {"uuid": uuid, "title": uuid, "text": text, "tags": [], "agents": agents, "changed": changed}
+
+
+def test_write_vector_batch_embeds_once_for_all_agents():
+    store, counting = _build_store()
+    agents = ["problem_framing", "ambiguity_scan", "ambiguity_clarification"]
+
+    report = write_vector_batch([_item("doc-1", agents, text="Shared context body")], store=store)
+
+    assert report.written == 3
+    assert counting.embedded_texts == ["Shared context body"]
+    for agent in agents:
+        stored = store.get(build_agent_namespace(agent), "doc-1")
+        assert stored is not None
+        assert stored.value["text"] == "Shared context body"
+
+
+def test_write_vector_batch_skips_unchanged_records():
+    store, _counting = _build_store()
+    write_vector_batch([_item("doc-1", ["problem_framing"])], store=store)
+
+    report = write_vector_batch(
+        [_item("doc-1", ["problem_framing", "ambiguity_scan"]), _item("doc-2", ["problem_framing"], text="Other")],
+        store=store,
+    )
+
+    assert (report.requested, report.written, report.skipped) == (3, 2, 1)
+    assert store.get(build_agent_namespace("ambiguity_scan"), "doc-1") is not None
+
+
+def test_write_vector_batch_reports_chunk_timings():
+    store, _counting = _build_store()
+    items = [_item(f"doc-{index}", ["problem_framing"], text=f"Body {index}") for index in range(5)]
+
+    report = write_vector_batch(items, store=store, chunk_size=2)
+
+    assert [chunk.ops for chunk in report.chunks] == [2, 2, 1]
+    assert [chunk.index for chunk in report.chunks] == [0, 1, 2]
+    assert all(chunk.seconds >= 0 for chunk in report.chunks)
+
+
+def test_write_vector_batch_requires_uuid():
+    store, _counting = _build_store()
+
+    with pytest.raises(ValueError, match="uuid is required"):
+        write_vector_batch([_item("", ["problem_framing"])], store=store)
+
+
+def test_awrite_vector_batch_writes_all_namespaces():
+    store, counting = _build_store()
+    agents = ["problem_framing", "ambiguity_scan"]
+
+    report = asyncio.run(awrite_vector_batch([_item("doc-1", agents)], store=store))
+
+    assert report.written == 2
+    assert counting.embedded_texts == ["Body"]
+    assert store.get(build_agent_namespace("ambiguity_scan"), "doc-1") is not None
+
+
+def test_write_vector_batch_stores_chunks_and_drops_stale_ones():
+    store, _counting = _build_store()
+    chunking = ChunkingConfig(size=20, overlap=0)
+    namespace = build_agent_namespace("problem_framing")
+    long_text = "First sentence. Second sentence. Third sentence."
+
+    report = write_vector_batch([_item("doc-1", ["problem_framing"], text=long_text)], store=store, chunking=chunking)
+
+    assert report.written == 3
+    stored = store.get(namespace, "doc-1#1")
+    assert stored is not None
+    assert (stored.value["text"], stored.value["uuid"], stored.value["chunk_count"]) == ("Second sentence.", "doc-1", 3)
+
+    report = write_vector_batch(
+        [_item("doc-1", ["problem_framing"], text="Now short.", changed=11)], store=store, chunking=chunking
+    )
+
+    assert (report.written, report.deleted) == (1, 2)
+    assert [item.key for item in store.search(namespace)] == ["doc-1#0"]
+
+
+def test_write_vector_batch_replaces_unchunked_record_with_chunks():
+    store, _counting = _build_store()
+    namespace = build_agent_namespace("problem_framing")
+    write_vector_batch([_item("doc-1", ["problem_framing"])], store=store)
+
+    write_vector_batch(
+        [_item("doc-1", ["problem_framing"], changed=11)], store=store, chunking=ChunkingConfig(size=20, overlap=0)
+    )
+
+    assert [item.key for item in store.search(namespace)] == ["doc-1#0"]
+
+
+def test_write_vector_batch_replaces_chunks_with_unchunked_record() -> None:
+    store, _counting = _build_store()
+    namespace = build_agent_namespace("problem_framing")
+    long_text = "First sentence. Second sentence. Third sentence."
+    write_vector_batch(
+        [_item("doc-1", ["problem_framing"], text=long_text)], store=store, chunking=ChunkingConfig(size=20, overlap=0)
+    )
+
+    report = write_vector_batch([_item("doc-1", ["problem_framing"], text=long_text, changed=11)], store=store)
+
+    assert (report.written, report.deleted) == (1, 3)
+    assert [item.key for item in store.search(namespace)] == ["doc-1"]
@@ -0,0 +1,64 @@
+"""Tests for the build-once cache."""
+
+from __future__ import annotations
+
+import pytest
+from langchain_core.messages import HumanMessage
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.graph import START, StateGraph
+
+from app import main
+from app.platform.utils.build_cache import BuildCache
+from app.state import SageState
+
+pytestmark = pytest.mark.platform
+
+
+def test_build_cache_rebuilds_only_when_signature_changes() -> None:
+    signature = ["v1"]
+    invalidated: list[str] = []
+    cache = BuildCache(
+        lambda: object(),
+        signature=lambda: signature[0],
+        on_invalidate=lambda: invalidated.append(signature[0]),
+    )
+
+    first = cache.get()
+    assert cache.get() is first
+    assert invalidated == []
+
+    signature[0] = "v2"
+    second = cache.get()
+
+    assert second is not first
+    assert cache.get() is second
+    assert cache.builds == 2
+    assert invalidated == ["v2"]
+
+
+def test_clear_forces_rebuild() -> None:
+    invalidated: list[bool] = []
+    cache = BuildCache(lambda: object(), signature=lambda: "v1", on_invalidate=lambda: invalidated.append(True))
+    first = cache.get()
+
+    cache.clear()
+
+    assert cache.get() is not first
+    assert invalidated == [True]
+
+
+def test_cached_app_copies_keep_separate_checkpoints(monkeypatch: pytest.MonkeyPatch) -> None:
+    builder = StateGraph(SageState)
+    builder.add_node("noop", lambda _state: {})
+    builder.add_edge(START, "noop")
+    compiled = builder.compile(checkpointer=InMemorySaver())
+    monkeypatch.setattr(main, "_app_cache", BuildCache(lambda: compiled, signature=lambda: "v1"))
+    monkeypatch.setenv(main.GRAPH_CACHE_ENV, "1")
+    config: RunnableConfig = {"configurable": {"thread_id": "t-1"}}
+
+    first, second = main.get_app(), main.get_app()
+    first.invoke(SageState(messages=[HumanMessage(content="Reduce churn")]), config)
+
+    assert first.get_state(config).values["messages"]
+    assert not second.get_state(config).values
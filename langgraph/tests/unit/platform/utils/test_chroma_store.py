@@ -0,0 +1,225 @@
+"""Tests for the Chroma-backed local Store adapter."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import chromadb
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from app import main
+from app.platform.config import file_loader
+from app.platform.runtime.evidence import hydrate_evidence_docs
+from app.platform.runtime.vector_writes import write_vector_batch
+from app.platform.utils.chroma_store import ChromaStore, get_configured_store
+from app.platform.utils.chunking import ChunkingConfig
+from app.platform.utils.embeddings import EMBEDDING_MODEL_ENV, get_store_embeddings
+from app.platform.utils.hashing_embeddings import HASHING_EMBEDDING_MODEL
+from app.platform.utils.namespace_utils import build_agent_namespace
+from app.state.write_state import VectorWriteItem
+
+pytestmark = pytest.mark.platform
+
+NAMESPACE = build_agent_namespace("problem_framing")
+VOCABULARY = ("alpha", "bravo", "charlie")
+
+
+class KeywordEmbeddings(Embeddings):
+    """Embeds texts as keyword counts so similarity is predictable."""
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [[float(text.lower().count(word)) + 0.01 for word in VOCABULARY] for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return self.embed_documents([text])[0]
+
+
+def _store(path: Path) -> ChromaStore:
+    return ChromaStore(path, index={"embed": KeywordEmbeddings(), "dims": 3, "fields": ["text"]})
+
+
+def _item(uuid: str, text: str, *, changed: int = 1, tags: list[str] | None = None) -> VectorWriteItem:
+    return VectorWriteItem(
+        uuid=uuid, title=uuid, text=text, tags=tags or ["t"], agents=["problem_framing"], changed=changed
+    )
+
+
+def test_put_get_and_delete_round_trip(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    store.put(NAMESPACE, "doc-1", {"text": "alpha", "changed": 1})
+
+    item = store.get(NAMESPACE, "doc-1")
+
+    assert item is not None
+    assert item.namespace == NAMESPACE
+    assert item.value == {"text": "alpha", "changed": 1}
+    store.delete(NAMESPACE, "doc-1")
+    assert store.get(NAMESPACE, "doc-1") is None
+
+
+def test_items_persist_across_instances(tmp_path: Path) -> None:
+    _store(tmp_path).put(NAMESPACE, "doc-1", {"text": "alpha"})
+
+    item = _store(tmp_path).get(NAMESPACE, "doc-1")
+
+    assert item is not None
+    assert item.value["text"] == "alpha"
+
+
+def test_search_ranks_by_similarity_within_namespace_prefix(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    store.put(NAMESPACE, "alpha", {"text": "alpha alpha"})
+    store.put(NAMESPACE, "bravo", {"text": "bravo bravo"})
+    store.put(build_agent_namespace("ambiguity_scan"), "other", {"text": "alpha alpha"})
+
+    results = store.search(NAMESPACE, query="alpha", limit=2)
+
+    assert [item.key for item in results] == ["alpha", "bravo"]
+    assert results[0].score is not None
+    assert results[1].score is not None
+    assert results[0].score > results[1].score
+
+
+def test_search_applies_pushed_down_and_residual_filters(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    store.put(NAMESPACE, "old", {"text": "alpha", "changed": 1, "tags": ["a"]})
+    store.put(NAMESPACE, "new", {"text": "alpha", "changed": 5, "tags": ["b"]})
+
+    by_range = store.search(NAMESPACE, query="alpha", filter={"changed": {"$gte": 3}})
+    by_list = store.search(NAMESPACE, filter={"tags": ["a"]})
+    by_ne = store.search(NAMESPACE, query="alpha", filter={"changed": {"$ne": 5}})
+
+    assert [item.key for item in by_range] == ["new"]
+    assert [item.key for item in by_list] == ["old"]
+    assert [item.key for item in by_ne] == ["old"]
+
+
+def test_list_namespaces_honours_prefix_and_depth(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    store.put(NAMESPACE, "doc-1", {"text": "alpha"})
+    store.put(build_agent_namespace("ambiguity_scan"), "doc-1", {"text": "alpha"})
+
+    assert store.list_namespaces(prefix=("drupal", "context")) == [
+        build_agent_namespace("ambiguity_scan"),
+        NAMESPACE,
+    ]
+    assert store.list_namespaces(max_depth=2) == [("drupal", "context")]
+
+
+def test_list_namespaces_reads_the_registry_not_the_items(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    store = _store(tmp_path)
+    store.put(NAMESPACE, "doc-1", {"text": "alpha"})
+    store.put(build_agent_namespace("ambiguity_scan"), "doc-1", {"text": "alpha"})
+    store.delete(build_agent_namespace("ambiguity_scan"), "doc-1")
+
+    def no_scan(**_kwargs: object) -> None:
+        raise AssertionError("listing namespaces scanned the item collection")
+
+    monkeypatch.setattr(store._collection, "get", no_scan)
+
+    assert store.list_namespaces() == [NAMESPACE]
+
+
+def test_registry_is_backfilled_for_existing_collections(tmp_path: Path) -> None:
+    _store(tmp_path).put(NAMESPACE, "doc-1", {"text": "alpha"})
+    chromadb.PersistentClient(path=str(tmp_path)).delete_collection("sagecompass_store_namespaces")
+
+    assert _store(tmp_path).list_namespaces() == [NAMESPACE]
+
+
+def test_vector_writer_and_hydration_run_unchanged(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    text = "Alpha one. Bravo two. Charlie three."
+    write_vector_batch([_item("doc-1", text)], store=store, chunking=ChunkingConfig(size=12, overlap=0))
+
+    hits = store.search(NAMESPACE, query="charlie")
+    docs = hydrate_evidence_docs(
+        [{"namespace": list(NAMESPACE), "key": hits[0].key, "score": hits[0].score}],
+        phase="problem_framing",
+        store=store,
+        stitch_neighbors=2,
+    )
+
+    assert hits[0].key == "doc-1#2"
+    assert docs[0].page_content == text
+    skipped = write_vector_batch([_item("doc-1", text)], store=store, chunking=ChunkingConfig(size=12, overlap=0))
+    assert skipped.written == 0
+
+
+def test_async_batch_matches_sync_results(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+
+    async def run() -> list[str]:
+        await store.aput(NAMESPACE, "doc-1", {"text": "bravo"})
+        return [item.key for item in await store.asearch(NAMESPACE, query="bravo")]
+
+    assert asyncio.run(run()) == ["doc-1"]
+
+
+def test_search_pushes_down_tag_index_filters(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    write_vector_batch([_item("doc-1", "alpha", tags=["gdpr"]), _item("doc-2", "alpha bravo")], store=store)
+
+    tagged = store.search(NAMESPACE, query="alpha", filter={"tag_index": {"gdpr": True}})
+    untagged = store.search(NAMESPACE, query="alpha", filter={"tag_index": {"gdpr": {"$ne": True}}})
+
+    assert [item.key for item in tagged] == ["doc-1"]
+    assert [item.key for item in untagged] == ["doc-2"]
+
+
+def test_residual_filters_read_bounded_candidate_pages(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    store = _store(tmp_path)
+    for index in range(20):
+        store.put(NAMESPACE, f"doc-{index}", {"text": "alpha", "changed": index})
+    collection = store._collection
+    requested: list[int] = []
+    query, get = collection.query, collection.get
+
+    def counting_query(**kwargs: Any) -> Any:
+        requested.append(kwargs["n_results"])
+        return query(**kwargs)
+
+    def counting_get(**kwargs: Any) -> Any:
+        if kwargs.get("where") is not None:
+            requested.append(kwargs["limit"])
+        return get(**kwargs)
+
+    monkeypatch.setattr(collection, "query", counting_query)
+    monkeypatch.setattr(collection, "get", counting_get)
+
+    ranked = store.search(NAMESPACE, query="alpha", filter={"changed": {"$ne": 0}}, limit=2)
+    listed = store.search(NAMESPACE, filter={"changed": {"$ne": 0}}, limit=2)
+
+    assert len(ranked) == len(listed) == 2
+    assert all(item.value["changed"] != 0 for item in [*ranked, *listed])
+    assert requested == [8, 8]
+
+
+@pytest.mark.parametrize("reload_inputs", [main._reload_app_inputs, main._reload_vector_write_inputs])
+def test_reload_hooks_open_a_new_store_for_an_edited_store_config(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, reload_inputs: Any
+) -> None:
+    config = tmp_path / "embeddings.yaml"
+    config.write_text(f"dims: 8\nstore: {{backend: chroma, path: '{tmp_path / 'a'}'}}\n")
+    monkeypatch.setattr(file_loader, "CONFIG_DIR", tmp_path)
+    monkeypatch.setenv(EMBEDDING_MODEL_ENV, HASHING_EMBEDDING_MODEL)
+    reload_inputs()
+    try:
+        before, embedder = get_configured_store(), get_store_embeddings()
+        config.write_text(f"dims: 16\nstore: {{backend: chroma, path: '{tmp_path / 'b'}'}}\n")
+        reload_inputs()
+        after = get_configured_store()
+
+        assert isinstance(before, ChromaStore)
+        assert isinstance(after, ChromaStore)
+        assert after is not before
+        assert after._dims == 16
+        assert get_store_embeddings() is not embedder
+        assert len(get_store_embeddings().embed_query("alpha")) == 16
+    finally:
+        get_configured_store.cache_clear()
+        get_store_embeddings.cache_clear()
+        file_loader.FileLoader.clear_cache()
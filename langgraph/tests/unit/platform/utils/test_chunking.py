@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import pytest
+
+from app.platform.utils.chunking import chunk_key, parse_chunk_key, split_text
+
+pytestmark = pytest.mark.platform
+
+TEXT = "First sentence here. Second one follows. Third is a bit longer than that. Fourth ends it."
+
+
+def test_split_text_keeps_short_text_whole() -> None:
+    chunks = split_text("Short text.", size=100, overlap=10)
+
+    assert [(chunk.index, chunk.start, chunk.text) for chunk in chunks] == [(0, 0, "Short text.")]
+
+
+def test_split_text_cuts_on_sentence_boundaries_with_overlap() -> None:
+    chunks = split_text(TEXT, size=60, overlap=30)
+
+    assert [chunk.text for chunk in chunks] == [
+        "First sentence here. Second one follows.",
+        "Second one follows. Third is a bit longer than that.",
+        "Fourth ends it.",
+    ]
+    assert all(TEXT[chunk.start : chunk.start + len(chunk.text)] == chunk.text for chunk in chunks)
+
+
+def test_split_text_hard_splits_without_sentence_awareness() -> None:
+    chunks = split_text("abcdefghij", size=4, overlap=1, sentence_aware=False)
+
+    assert [chunk.text for chunk in chunks] == ["abcd", "defg", "ghij"]
+    assert [chunk.start for chunk in chunks] == [0, 3, 6]
+
+
+def test_chunk_keys_round_trip() -> None:
+    assert chunk_key("doc-1", 3) == "doc-1#3"
+    assert parse_chunk_key("doc-1#3") == ("doc-1", 3)
+    assert parse_chunk_key("doc-1") == ("doc-1", None)
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from app.platform.utils.disk_cache import DiskCache
+
+pytestmark = pytest.mark.platform
+
+
+def test_disk_cache_persists_across_instances(tmp_path: Path) -> None:
+    path = tmp_path / "cache.sqlite3"
+    DiskCache(path).set("key", b"value")
+
+    reopened = DiskCache(path)
+
+    assert reopened.get("key") == b"value"
+
+
+def test_disk_cache_counts_hits_and_misses(tmp_path: Path) -> None:
+    cache = DiskCache(tmp_path / "cache.sqlite3")
+    cache.set_many({"a": b"1", "b": b"2"})
+
+    assert cache.get_many(["a", "b", "c"]) == {"a": b"1", "b": b"2"}
+    stats = cache.stats()
+
+    assert (stats.hits, stats.misses, stats.entries) == (2, 1, 2)
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = iter(range(100))
+    monkeypatch.setattr("app.platform.utils.disk_cache.time.time", lambda: float(next(clock)))
+    cache = DiskCache(tmp_path / "cache.sqlite3", max_entries=2)
+    cache.set("a", b"1")
+    cache.set("b", b"2")
+    cache.get("a")
+
+    cache.set("c", b"3")
+
+    assert cache.get_many(["a", "b", "c"]) == {"a": b"1", "c": b"3"}
+    assert cache.stats().evictions == 1
+
+
+def test_disk_cache_reads_defer_access_time_writes(tmp_path: Path) -> None:
+    path = tmp_path / "cache.sqlite3"
+    cache = DiskCache(path, max_entries=2)
+    cache.set_many({"a": b"1", "b": b"2"})
+    writes = cache._conn.total_changes
+
+    assert cache.get("a") == b"1"
+    assert cache._conn.total_changes == writes
+
+    cache.close()
+    reopened = DiskCache(path, max_entries=2)
+    reopened.set("c", b"3")
+
+    assert reopened.get_many(["a", "b", "c"]) == {"a": b"1", "c": b"3"}
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from app.platform.utils.disk_cache import DiskCache
+from app.platform.utils.embeddings import SharedEmbeddings, embedding_cache_key
+
+pytestmark = pytest.mark.platform
+
+
+class RecordingEmbeddings(Embeddings):
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        return [[float(len(text))] for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return self.embed_documents([text])[0]
+
+
+def test_shared_embeddings_dedupes_texts_within_a_call() -> None:
+    delegate = RecordingEmbeddings()
+    embeddings = SharedEmbeddings(delegate)
+
+    vectors = embeddings.embed_documents(["a", "bb", "a"])
+
+    assert vectors == [[1.0], [2.0], [1.0]]
+    assert delegate.calls == [["a", "bb"]]
+
+
+def test_shared_embeddings_reuses_recent_vectors_across_calls() -> None:
+    delegate = RecordingEmbeddings()
+    embeddings = SharedEmbeddings(delegate)
+
+    embeddings.embed_documents(["text"])
+    embeddings.embed_documents(["text"])
+    asyncio.run(embeddings.aembed_documents(["text"]))
+
+    assert delegate.calls == [["text"]]
+
+
+def test_shared_embeddings_evicts_least_recently_used() -> None:
+    delegate = RecordingEmbeddings()
+    embeddings = SharedEmbeddings(delegate, max_entries=1)
+
+    embeddings.embed_documents(["first"])
+    embeddings.embed_documents(["second"])
+    embeddings.embed_documents(["first"])
+
+    assert delegate.calls == [["first"], ["second"], ["first"]]
+
+
+def test_shared_embeddings_reads_persistent_cache_before_delegate(tmp_path: Path) -> None:
+    path = tmp_path / "embeddings.sqlite3"
+    SharedEmbeddings(RecordingEmbeddings(), cache=DiskCache(path), model="fake", dims=1).embed_documents(["Body  text"])
+
+    delegate = RecordingEmbeddings()
+    embeddings = SharedEmbeddings(delegate, cache=DiskCache(path), model="fake", dims=1)
+    vectors = embeddings.embed_documents(["Body text", "other"])
+
+    assert vectors == [[10.0], [5.0]]
+    assert delegate.calls == [["other"]]
+    stats = embeddings.cache_stats()
+    assert stats is not None
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+def test_shared_embeddings_async_uses_persistent_cache(tmp_path: Path) -> None:
+    path = tmp_path / "embeddings.sqlite3"
+    asyncio.run(SharedEmbeddings(RecordingEmbeddings(), cache=DiskCache(path)).aembed_query("query"))
+
+    delegate = RecordingEmbeddings()
+    vector = asyncio.run(SharedEmbeddings(delegate, cache=DiskCache(path)).aembed_query("query"))
+
+    assert vector == [5.0]
+    assert delegate.calls == []
+
+
+def test_embedding_cache_key_depends_on_model_and_dims() -> None:
+    key = embedding_cache_key("model-a", 1536, "Some  text")
+
+    assert key == embedding_cache_key("model-a", 1536, "Some text\n")
+    assert key != embedding_cache_key("model-b", 1536, "Some text")
+    assert key != embedding_cache_key("model-a", 512, "Some text")
@@ -0,0 +1,67 @@
+"""Tests for the deterministic offline embedder."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+
+import pytest
+from langgraph.store.memory import InMemoryStore
+
+from app.platform.utils import embeddings as embeddings_module
+from app.platform.utils.hashing_embeddings import HASHING_EMBEDDING_MODEL, HashingEmbeddings
+
+pytestmark = pytest.mark.platform
+
+
+def _cosine(left: list[float], right: list[float]) -> float:
+    return sum(a * b for a, b in zip(left, right, strict=True))
+
+
+def test_hashing_embeddings_are_deterministic_and_normalized() -> None:
+    embeddings = HashingEmbeddings(dims=64)
+
+    first = embeddings.embed_query("Data governance policy")
+    second = HashingEmbeddings(dims=64).embed_documents(["data  GOVERNANCE policy"])[0]
+
+    assert first == second
+    assert len(first) == 64
+    assert math.isclose(math.sqrt(sum(value * value for value in first)), 1.0)
+
+
+def test_hashing_embeddings_rank_shared_vocabulary_higher() -> None:
+    embeddings = HashingEmbeddings(dims=256)
+    query = embeddings.embed_query("retention policy for customer data")
+
+    related, unrelated = embeddings.embed_documents(["Customer data retention policy.", "Quarterly sales targets."])
+
+    assert _cosine(query, related) > _cosine(query, unrelated)
+
+
+def test_hashing_embeddings_give_empty_text_a_unit_vector() -> None:
+    vector = asyncio.run(HashingEmbeddings(dims=8).aembed_query(""))
+
+    assert math.isclose(sum(value * value for value in vector), 1.0)
+
+
+def test_hashing_embeddings_back_store_search() -> None:
+    store = InMemoryStore(index={"embed": HashingEmbeddings(dims=128), "dims": 128, "fields": ["text"]})
+    store.put(("ctx",), "kpi", {"text": "KPI definitions and metric owners"})
+    store.put(("ctx",), "risk", {"text": "Risk register and mitigation plans"})
+
+    results = store.search(("ctx",), query="metric owners", limit=1)
+
+    assert [item.key for item in results] == ["kpi"]
+
+
+def test_store_embeddings_select_hashing_model_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(embeddings_module.EMBEDDING_MODEL_ENV, HASHING_EMBEDDING_MODEL)
+    embeddings_module.get_store_embeddings.cache_clear()
+    try:
+        shared = embeddings_module.get_store_embeddings()
+        vector = shared.embed_query("offline")
+    finally:
+        embeddings_module.get_store_embeddings.cache_clear()
+
+    assert shared.cache_stats() is None
+    assert vector == HashingEmbeddings(dims=len(vector)).embed_query("offline")
@@ -0,0 +1,115 @@
+"""Tests for the persistent LLM response cache."""
+
+from __future__ import annotations
+
+import json
+from itertools import cycle
+
+import pytest
+from langchain.agents.middleware import ModelRequest, ModelResponse
+from langchain.agents.structured_output import ToolStrategy
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.load import dumps
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from pydantic import BaseModel
+
+from app.middlewares.llm_cache import LLMCacheMiddleware
+from app.platform.utils.disk_cache import DiskCache
+from app.platform.utils.llm_cache import (
+    ChatModelCache,
+    LLMCacheMissError,
+    LLMResponseCache,
+    llm_cache_key,
+)
+
+pytestmark = pytest.mark.platform
+
+
+class Frame(BaseModel):
+    domain: str
+
+
+def test_key_ignores_message_ids_and_reads_the_dumps_form() -> None:
+    messages = [SystemMessage("Frame it."), HumanMessage("Reduce churn", id="run-1")]
+    key = llm_cache_key(model="gpt", system_prompt="Frame it.", messages=messages)
+
+    assert key == llm_cache_key(
+        model="gpt", system_prompt="Frame it.", messages=[SystemMessage("Frame it."), HumanMessage("Reduce churn")]
+    )
+    assert llm_cache_key(model="gpt", messages=messages) == llm_cache_key(
+        model="gpt", messages=json.loads(dumps(messages))
+    )
+    assert key != llm_cache_key(model="gpt", system_prompt="Frame it.", messages=messages, params={"temperature": 0})
+    assert key != llm_cache_key(model="gpt", system_prompt="Frame it.", messages=messages, response_schema="Frame")
+
+
+def test_replay_mode_raises_on_a_miss() -> None:
+    llm_cache = LLMResponseCache(DiskCache(":memory:"), mode="record")
+    assert llm_cache.lookup("k") is None
+    llm_cache.record("k", "recorded")
+
+    llm_cache.mode = "replay"
+
+    assert llm_cache.lookup("k") == "recorded"
+    with pytest.raises(LLMCacheMissError):
+        llm_cache.lookup("other")
+
+
+def test_chat_model_cache_replays_recorded_generations() -> None:
+    llm_cache = LLMResponseCache(DiskCache(":memory:", max_entries=10))
+    model = GenericFakeChatModel(
+        messages=cycle([AIMessage("first"), AIMessage("second")]), cache=ChatModelCache(llm_cache)
+    )
+
+    assert model.invoke([HumanMessage("Reduce churn", id="a")]).content == "first"
+    assert model.invoke([HumanMessage("Reduce churn", id="b")]).content == "first"
+    assert model.invoke([HumanMessage("Grow revenue")]).content == "second"
+    assert llm_cache.stats().entries == 2
+
+
+def test_middleware_records_then_replays_structured_responses() -> None:
+    llm_cache = LLMResponseCache(DiskCache(":memory:"))
+    middleware = LLMCacheMiddleware(llm_cache)
+    request = ModelRequest(
+        model=GenericFakeChatModel(messages=iter([])),
+        messages=[HumanMessage("Reduce churn")],
+        system_message=SystemMessage("Frame it."),
+        response_format=ToolStrategy(Frame),
+    )
+    calls: list[ModelRequest] = []
+
+    def handler(model_request: ModelRequest) -> ModelResponse:
+        calls.append(model_request)
+        return ModelResponse(result=[AIMessage("framed")], structured_response=Frame(domain="retail"))
+
+    first = middleware.wrap_model_call(request, handler)
+    second = middleware.wrap_model_call(request, handler)
+
+    assert len(calls) == 1
+    assert isinstance(first, ModelResponse) and isinstance(second, ModelResponse)
+    assert second.structured_response == Frame(domain="retail")
+    assert [message.content for message in second.result] == ["framed"]
+
+    llm_cache.mode = "replay"
+    with pytest.raises(LLMCacheMissError):
+        middleware.wrap_model_call(request.override(messages=[HumanMessage("Grow revenue")]), handler)
+
+
+def test_middleware_passes_through_calls_to_a_model_with_the_cache() -> None:
+    llm_cache = LLMResponseCache(DiskCache(":memory:"))
+    middleware = LLMCacheMiddleware(llm_cache)
+    request = ModelRequest(
+        model=GenericFakeChatModel(messages=iter([]), cache=ChatModelCache(llm_cache)),
+        messages=[HumanMessage("Reduce churn")],
+    )
+    calls: list[ModelRequest] = []
+
+    def handler(model_request: ModelRequest) -> ModelResponse:
+        calls.append(model_request)
+        return ModelResponse(result=[AIMessage("framed")])
+
+    middleware.wrap_model_call(request, handler)
+    middleware.wrap_model_call(request, handler)
+
+    assert len(calls) == 2
+    assert llm_cache.stats().entries == 0
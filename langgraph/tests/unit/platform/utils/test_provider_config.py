@@ -0,0 +1,83 @@
+"""Tests for the process-wide model client pool."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+
+from app.platform.config.file_loader import FileLoader
+from app.platform.utils import provider_config
+from app.platform.utils.provider_config import ModelClientPool, ProviderFactory, params_fingerprint
+
+pytestmark = pytest.mark.platform
+
+
+class FakeChatModel(BaseModel):
+    model: str
+    api_key: str
+    http_client: Any = None
+
+
+class FakeNoHttpModel(BaseModel):
+    model: str
+
+
+def test_params_fingerprint_ignores_key_order() -> None:
+    assert params_fingerprint({"model": "m", "temperature": 0.0}) == params_fingerprint(
+        {"temperature": 0.0, "model": "m"}
+    )
+    assert params_fingerprint({"model": "m"}) != params_fingerprint({"model": "n"})
+
+
+def test_pool_reuses_instances_and_shares_http_client() -> None:
+    pool = ModelClientPool()
+
+    first = pool.get("openai", FakeChatModel, {"model": "a", "api_key": "k"})
+    again = pool.get("openai", FakeChatModel, {"api_key": "k", "model": "a"})
+    other = pool.get("openai", FakeChatModel, {"model": "b", "api_key": "k"})
+
+    assert first is again
+    assert other is not first
+    assert other.http_client is first.http_client is not None
+    assert pool.get("anthropic", FakeNoHttpModel, {"model": "a"}).model == "a"
+    assert len(pool) == 3
+
+
+def test_evict_refreshes_one_provider_without_closing_clients_in_use() -> None:
+    pool = ModelClientPool()
+    first = pool.get("openai", FakeChatModel, {"model": "a", "api_key": "k"})
+    kept = pool.get("anthropic", FakeNoHttpModel, {"model": "a"})
+
+    pool.evict("openai")
+
+    assert not first.http_client.is_closed
+    refreshed = pool.get("openai", FakeChatModel, {"model": "a", "api_key": "k"})
+    assert refreshed is not first
+    assert refreshed.http_client is not first.http_client
+    assert pool.get("anthropic", FakeNoHttpModel, {"model": "a"}) is kept
+
+
+def test_for_agent_returns_pooled_instances(monkeypatch: pytest.MonkeyPatch) -> None:
+    pool = ModelClientPool()
+    monkeypatch.setattr(provider_config, "get_client_pool", lambda: pool)
+    monkeypatch.setenv("FAKE_PROVIDER_KEY", "k")
+    monkeypatch.setattr(FileLoader, "load_agent_config", lambda _agent_name: {"provider": "fake"})
+    monkeypatch.setattr(
+        FileLoader,
+        "load_provider_config",
+        lambda _provider: {
+            "module": __name__,
+            "class": "FakeChatModel",
+            "key_env": "FAKE_PROVIDER_KEY",
+            "defaults": {"model": "m"},
+        },
+    )
+
+    first, params = ProviderFactory.for_agent("ambiguity_scan")
+    second, _ = ProviderFactory.for_agent("problem_framing")
+
+    assert params == {"model": "m"}
+    assert first is second
+    assert len(pool) == 1